@@ -19,6 +19,13 @@
 #     3-Dec-2018 - jdw add options to load specific core collections.
 #    12-Dec-2018 - jdw add core_entity_monomer collection support
 #    13-Dec-2018 - jdw add I/HM schema support
+#    18-Oct-2026 - agent add option to detach oversized document content into overflow collections
+#    18-Oct-2026 - agent add options to export load stage metrics
+#    18-Oct-2026 - agent add option to load collections concurrently within each worker
+#    18-Oct-2026 - agent add pipelined writer options
+#    18-Oct-2026 - agent add options to load only entries changed since the last load
+#    18-Oct-2026 - agent add options for a binary cache of parsed containers
+#    18-Oct-2026 - agent add options to read ahead the input files of the following entries in each worker
 ##
 __docformat__ = "restructuredtext en"
 __author__ = "John Westbrook"
@@ -111,6 +118,18 @@ def main():
     parser.add_argument("--chunk_size", default=10, help="Number of files loaded per process")
     parser.add_argument("--file_limit", default=None, help="Load file limit for testing")
     parser.add_argument("--prune_document_size", default=None, help="Prune large documents to this size limit (MB)")
+    parser.add_argument("--overflow_document_size", default=None, help="Detach content from large documents into overflow collections to satisfy this size limit (MB)")
+    parser.add_argument("--metrics_file_path", default=None, help="Export load stage timing and volume metrics to this file path")
+    parser.add_argument("--metrics_format", default="json", help="Load metrics export format (json|prometheus default=json)")
+    parser.add_argument("--concurrent_collections", default=False, action="store_true", help="Load each collection on a separate writer thread within each process")
+    parser.add_argument("--pipeline_queue_size", default=None, help="Overlap document generation and background writes limiting queued documents to this size (MB)")
+    parser.add_argument("--pipeline_batch_size", default=2, help="Number of entries transformed in each pipelined batch (default=2)")
+    parser.add_argument("--changed_entries_only", default=False, action="store_true", help="Load only entries changed since the last load and purge removed entries (pdbx, pdbx_core)")
+    parser.add_argument("--compare_digest", default=False, action="store_true", help="Compare file content digests for entry files with changed modification times")
+    parser.add_argument("--container_cache_path", default=None, help="Directory path of a binary cache of parsed containers shared across runs")
+    parser.add_argument("--container_cache_size", default=None, help="Approximate size limit of the container cache (MB)")
+    parser.add_argument("--prefetch_count", default=0, help="Number of entries whose input files are read ahead on a background thread in each worker")
+    parser.add_argument("--prefetch_size", default=64, help="Approximate size limit of the input files read ahead in each worker (MB)")
     parser.add_argument("--debug", default=False, action="store_true", help="Turn on verbose logging")
     parser.add_argument("--mock", default=False, action="store_true", help="Use MOCK repository configuration for testing")
     parser.add_argument("--cache_path", default=None, help="Cache path for resource files")
@@ -166,6 +185,18 @@ def main():
         loadType = "replace" if args.replace else "full"
         saveInputFileListPath = args.save_file_list_path
         pruneDocumentSize = float(args.prune_document_size) if args.prune_document_size else None
+        overflowDocumentSize = float(args.overflow_document_size) if args.overflow_document_size else None
+        metricsFilePath = args.metrics_file_path
+        metricsFormat = args.metrics_format if args.metrics_format in ["json", "prometheus"] else "json"
+        concurrentCollections = args.concurrent_collections
+        pipelineQueueSizeMB = float(args.pipeline_queue_size) if args.pipeline_queue_size else None
+        pipelineBatchSize = int(args.pipeline_batch_size)
+        changedEntriesOnly = args.changed_entries_only
+        compareDigest = args.compare_digest
+        containerCachePath = args.container_cache_path
+        containerCacheSizeMB = float(args.container_cache_size) if args.container_cache_size else None
+        prefetchCount = int(args.prefetch_count) if args.prefetch_count else 0
+        prefetchSizeMB = float(args.prefetch_size) if args.prefetch_size else 64
         cachePath = args.cache_path if args.cache_path else "."
         cachePath = os.path.abspath(cachePath)
         rebuildCache = args.rebuild_cache if args.rebuild_cache else False
@@ -210,6 +241,10 @@ def main():
             verbose=debugFlag,
             readBackCheck=readBackCheck,
             rebuildSchemaFlag=rebuildSchemaFlag,
+            containerCachePath=containerCachePath,
+            containerCacheSizeMB=containerCacheSizeMB,
+            prefetchCount=prefetchCount,
+            prefetchSizeMB=prefetchSizeMB,
         )
 
         if args.load_chem_comp_ref:
@@ -222,6 +257,12 @@ def main():
                 failedFilePath=failedFilePath,
                 saveInputFileListPath=saveInputFileListPath,
                 pruneDocumentSize=pruneDocumentSize,
+                overflowDocumentSize=overflowDocumentSize,
+                metricsFilePath=metricsFilePath,
+                metricsFormat=metricsFormat,
+                concurrentCollections=concurrentCollections,
+                pipelineQueueSizeMB=pipelineQueueSizeMB,
+                pipelineBatchSize=pipelineBatchSize,
                 validationLevel=schemaLevel,
             )
             okS = loadStatus(mw.getLoadStatus(), cfgOb, cachePath, readBackCheck=readBackCheck)
@@ -236,6 +277,12 @@ def main():
                 failedFilePath=failedFilePath,
                 saveInputFileListPath=saveInputFileListPath,
                 pruneDocumentSize=pruneDocumentSize,
+                overflowDocumentSize=overflowDocumentSize,
+                metricsFilePath=metricsFilePath,
+                metricsFormat=metricsFormat,
+                concurrentCollections=concurrentCollections,
+                pipelineQueueSizeMB=pipelineQueueSizeMB,
+                pipelineBatchSize=pipelineBatchSize,
                 validationLevel=schemaLevel,
             )
             okS = loadStatus(mw.getLoadStatus(), cfgOb, cachePath, readBackCheck=readBackCheck)
@@ -250,6 +297,12 @@ def main():
                 failedFilePath=failedFilePath,
                 saveInputFileListPath=saveInputFileListPath,
                 pruneDocumentSize=pruneDocumentSize,
+                overflowDocumentSize=overflowDocumentSize,
+                metricsFilePath=metricsFilePath,
+                metricsFormat=metricsFormat,
+                concurrentCollections=concurrentCollections,
+                pipelineQueueSizeMB=pipelineQueueSizeMB,
+                pipelineBatchSize=pipelineBatchSize,
                 validationLevel=schemaLevel,
             )
             okS = loadStatus(mw.getLoadStatus(), cfgOb, cachePath, readBackCheck=readBackCheck)
@@ -264,6 +317,12 @@ def main():
                 failedFilePath=failedFilePath,
                 saveInputFileListPath=saveInputFileListPath,
                 pruneDocumentSize=pruneDocumentSize,
+                overflowDocumentSize=overflowDocumentSize,
+                metricsFilePath=metricsFilePath,
+                metricsFormat=metricsFormat,
+                concurrentCollections=concurrentCollections,
+                pipelineQueueSizeMB=pipelineQueueSizeMB,
+                pipelineBatchSize=pipelineBatchSize,
                 validationLevel=schemaLevel,
             )
             okS = loadStatus(mw.getLoadStatus(), cfgOb, cachePath, readBackCheck=readBackCheck)
@@ -278,6 +337,12 @@ def main():
                 failedFilePath=failedFilePath,
                 saveInputFileListPath=saveInputFileListPath,
                 pruneDocumentSize=pruneDocumentSize,
+                overflowDocumentSize=overflowDocumentSize,
+                metricsFilePath=metricsFilePath,
+                metricsFormat=metricsFormat,
+                concurrentCollections=concurrentCollections,
+                pipelineQueueSizeMB=pipelineQueueSizeMB,
+                pipelineBatchSize=pipelineBatchSize,
                 validationLevel=schemaLevel,
             )
             okS = loadStatus(mw.getLoadStatus(), cfgOb, cachePath, readBackCheck=readBackCheck)
@@ -292,6 +357,12 @@ def main():
                 failedFilePath=failedFilePath,
                 saveInputFileListPath=saveInputFileListPath,
                 pruneDocumentSize=pruneDocumentSize,
+                overflowDocumentSize=overflowDocumentSize,
+                metricsFilePath=metricsFilePath,
+                metricsFormat=metricsFormat,
+                concurrentCollections=concurrentCollections,
+                pipelineQueueSizeMB=pipelineQueueSizeMB,
+                pipelineBatchSize=pipelineBatchSize,
                 validationLevel=schemaLevel,
             )
             okS = loadStatus(mw.getLoadStatus(), cfgOb, cachePath, readBackCheck=readBackCheck)
@@ -306,6 +377,14 @@ def main():
                 failedFilePath=failedFilePath,
                 saveInputFileListPath=saveInputFileListPath,
                 pruneDocumentSize=pruneDocumentSize,
+                overflowDocumentSize=overflowDocumentSize,
+                metricsFilePath=metricsFilePath,
+                metricsFormat=metricsFormat,
+                concurrentCollections=concurrentCollections,
+                pipelineQueueSizeMB=pipelineQueueSizeMB,
+                pipelineBatchSize=pipelineBatchSize,
+                changedEntriesOnly=changedEntriesOnly,
+                compareDigest=compareDigest,
                 validationLevel=schemaLevel,
             )
             okS = loadStatus(mw.getLoadStatus(), cfgOb, cachePath, readBackCheck=readBackCheck)
@@ -320,6 +399,14 @@ def main():
                 failedFilePath=failedFilePath,
                 saveInputFileListPath=saveInputFileListPath,
                 pruneDocumentSize=pruneDocumentSize,
+                overflowDocumentSize=overflowDocumentSize,
+                metricsFilePath=metricsFilePath,
+                metricsFormat=metricsFormat,
+                concurrentCollections=concurrentCollections,
+                pipelineQueueSizeMB=pipelineQueueSizeMB,
+                pipelineBatchSize=pipelineBatchSize,
+                changedEntriesOnly=changedEntriesOnly,
+                compareDigest=compareDigest,
                 validationLevel=schemaLevel,
             )
             okS = loadStatus(mw.getLoadStatus(), cfgOb, cachePath, readBackCheck=readBackCheck)
@@ -334,6 +421,14 @@ def main():
                 failedFilePath=failedFilePath,
                 saveInputFileListPath=saveInputFileListPath,
                 pruneDocumentSize=pruneDocumentSize,
+                overflowDocumentSize=overflowDocumentSize,
+                metricsFilePath=metricsFilePath,
+                metricsFormat=metricsFormat,
+                concurrentCollections=concurrentCollections,
+                pipelineQueueSizeMB=pipelineQueueSizeMB,
+                pipelineBatchSize=pipelineBatchSize,
+                changedEntriesOnly=changedEntriesOnly,
+                compareDigest=compareDigest,
                 validationLevel=schemaLevel,
                 mergeContentTypes=["vrpt"],
             )
@@ -350,6 +445,14 @@ def main():
                 failedFilePath=failedFilePath,
                 saveInputFileListPath=saveInputFileListPath,
                 pruneDocumentSize=pruneDocumentSize,
+                overflowDocumentSize=overflowDocumentSize,
+                metricsFilePath=metricsFilePath,
+                metricsFormat=metricsFormat,
+                concurrentCollections=concurrentCollections,
+                pipelineQueueSizeMB=pipelineQueueSizeMB,
+                pipelineBatchSize=pipelineBatchSize,
+                changedEntriesOnly=changedEntriesOnly,
+                compareDigest=compareDigest,
                 validationLevel=schemaLevel,
             )
             okS = loadStatus(mw.getLoadStatus(), cfgOb, cachePath, readBackCheck=readBackCheck)
@@ -365,6 +468,14 @@ def main():
                 failedFilePath=failedFilePath,
                 saveInputFileListPath=saveInputFileListPath,
                 pruneDocumentSize=pruneDocumentSize,
+                overflowDocumentSize=overflowDocumentSize,
+                metricsFilePath=metricsFilePath,
+                metricsFormat=metricsFormat,
+                concurrentCollections=concurrentCollections,
+                pipelineQueueSizeMB=pipelineQueueSizeMB,
+                pipelineBatchSize=pipelineBatchSize,
+                changedEntriesOnly=changedEntriesOnly,
+                compareDigest=compareDigest,
                 validationLevel=schemaLevel,
             )
             okS = loadStatus(mw.getLoadStatus(), cfgOb, cachePath, readBackCheck=readBackCheck)
@@ -380,6 +491,14 @@ def main():
                 failedFilePath=failedFilePath,
                 saveInputFileListPath=saveInputFileListPath,
                 pruneDocumentSize=pruneDocumentSize,
+                overflowDocumentSize=overflowDocumentSize,
+                metricsFilePath=metricsFilePath,
+                metricsFormat=metricsFormat,
+                concurrentCollections=concurrentCollections,
+                pipelineQueueSizeMB=pipelineQueueSizeMB,
+                pipelineBatchSize=pipelineBatchSize,
+                changedEntriesOnly=changedEntriesOnly,
+                compareDigest=compareDigest,
                 validationLevel=schemaLevel,
             )
             okS = loadStatus(mw.getLoadStatus(), cfgOb, cachePath, readBackCheck=readBackCheck)
@@ -395,6 +514,14 @@ def main():
                 failedFilePath=failedFilePath,
                 saveInputFileListPath=saveInputFileListPath,
                 pruneDocumentSize=pruneDocumentSize,
+                overflowDocumentSize=overflowDocumentSize,
+                metricsFilePath=metricsFilePath,
+                metricsFormat=metricsFormat,
+                concurrentCollections=concurrentCollections,
+                pipelineQueueSizeMB=pipelineQueueSizeMB,
+                pipelineBatchSize=pipelineBatchSize,
+                changedEntriesOnly=changedEntriesOnly,
+                compareDigest=compareDigest,
                 validationLevel=schemaLevel,
             )
             okS = loadStatus(mw.getLoadStatus(), cfgOb, cachePath, readBackCheck=readBackCheck)
@@ -409,6 +536,12 @@ def main():
                 failedFilePath=failedFilePath,
                 saveInputFileListPath=saveInputFileListPath,
                 pruneDocumentSize=pruneDocumentSize,
+                overflowDocumentSize=overflowDocumentSize,
+                metricsFilePath=metricsFilePath,
+                metricsFormat=metricsFormat,
+                concurrentCollections=concurrentCollections,
+                pipelineQueueSizeMB=pipelineQueueSizeMB,
+                pipelineBatchSize=pipelineBatchSize,
                 validationLevel=schemaLevel,
             )
             okS = loadStatus(mw.getLoadStatus(), cfgOb, cachePath, readBackCheck=readBackCheck)
@@ -8,6 +8,7 @@
 # 28-Jun-2018 jdw update ScanRepoUtil prototype with workPath
 #  3-Jul-2018 jdw update to latest ScanRepoUtil() prototype
 # 20-Aug-2018 jdw engage incremental repository scan mode.
+# 18-Oct-2026 agent add options for a binary cache of parsed containers
 ##
 __docformat__ = "restructuredtext en"
 __author__ = "John Westbrook"
@@ -46,6 +47,8 @@ def scanRepo(
     dataTypeFilePath=None,
     failedFilePath=None,
     cachePath=None,
+    containerCachePath=None,
+    containerCacheSizeMB=None,
 ):
     """ Utility method to scan the data repository of the input content type and store type and coverage details.
     """
@@ -65,7 +68,16 @@ def scanRepo(
             attributeDataTypeD[catName] = aD
         ###
         #
-        sr = ScanRepoUtil(cfgOb, attributeDataTypeD=attributeDataTypeD, numProc=numProc, chunkSize=chunkSize, fileLimit=fileLimit, workPath=cachePath)
+        sr = ScanRepoUtil(
+            cfgOb,
+            attributeDataTypeD=attributeDataTypeD,
+            numProc=numProc,
+            chunkSize=chunkSize,
+            fileLimit=fileLimit,
+            workPath=cachePath,
+            containerCachePath=containerCachePath,
+            containerCacheSizeMB=containerCacheSizeMB,
+        )
         ok = sr.scanContentType(
             contentType, scanType=scanType, inputPathList=inputPathList, scanDataFilePath=scanDataFilePath, failedFilePath=failedFilePath, saveInputFileListPath=pathListFilePath
         )
@@ -111,6 +123,8 @@ def main():
     parser.add_argument("--debug", default=False, action="store_true", help="Turn on verbose logging")
     parser.add_argument("--mock", default=False, action="store_true", help="Use MOCK repository configuration for testing")
     parser.add_argument("--cache_path", default=None, help="Cache path and working direcory for temporary files")
+    parser.add_argument("--container_cache_path", default=None, help="Directory path of a binary cache of parsed containers shared across runs")
+    parser.add_argument("--container_cache_size", default=None, help="Approximate size limit of the container cache (MB)")
     args = parser.parse_args()
     #
     debugFlag = args.debug
@@ -153,6 +167,8 @@ def main():
         dataCoverageFilePath = args.coverage_file_path
         dataTypeFilePath = args.type_map_file_path
         cachePath = args.cache_path if args.cache_path else "."
+        containerCachePath = args.container_cache_path
+        containerCacheSizeMB = float(args.container_cache_size) if args.container_cache_size else None
     except Exception as e:
         logger.exception("Argument processing problem %s", str(e))
         parser.print_help(sys.stderr)
@@ -206,6 +222,8 @@ def main():
         dataTypeFilePath=dataTypeFilePath,
         failedFilePath=failedFilePath,
         cachePath=cachePath,
+        containerCachePath=containerCachePath,
+        containerCacheSizeMB=containerCacheSizeMB,
     )
 
     logger.info("Operation completed with status %r", ok)
@@ -17,6 +17,7 @@
 #       11-Mar-2019 jdw  add getSubCategories(), getAttributeSubCategories(), getSubCategoryAggregates(),
 #                        getSubCategoryAggregatesUnitCardinality(), getSubCategorySchemaIdList(),
 #                        getSubCategoryAttributeIdList()
+#       18-Oct-2026 agent  precompute immutable enumeration normalization maps on construction or unpickling
 ##
 """
 Schema defintion accessors.
@@ -30,6 +31,7 @@ __license__ = "Apache 2.0"
 
 import logging
 from operator import itemgetter
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
@@ -59,9 +61,20 @@ class SchemaDefAccess(object):
         self.__sliceParentFilterD = schemaDef["SLICE_PARENT_FILTERS"]
         self.__sliceIndexD, self.__sliceExtraD = self.__makeSliceIndex()
         self.__nameIndex = self.__makeNameIndex()
+        self.__enumNormD = self.__makeEnumNormalizationIndex()
         self.__kwargs = kwargs
         #
 
+    def __getstate__(self):
+        stateD = self.__dict__.copy()
+        # mapping proxies are not picklable - the enumeration index is rebuilt on unpickling
+        stateD.pop("_SchemaDefAccess__enumNormD", None)
+        return stateD
+
+    def __setstate__(self, stateD):
+        self.__dict__.update(stateD)
+        self.__enumNormD = self.__makeEnumNormalizationIndex()
+
     def getName(self):
         return self.__name
 
@@ -292,7 +305,7 @@ class SchemaDefAccess(object):
         return schemaId in self.__schemaDefDict
 
     def getSchemaObject(self, schemaId):
-        return SchemaDef(schemaDefDict=self.__schemaDefDict[schemaId])
+        return SchemaDef(schemaDefDict=self.__schemaDefDict[schemaId], enumNormalizationD=self.__enumNormD.get(schemaId))
 
     def getSchemaName(self, schemaId):
         try:
@@ -434,15 +447,48 @@ class SchemaDefAccess(object):
             nameIndexD[schemaName] = {"SCHEMA_ID": schemaId, "ATTRIBUTES": atD}
         return nameIndexD
 
+    def __makeEnumNormalizationIndex(self):
+        """ Return the enumeration normalization maps for each schema object -
+
+        Returns:
+            dict : {<schemaId> : {<attributeId>: {<lower case enumeration>: <enumeration>, ...}, ... }}
+
+        """
+        return {schemaId: makeEnumNormalizationMaps(sD) for schemaId, sD in self.__schemaDefDict.items()}
+
+
+def makeEnumNormalizationMaps(schemaDefDict):
+    """ Return read-only case folding maps {<attributeId>: {<lower case enumeration>: <enumeration>, ...}} for the
+        enumerated attributes in the input table schema definition.
+    """
+    eD = {}
+    try:
+        for atId, atD in schemaDefDict["ATTRIBUTE_INFO"].items():
+            if "ENUMERATION" in atD and atD["ENUMERATION"]:
+                eD[atId] = MappingProxyType({str(ky).lower(): ky for ky in atD["ENUMERATION"]})
+    except Exception as e:
+        logger.debug("Failing for %r with %s", schemaDefDict.get("SCHEMA_NAME", None) if schemaDefDict else None, str(e))
+    return eD
+
 
 class SchemaDef(object):
 
     """  Wrapper class for table schema definition.
     """
 
-    def __init__(self, schemaDefDict=None):
+    def __init__(self, schemaDefDict=None, enumNormalizationD=None):
         self.__tD = schemaDefDict if schemaDefDict else {}
-        self.__nomalizedEnumD = {}
+        self.__normalizedEnumD = enumNormalizationD if enumNormalizationD is not None else makeEnumNormalizationMaps(self.__tD)
+
+    def __getstate__(self):
+        stateD = self.__dict__.copy()
+        # mapping proxies are not picklable - the enumeration maps are rebuilt on unpickling
+        stateD.pop("_SchemaDef__normalizedEnumD", None)
+        return stateD
+
+    def __setstate__(self, stateD):
+        self.__dict__.update(stateD)
+        self.__normalizedEnumD = makeEnumNormalizationMaps(self.__tD)
 
     def getName(self):
         try:
@@ -574,13 +620,13 @@ class SchemaDef(object):
             return []
 
     def normalizeEnum(self, attributeId, enum):
-        try:
-            if self.__tD["ATTRIBUTE_INFO"][attributeId]["ENUMERATION"] and attributeId not in self.__nomalizedEnumD:
-                self.__nomalizedEnumD[attributeId] = {str(ky).lower(): ky for ky in self.__tD["ATTRIBUTE_INFO"][attributeId]["ENUMERATION"]}
-            return self.__nomalizedEnumD[attributeId][str(enum).lower()]
-        except Exception as e:
-            logger.debug("Failing for %s  %s and %r - %r with %r", self.__tD["SCHEMA_NAME"], attributeId, enum, self.__nomalizedEnumD, str(e))
-        return enum
+        eD = self.__normalizedEnumD.get(attributeId)
+        return eD.get(str(enum).lower(), enum) if eD else enum
+
+    def getEnumNormalizationMap(self, attributeId):
+        """ Return the read-only map {<lower case enumeration>: <enumeration>} for the input attribute or None.
+        """
+        return self.__normalizedEnumD.get(attributeId)
 
     def isEnumerated(self, attributeId):
         try:
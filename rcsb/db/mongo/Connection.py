@@ -7,6 +7,7 @@
 #  23-Oct-2018 jdw add section name config access methods and make this a constructor argument
 #   5-Dec-2018 jdw pass on exceptions from the context manager __exit__() method
 #   3-Sep-2019 jdw make all user/pw combinations secure - always use default config section
+#  18-Oct-2026 agent add configurable server type (e.g. MONGO_DB_SERVER: memory for the in-memory document store)
 ##
 """
 Derived class for managing database connection which handles application specific authentication.
@@ -62,6 +63,7 @@ class Connection(ConnectionBase):
             infoD["DB_READ_CONCERN"] = self.__cfgOb.get("EXCHANGE_DB_READ_CONCERN", default="majority", sectionName=sectionName)
             infoD["DB_READ_PREFERENCE"] = self.__cfgOb.get("EXCHANGE_DB_READ_PREFERENCE", default="nearest", sectionName=sectionName)
             infoD["DB_WRITE_TO_JOURNAL"] = self.__cfgOb.get("EXCHANGE_DB_WRITE_TO_JOURNAL", default=True, sectionName=sectionName)
+            infoD["DB_SERVER"] = self.__cfgOb.get("EXCHANGE_DB_SERVER", default=dbServer, sectionName=sectionName)
         elif resourceName == "MONGO_DB":
             infoD["DB_NAME"] = self.__cfgOb.get("MONGO_DB_NAME", sectionName=sectionName)
             infoD["DB_HOST"] = self.__cfgOb.get("MONGO_DB_HOST", default=defaultHost, sectionName=sectionName)
@@ -74,6 +76,7 @@ class Connection(ConnectionBase):
             infoD["DB_READ_CONCERN"] = self.__cfgOb.get("MONGO_DB_READ_CONCERN", default="majority", sectionName=sectionName)
             infoD["DB_READ_PREFERENCE"] = self.__cfgOb.get("MONGO_DB_READ_PREFERENCE", default="nearest", sectionName=sectionName)
             infoD["DB_WRITE_TO_JOURNAL"] = self.__cfgOb.get("MONGO_DB_WRITE_TO_JOURNAL", default=True, sectionName=sectionName)
+            infoD["DB_SERVER"] = self.__cfgOb.get("MONGO_DB_SERVER", default=dbServer, sectionName=sectionName)
         else:
             infoD["DB_NAME"] = self.__cfgOb.get("DB_NAME", sectionName=sectionName)
             infoD["DB_HOST"] = self.__cfgOb.get("DB_HOST", default=defaultHost, sectionName=sectionName)
@@ -86,8 +89,8 @@ class Connection(ConnectionBase):
             infoD["DB_READ_CONCERN"] = self.__cfgOb.get("DB_READ_CONCERN", default="majority", sectionName=sectionName)
             infoD["DB_READ_PREFERENCE"] = self.__cfgOb.get("DB_READ_PREFERENCE", default="nearest", sectionName=sectionName)
             infoD["DB_WRITE_TO_JOURNAL"] = self.__cfgOb.get("DB_WRITE_TO_JOURNAL", default=True, sectionName=sectionName)
+            infoD["DB_SERVER"] = self.__cfgOb.get("DB_SERVER", default=dbServer, sectionName=sectionName)
         #
-        infoD["DB_SERVER"] = dbServer
         self.setPreferences(infoD)
         #
         return copy.deepcopy(infoD)
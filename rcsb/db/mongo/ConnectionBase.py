@@ -4,6 +4,7 @@
 #
 # Update:
 #    17-Mar-2018 jdw  add r/w sync controls - generalize auth to prefs
+#    18-Oct-2026 agent  add in-memory document store backend (DB_SERVER = "memory")
 ##
 """
 Base class for managing database connection which handles application specific authentication.
@@ -22,6 +23,8 @@ import platform
 from pymongo import MongoClient
 from pymongo.errors import ConnectionFailure
 
+from rcsb.db.mongo.MemoryDbClient import MemoryDbClient
+
 try:
     # Python 3.x
     from urllib.parse import quote_plus
@@ -106,6 +109,11 @@ class ConnectionBase(object):
             logger.warning("Closing an existing open connection.")
             self.closeConnection()
 
+        if self.__dbServer == "memory":
+            # In-memory document store shared by name (DB_HOST) with any forked worker processes
+            self.__dbClient = MemoryDbClient(storeName=self.__dbHost)
+            return True
+        #
         try:
             if self.__dbUser and self.__dbPw:
                 uri = "mongodb://%s:%s@%s/%s" % (quote_plus(self.__dbUser), quote_plus(self.__dbPw), self.__dbHost, self.__dbAdminDb)
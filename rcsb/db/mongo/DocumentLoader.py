@@ -7,6 +7,7 @@
 # Updates:
 #  13-July-2018 jdw add append mode
 #  14-Aug-2018  jdw generalize key identifiers to lists
+#  18-Oct-2026  agent add per-stage load metrics collected in each worker and exported as JSON or Prometheus text
 ##
 """
 Worker methods for loading document sets into MongoDb.
@@ -22,8 +23,11 @@ __license__ = "Apache 2.0"
 import logging
 import time
 
+import bson
+
 from rcsb.db.mongo.Connection import Connection
 from rcsb.db.mongo.MongoDbUtil import MongoDbUtil
+from rcsb.db.utils.LoadMetrics import LoadMetrics
 from rcsb.db.utils.SchemaProvider import SchemaProvider
 from rcsb.utils.multiproc.MultiProcUtil import MultiProcUtil
 
@@ -52,18 +56,33 @@ class DocumentLoader(object):
         #
         self.__readBackCheck = readBackCheck
         self.__mpFormat = "[%(levelname)s] %(asctime)s %(processName)s-%(module)s.%(funcName)s: %(message)s"
-        #
+        self.__loadMetrics = LoadMetrics()
         #
 
-    def load(self, databaseName, collectionName, loadType="full", documentList=None, indexAttributeList=None, keyNames=None, schemaLevel="full", addValues=None):
+    def load(
+        self,
+        databaseName,
+        collectionName,
+        loadType="full",
+        documentList=None,
+        indexAttributeList=None,
+        keyNames=None,
+        schemaLevel="full",
+        addValues=None,
+        metricsFilePath=None,
+        metricsFormat="json",
+    ):
         """  Driver method for loading MongoDb content -
 
 
             loadType:     "full" or "replace"
+            metricsFilePath:  export per-stage load timing and volume metrics to this file path
+            metricsFormat:    metrics export format "json" or "prometheus" (node exporter text file)
 
         """
         try:
             startTime = self.__begin(message="loading operation")
+            self.__loadMetrics = LoadMetrics()
             #
 
             #
@@ -73,6 +92,7 @@ class DocumentLoader(object):
             optionsD["readBackCheck"] = self.__readBackCheck
             optionsD["loadType"] = loadType
             optionsD["keyNames"] = keyNames
+            optionsD["collectMetrics"] = metricsFilePath is not None
             # ---------------- - ---------------- - ---------------- - ---------------- - ---------------- -
             #
             docList = documentList[: self.__documentLimit] if self.__documentLimit else documentList
@@ -95,6 +115,7 @@ class DocumentLoader(object):
                 bsonSchema = self.__schP.getJsonSchema(databaseName, collectionName, encodingType="BSON", level=schemaLevel)
                 logger.debug("Using schema validation for %r %r %r", databaseName, collectionName, schemaLevel)
 
+            setupStartTime = time.time()
             if loadType == "full":
                 self.__removeCollection(databaseName, collectionName)
                 ok = self.__createCollection(databaseName, collectionName, indAtList, bsonSchema=bsonSchema)
@@ -103,7 +124,8 @@ class DocumentLoader(object):
                 # create only if object does not exist -
                 ok = self.__createCollection(databaseName, collectionName, indexAttributeNames=indAtList, checkExists=True, bsonSchema=bsonSchema)
                 logger.debug("Collection %s create status %r", collectionName, ok)
-                # ---------------- - ---------------- - ---------------- - ---------------- - ---------------- -
+            self.__loadMetrics.addTime("setup", time.time() - setupStartTime)
+            # ---------------- - ---------------- - ---------------- - ---------------- - ---------------- -
             numDocs = len(docList)
             logger.debug("Processing %d total documents", numDocs)
             numProc = min(numProc, numDocs)
@@ -124,14 +146,20 @@ class DocumentLoader(object):
                 mpu = MultiProcUtil(verbose=True)
                 mpu.setOptions(optionsD=optionsD)
                 mpu.set(workerObj=self, workerMethod="loadWorker")
-                ok, failListT, _, _ = mpu.runMulti(dataList=subList, numProc=numProc, numResults=1, chunkSize=chunkSize)
+                ok, failListT, retListsT, _ = mpu.runMulti(dataList=subList, numProc=numProc, numResults=1, chunkSize=chunkSize)
                 failList.extend(failListT)
+                for metricsD in retListsT[0]:
+                    self.__loadMetrics.merge(metricsD)
             logger.debug("Completed load with failing document list %r", failList)
             logger.debug("Document list length %d failed load list length %d", len(docList), len(failList))
             #
 
             self.__end(startTime, "loading operation with status " + str(ok))
-
+            #
+            if metricsFilePath:
+                labelD = {"database": databaseName, "load_type": loadType, "collections": collectionName}
+                mOk = self.__loadMetrics.write(metricsFilePath, fmt=metricsFormat, labelD=labelD, elapsedSeconds=time.time() - startTime)
+                logger.info("Writing load metrics %s (%s) status %r", metricsFilePath, metricsFormat, mOk)
             #
             return ok
         except Exception as e:
@@ -139,6 +167,10 @@ class DocumentLoader(object):
 
         return False
 
+    def getLoadMetrics(self):
+        """Return the merged per-stage timing and volume metrics for the last load operation."""
+        return self.__loadMetrics.getMetrics()
+
     def loadWorker(self, dataList, procName, optionsD, workingDir):
         """ Multi-proc worker method for MongoDb document loading -
         """
@@ -150,11 +182,19 @@ class DocumentLoader(object):
             collectionName = optionsD["collectionName"]
             databaseName = optionsD["databaseName"]
             keyNames = optionsD["keyNames"]
+            collectMetrics = optionsD.get("collectMetrics", False)
+            metrics = LoadMetrics()
             #
             logger.debug("%s databaseName %s collectionName %s workingDir %s", procName, databaseName, collectionName, workingDir)
             #
             if dataList:
-                ok, successList, failedList = self.__loadDocuments(databaseName, collectionName, dataList, loadType=loadType, readBackCheck=readBackCheck, keyNames=keyNames)
+                metrics.addCount("documents", len(dataList))
+                if collectMetrics:
+                    metrics.addCount("document_bytes", sum([len(bson.BSON.encode(dD)) for dD in dataList]))
+                ok, successList, failedList = self.__loadDocuments(
+                    databaseName, collectionName, dataList, loadType=loadType, readBackCheck=readBackCheck, keyNames=keyNames, metrics=metrics
+                )
+                metrics.addCount("failed_documents", len(failedList))
             #
             logger.debug(
                 "%s database %s collection %s inputList length %d successList length %d  failed %d",
@@ -168,7 +208,7 @@ class DocumentLoader(object):
             #
 
             self.__end(startTime, procName + " with status " + str(ok))
-            return successList, [], []
+            return successList, [metrics.getMetrics()], []
 
         except Exception as e:
             logger.exception("Failing with %s", str(e))
@@ -235,10 +275,11 @@ class DocumentLoader(object):
             logger.exception("Failing with %s", str(e))
         return False
 
-    def __loadDocuments(self, dbName, collectionName, docList, loadType="full", readBackCheck=False, keyNames=None):
+    def __loadDocuments(self, dbName, collectionName, docList, loadType="full", readBackCheck=False, keyNames=None, metrics=None):
         #
         # Load database/collection with input document list -
         #
+        metrics = metrics if metrics else LoadMetrics()
         failList = []
         rIdL = []
         successList = []
@@ -259,10 +300,12 @@ class DocumentLoader(object):
                 mg = MongoDbUtil(client)
                 #
                 if loadType == "replace" and keyNames:
-                    dTupL = mg.deleteList(dbName, collectionName, docList, keyNames)
+                    with metrics.timer("purge"):
+                        dTupL = mg.deleteList(dbName, collectionName, docList, keyNames)
                     logger.debug("Deleted document status %r", (dTupL,))
                 #
-                rIdL = mg.insertList(dbName, collectionName, docList, keyNames=keyNames)
+                with metrics.timer("insert"):
+                    rIdL = mg.insertList(dbName, collectionName, docList, keyNames=keyNames)
                 logger.debug("Insert returns rIdL length %r", len(rIdL))
 
                 # ---
@@ -287,6 +330,7 @@ class DocumentLoader(object):
                 #
                 rbStatus = True
                 if readBackCheck and keyNames:
+                    readBackStartTime = time.time()
                     #
                     # Note that objects in docList are mutated by the insert operation with the additional key '_id',
                     # hence, it is possible to compare the fetched object with the input object.
@@ -298,6 +342,7 @@ class DocumentLoader(object):
                         if rObj != docList[jj]:
                             rbStatus = False
                             break
+                    metrics.addTime("readback", time.time() - readBackStartTime)
                 #
                 if readBackCheck and not rbStatus:
                     return False, successList, failList
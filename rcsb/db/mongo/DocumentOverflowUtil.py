@@ -0,0 +1,222 @@
+##
+# File:    DocumentOverflowUtil.py
+# Author:  agent
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#
+##
+"""
+Utilities to detach oversized sub-objects from documents into a side (overflow) collection and to restore them.
+
+Documents exceeding the size limit have their largest top-level sub-objects moved into documents stored in
+the collection <collectionName>_overflow keyed by the parent document _id.  Each detached sub-object is
+recorded in the parent document as a reference stub in the private attribute '_overflow'.  List and dictionary
+valued sub-objects larger than the size limit are split into ordered parts.  Documents which cannot be brought
+within the size limit are rejected.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "agent"
+__email__ = "agent@local"
+__license__ = "Apache 2.0"
+
+import copy
+import logging
+import operator
+
+import bson
+from bson.objectid import ObjectId
+
+logger = logging.getLogger(__name__)
+
+
+class DocumentOverflowUtil(object):
+    def __init__(self, limitMB=15.9, keyNames=None, overflowSuffix="_overflow", stubKey="_overflow"):
+        """Detach and restore oversized document sub-objects.
+
+        Args:
+            limitMB (float, optional): document size limit (MB)
+            keyNames (list, optional): document key attribute names (dot notation) copied into each overflow document
+            overflowSuffix (str, optional): suffix appended to the parent collection name to form the overflow collection name
+            stubKey (str, optional): parent document attribute holding the list of overflow reference stubs
+        """
+        self.__limitBytes = int(float(limitMB) * 1048576)
+        self.__keyNames = keyNames if keyNames else []
+        self.__overflowSuffix = overflowSuffix
+        self.__stubKey = stubKey
+        # top-level document keys which must be retained in the parent document
+        self.__keepKeyS = {"_id", self.__stubKey} | {keyName.split(".")[0] for keyName in self.__keyNames}
+
+    def getOverflowCollectionName(self, collectionName):
+        return collectionName + self.__overflowSuffix
+
+    def getStubKey(self):
+        return self.__stubKey
+
+    def addOverflowSchema(self, schemaD, encodingType="BSON"):
+        """Return a copy of the input collection schema including the definition of the overflow reference stub attribute."""
+        if not schemaD or "properties" not in schemaD:
+            return schemaD
+        typeKey = "bsonType" if encodingType.upper() == "BSON" else "type"
+        intType = "int" if encodingType.upper() == "BSON" else "integer"
+        rD = copy.deepcopy(schemaD)
+        rD["properties"][self.__stubKey] = {
+            typeKey: "array",
+            "items": {
+                typeKey: "object",
+                "properties": {"key": {typeKey: "string"}, "part_count": {typeKey: intType}},
+                "required": ["key", "part_count"],
+                "additionalProperties": False,
+            },
+            "minItems": 1,
+        }
+        return rD
+
+    def detach(self, dList):
+        """Detach oversized top-level sub-objects from documents in the input list.
+
+        Documents which still exceed the size limit after detaching sub-objects (e.g. retained key attributes or
+        single list items larger than the limit) are rejected.
+
+        Args:
+            dList (list): document list (documents within the size limit are returned unchanged)
+
+        Returns:
+            (list, list, list): document list, overflow document list, rejected document list
+        """
+        rList = []
+        oDList = []
+        rejectList = []
+        numDetached = 0
+        for dD in dList:
+            try:
+                totalBytes = self.__size(dD)
+                if totalBytes < self.__limitBytes:
+                    rList.append(dD)
+                    continue
+                #
+                szD = {ky: self.__size({ky: dD[ky]}) for ky in dD if ky not in self.__keepKeyS}
+                if "_id" not in dD:
+                    dD["_id"] = ObjectId()
+                # detach from a shallow copy so that rejected documents are returned intact
+                tD = copy.copy(dD)
+                stubL = []
+                docOverflowList = []
+                for ky, sz in sorted(szD.items(), key=operator.itemgetter(1), reverse=True):
+                    if totalBytes < self.__limitBytes:
+                        break
+                    partL = self.__split(tD[ky])
+                    for ii, part in enumerate(partL):
+                        docOverflowList.append(self.__makeOverflowDocument(tD, ky, ii, len(partL), part))
+                    tD.pop(ky)
+                    stubL.append({"key": ky, "part_count": len(partL)})
+                    totalBytes -= sz
+                    logger.debug("Detaching %s size(MB) %.2f in %d parts", ky, float(sz) / 1048576.0, len(partL))
+                if stubL:
+                    tD[self.__stubKey] = stubL
+                #
+                maxBytes = max([self.__size(tD)] + [self.__size(oD) for oD in docOverflowList])
+                if maxBytes >= self.__limitBytes:
+                    logger.error("Rejecting document %r with content size(MB) %.2f exceeding the limit after detaching overflow content", dD["_id"], float(maxBytes) / 1048576.0)
+                    rejectList.append(dD)
+                    continue
+                rList.append(tD)
+                oDList.extend(docOverflowList)
+                numDetached += 1
+            except Exception as e:
+                logger.exception("Failing with %s", str(e))
+                rejectList.append(dD)
+        #
+        logger.debug("Detached sub-objects from %d of %d documents (overflow documents %d rejected %d)", numDetached, len(dList), len(oDList), len(rejectList))
+        return rList, oDList, rejectList
+
+    def restore(self, mg, databaseName, collectionName, dObj):
+        """Restore detached sub-objects into the input document fetched from the input collection.
+
+        Args:
+            mg (object): MongoDbUtil() instance
+            databaseName (str): database name
+            collectionName (str): parent collection name
+            dObj (dict): parent document
+
+        Returns:
+            dict: document with overflow content restored
+        """
+        if not dObj or self.__stubKey not in dObj:
+            return dObj
+        try:
+            oDList = mg.fetch(databaseName, self.getOverflowCollectionName(collectionName), None, queryD={"_parent_id": dObj["_id"]})
+            partD = {}
+            for oD in oDList if oDList else []:
+                partD.setdefault(oD["overflow_key"], []).append(oD)
+            for stubD in dObj[self.__stubKey]:
+                ky = stubD["key"]
+                oL = sorted(partD.get(ky, []), key=operator.itemgetter("overflow_part"))
+                if len(oL) != stubD["part_count"]:
+                    logger.error("Incomplete overflow content for %s key %s (%d of %d parts)", dObj["_id"], ky, len(oL), stubD["part_count"])
+                    continue
+                if oL and oL[0]["overflow_part_type"] == "list":
+                    dObj[ky] = [val for oD in oL for val in oD["data"]]
+                elif oL and oL[0]["overflow_part_type"] == "dict":
+                    dObj[ky] = {k: v for oD in oL for k, v in oD["data"].items()}
+                elif oL:
+                    dObj[ky] = oL[0]["data"]
+            dObj.pop(self.__stubKey)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+        return dObj
+
+    def __size(self, dD):
+        return len(bson.BSON.encode(dD))
+
+    def __split(self, val):
+        """Split list and dictionary values exceeding the size limit into ordered parts."""
+        if not isinstance(val, (list, tuple, dict)) or self.__size({"data": val}) < self.__limitBytes:
+            return [val]
+        # leave headroom for the overflow document key and reference attributes
+        partLimit = int(self.__limitBytes * 0.95)
+        partL = []
+        curL = []
+        curBytes = 0
+        for item in val.items() if isinstance(val, dict) else val:
+            itemBytes = self.__size({"0": item})
+            if curL and curBytes + itemBytes > partLimit:
+                partL.append(curL)
+                curL = []
+                curBytes = 0
+            curL.append(item)
+            curBytes += itemBytes
+        if curL:
+            partL.append(curL)
+        return [dict(part) for part in partL] if isinstance(val, dict) else partL
+
+    def __makeOverflowDocument(self, dD, ky, partIndex, partCount, part):
+        oD = {}
+        for keyName in self.__keyNames + ["rcsb_id"]:
+            val = self.__getKeyValue(dD, keyName)
+            if val is not None:
+                self.__setKeyValue(oD, keyName, val)
+        oD["_parent_id"] = dD["_id"]
+        oD["overflow_key"] = ky
+        oD["overflow_part"] = partIndex
+        oD["overflow_part_count"] = partCount
+        oD["overflow_part_type"] = ("dict" if isinstance(dD[ky], dict) else "list") if isinstance(dD[ky], (list, tuple, dict)) and partCount > 1 else "value"
+        oD["data"] = part
+        return oD
+
+    def __getKeyValue(self, dct, keyName):
+        for key in keyName.split("."):
+            try:
+                dct = dct[key]
+            except (KeyError, TypeError):
+                return None
+        return dct
+
+    def __setKeyValue(self, dct, keyName, val):
+        kys = keyName.split(".")
+        for key in kys[:-1]:
+            dct = dct.setdefault(key, {})
+        dct[kys[-1]] = val
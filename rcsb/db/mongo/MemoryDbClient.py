@@ -0,0 +1,580 @@
+##
+# File:  MemoryDbClient.py
+# Date:  18-Oct-2026
+#
+# Update:
+##
+"""
+In-memory document store implementing the subset of the pymongo client API used by MongoDbUtil.
+
+The store is a native dictionary backend selected by setting the connection preference DB_SERVER = "memory"
+(e.g. MONGO_DB_SERVER: memory in the configuration file).  Stores are shared by name (DB_HOST) and are held
+in a store server process started on first use, so each new Connection() opened on the same resource sees the
+same content, including connections opened within forked worker processes (e.g. PdbxLoader load workers).
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "agent"
+__email__ = "agent@local"
+__license__ = "Apache 2.0"
+
+import copy
+import logging
+import multiprocessing
+import re
+import threading
+from collections import OrderedDict, namedtuple
+from multiprocessing.managers import BaseManager
+
+import bson
+from bson.errors import InvalidDocument
+from bson.objectid import ObjectId
+from pymongo.errors import BulkWriteError, CollectionInvalid, DocumentTooLarge, DuplicateKeyError, OperationFailure, PyMongoError
+
+logger = logging.getLogger(__name__)
+
+InsertOneResult = namedtuple("InsertOneResult", "inserted_id acknowledged")
+InsertManyResult = namedtuple("InsertManyResult", "inserted_ids acknowledged")
+UpdateResult = namedtuple("UpdateResult", "matched_count modified_count upserted_id acknowledged")
+DeleteResult = namedtuple("DeleteResult", "deleted_count acknowledged")
+
+MAX_BSON_OBJECT_SIZE = 16 * 1024 * 1024
+
+
+def _getFieldValues(dObj, keyName):
+    """Return the list of values for the input key (dot notation) in the input document (arrays are traversed)."""
+    vL = [dObj]
+    for ky in keyName.split("."):
+        nL = []
+        for val in vL:
+            if isinstance(val, dict):
+                if ky in val:
+                    nL.append(val[ky])
+            elif isinstance(val, (list, tuple)):
+                if ky.isdigit() and int(ky) < len(val):
+                    nL.append(val[int(ky)])
+                else:
+                    nL.extend([tV[ky] for tV in val if isinstance(tV, dict) and ky in tV])
+        vL = nL
+        if not vL:
+            break
+    return vL
+
+
+def _expandValues(vL):
+    rL = []
+    for val in vL:
+        rL.append(val)
+        if isinstance(val, (list, tuple)):
+            rL.extend(val)
+    return rL
+
+
+def _testOperator(op, arg, vL):
+    eL = _expandValues(vL)
+    if op == "$eq":
+        return arg in eL
+    if op == "$ne":
+        return arg not in eL
+    if op == "$in":
+        return any(val in arg for val in eL)
+    if op == "$nin":
+        return not any(val in arg for val in eL)
+    if op == "$exists":
+        return bool(vL) == bool(arg)
+    if op in ["$gt", "$gte", "$lt", "$lte"]:
+        for val in eL:
+            try:
+                if (
+                    (op == "$gt" and val > arg)
+                    or (op == "$gte" and val >= arg)
+                    or (op == "$lt" and val < arg)
+                    or (op == "$lte" and val <= arg)
+                ):
+                    return True
+            except TypeError:
+                continue
+        return False
+    raise OperationFailure("Unsupported query operator %s" % op)
+
+
+def _matchCondition(dObj, keyName, cond):
+    vL = _getFieldValues(dObj, keyName)
+    if isinstance(cond, dict) and cond and all(ky.startswith("$") for ky in cond):
+        if "$regex" in cond:
+            flags = re.IGNORECASE if "i" in cond.get("$options", "") else 0
+            pat = re.compile(cond["$regex"], flags)
+            if not any(isinstance(val, str) and pat.search(val) for val in _expandValues(vL)):
+                return False
+        for op, arg in cond.items():
+            if op in ["$regex", "$options"]:
+                continue
+            if not _testOperator(op, arg, vL):
+                return False
+        return True
+    if hasattr(cond, "search") and hasattr(cond, "pattern"):
+        return any(isinstance(val, str) and cond.search(val) for val in _expandValues(vL))
+    if cond is None:
+        return not vL or None in _expandValues(vL)
+    return cond in _expandValues(vL)
+
+
+def _matchQuery(dObj, queryD):
+    if not queryD:
+        return True
+    for keyName, cond in queryD.items():
+        if keyName == "$and":
+            if not all(_matchQuery(dObj, qD) for qD in cond):
+                return False
+        elif keyName == "$or":
+            if not any(_matchQuery(dObj, qD) for qD in cond):
+                return False
+        elif not _matchCondition(dObj, keyName, cond):
+            return False
+    return True
+
+
+def _setFieldValue(dObj, keyName, val):
+    kys = keyName.split(".")
+    for ky in kys[:-1]:
+        dObj = dObj.setdefault(ky, {})
+    dObj[kys[-1]] = val
+
+
+def _project(dObj, projectionD):
+    if not projectionD:
+        return copy.deepcopy(dObj)
+    includeL = [ky for ky, flag in projectionD.items() if flag and ky != "_id"]
+    suppressId = "_id" in projectionD and not projectionD["_id"]
+    if includeL:
+        rD = OrderedDict()
+        if not suppressId and "_id" in dObj:
+            rD["_id"] = dObj["_id"]
+        for ky in includeL:
+            vL = _getFieldValues(dObj, ky)
+            if vL:
+                _setFieldValue(rD, ky, copy.deepcopy(vL[0]))
+        return rD
+    rD = copy.deepcopy(dObj)
+    for ky, flag in projectionD.items():
+        if not flag:
+            rD.pop(ky, None)
+    return rD
+
+
+class MemoryCollectionData(object):
+    """Storage for a single collection -  documents ordered by insertion and keyed by _id."""
+
+    def __init__(self):
+        self.docD = OrderedDict()
+        self.indexD = OrderedDict([("_id_", {"key": [("_id", 1)], "unique": True})])
+        self.optionsD = {}
+
+
+class _StoreCollection(object):
+    """Operations on a single collection held in the store server."""
+
+    def __init__(self, storeD, databaseName, collectionName):
+        self.__storeD = storeD
+        self.__databaseName = databaseName
+        self.name = collectionName
+
+    @property
+    def full_name(self):
+        return "%s.%s" % (self.__databaseName, self.name)
+
+    def __data(self, create=True):
+        if create:
+            return self.__storeD.setdefault(self.__databaseName, OrderedDict()).setdefault(self.name, MemoryCollectionData())
+        return self.__storeD.get(self.__databaseName, {}).get(self.name, None)
+
+    def __checkUnique(self, cData, dObj):
+        for indexName, indexD in cData.indexD.items():
+            if indexName == "_id_" or not indexD["unique"]:
+                continue
+            keyNames = [ky for ky, _ in indexD["key"]]
+            kyVals = [_getFieldValues(dObj, ky)[:1] for ky in keyNames]
+            for tD in cData.docD.values():
+                if [_getFieldValues(tD, ky)[:1] for ky in keyNames] == kyVals:
+                    raise DuplicateKeyError("E11000 duplicate key error collection: %s index: %s" % (self.full_name, indexName))
+
+    def __insertDocument(self, cData, dObj):
+        if "_id" not in dObj:
+            dObj["_id"] = ObjectId()
+        if len(bson.encode(dObj)) > MAX_BSON_OBJECT_SIZE:
+            raise DocumentTooLarge("BSON document too large - the connected server supports BSON document sizes up to %d bytes" % MAX_BSON_OBJECT_SIZE)
+        if dObj["_id"] in cData.docD:
+            raise DuplicateKeyError("E11000 duplicate key error collection: %s index: _id_" % self.full_name)
+        self.__checkUnique(cData, dObj)
+        cData.docD[dObj["_id"]] = copy.deepcopy(dObj)
+        return dObj["_id"]
+
+    def insert_one(self, document):
+        return InsertOneResult(self.__insertDocument(self.__data(), document), True)
+
+    def insert_many(self, documents, ordered=True):
+        rIdL = []
+        errL = []
+        cData = self.__data()
+        for ii, dObj in enumerate(documents):
+            try:
+                rIdL.append(self.__insertDocument(cData, dObj))
+            except (DocumentTooLarge, DuplicateKeyError) as e:
+                errL.append({"index": ii, "errmsg": str(e)})
+                if ordered:
+                    break
+        if errL:
+            raise BulkWriteError({"writeErrors": errL, "nInserted": len(rIdL), "writeConcernErrors": [], "upserted": []})
+        return InsertManyResult(rIdL, True)
+
+    def find(self, filter=None, projection=None):  # pylint: disable=redefined-builtin
+        cData = self.__data(create=False)
+        dL = list(cData.docD.values()) if cData else []
+        return [_project(dObj, projection) for dObj in dL if _matchQuery(dObj, filter)]
+
+    def find_one(self, filter=None, projection=None):  # pylint: disable=redefined-builtin
+        cData = self.__data(create=False)
+        for dObj in cData.docD.values() if cData else []:
+            if _matchQuery(dObj, filter):
+                return _project(dObj, projection)
+        return None
+
+    def count_documents(self, filter):  # pylint: disable=redefined-builtin
+        cData = self.__data(create=False)
+        return sum(1 for dObj in cData.docD.values() if _matchQuery(dObj, filter)) if cData else 0
+
+    def delete_many(self, filter):  # pylint: disable=redefined-builtin
+        cData = self.__data(create=False)
+        if not cData:
+            return DeleteResult(0, True)
+        idL = [dId for dId, dObj in cData.docD.items() if _matchQuery(dObj, filter)]
+        for dId in idL:
+            del cData.docD[dId]
+        return DeleteResult(len(idL), True)
+
+    def replace_one(self, filter, replacement, upsert=False):  # pylint: disable=redefined-builtin
+        cData = self.__data()
+        for dId, dObj in cData.docD.items():
+            if _matchQuery(dObj, filter):
+                rD = copy.deepcopy(replacement)
+                rD["_id"] = dId
+                modified = int(rD != dObj)
+                cData.docD[dId] = rD
+                return UpdateResult(1, modified, None, True)
+        if upsert:
+            rD = copy.deepcopy(replacement)
+            return UpdateResult(0, 0, self.__insertDocument(cData, rD), True)
+        return UpdateResult(0, 0, None, True)
+
+    def update_many(self, filter, update, upsert=False):  # pylint: disable=redefined-builtin
+        if set(update.keys()) - {"$set"}:
+            raise OperationFailure("Unsupported update operators %r" % list(update.keys()))
+        setD = update.get("$set", {})
+        numMatched = numModified = 0
+        cData = self.__data()
+        for dObj in cData.docD.values():
+            if _matchQuery(dObj, filter):
+                numMatched += 1
+                before = copy.deepcopy(dObj)
+                for ky, val in setD.items():
+                    _setFieldValue(dObj, ky, copy.deepcopy(val))
+                numModified += int(before != dObj)
+        if not numMatched and upsert:
+            rD = {ky: val for ky, val in filter.items() if not ky.startswith("$") and not isinstance(val, dict)}
+            for ky, val in setD.items():
+                _setFieldValue(rD, ky, copy.deepcopy(val))
+            return UpdateResult(0, 0, self.__insertDocument(cData, rD), True)
+        return UpdateResult(numMatched, numModified, None, True)
+
+    def create_index(self, keys, name=None, unique=False):
+        keyL = [(keys, 1)] if isinstance(keys, str) else list(keys)
+        indexName = name if name else "_".join(["%s_%s" % (ky, direction) for ky, direction in keyL])
+        cData = self.__data()
+        if unique:
+            seenS = set()
+            for dObj in cData.docD.values():
+                tt = repr([_getFieldValues(dObj, ky)[:1] for ky, _ in keyL])
+                if tt in seenS:
+                    raise DuplicateKeyError("E11000 duplicate key error collection: %s index: %s" % (self.full_name, indexName))
+                seenS.add(tt)
+        cData.indexD[indexName] = {"key": keyL, "unique": unique}
+        return indexName
+
+    def drop_index(self, index_or_name):
+        cData = self.__data(create=False)
+        if not cData or index_or_name not in cData.indexD or index_or_name == "_id_":
+            raise OperationFailure("index not found with name [%s]" % index_or_name)
+        del cData.indexD[index_or_name]
+
+    def list_indexes(self):
+        cData = self.__data(create=False)
+        return [{"name": indexName, "key": OrderedDict(indexD["key"]), "unique": indexD["unique"]} for indexName, indexD in cData.indexD.items()] if cData else []
+
+
+class _StoreDatabase(object):
+    """Operations on a single database held in the store server."""
+
+    def __init__(self, storeD, databaseName):
+        self.__storeD = storeD
+        self.name = databaseName
+
+    def create_collection(self, collectionName, **kwargs):
+        cD = self.__storeD.setdefault(self.name, OrderedDict())
+        if collectionName in cD:
+            raise CollectionInvalid("collection %s already exists" % collectionName)
+        cData = cD.setdefault(collectionName, MemoryCollectionData())
+        cData.optionsD = copy.deepcopy(kwargs)
+        return True
+
+    def drop_collection(self, collectionName):
+        self.__storeD.get(self.name, {}).pop(collectionName, None)
+        return {"ok": 1.0}
+
+    def list_collection_names(self):
+        return list(self.__storeD.get(self.name, {}).keys())
+
+    def command(self, command):
+        cmdName = next(iter(command)) if isinstance(command, dict) else command
+        if cmdName == "collMod":
+            cData = self.__storeD.get(self.name, {}).get(command["collMod"], None)
+            if cData is None:
+                raise OperationFailure("ns does not exist")
+            for ky in ["validator", "validationLevel", "validationAction"]:
+                if ky in command:
+                    cData.optionsD[ky] = copy.deepcopy(command[ky])
+            return {"ok": 1.0}
+        if cmdName in ["ismaster", "isMaster", "ping"]:
+            return {"ok": 1.0, "ismaster": True, "maxBsonObjectSize": MAX_BSON_OBJECT_SIZE}
+        if cmdName == "dbstats":
+            cD = self.__storeD.get(self.name, {})
+            return {"ok": 1.0, "db": self.name, "collections": len(cD), "objects": sum([len(cData.docD) for cData in cD.values()])}
+        raise OperationFailure("Unsupported command %r" % cmdName)
+
+
+class _StoreClient(object):
+    """Operations on a named store held in the store server."""
+
+    def __init__(self, storeD):
+        self.__storeD = storeD
+
+    def list_database_names(self):
+        return [dbName for dbName, cD in self.__storeD.items() if cD]
+
+    def drop_database(self, databaseName):
+        self.__storeD.pop(databaseName, None)
+
+
+class MemoryStore(object):
+    """Named document stores -  { storeName: { databaseName: { collectionName: MemoryCollectionData } } }.
+
+    Operations are serialized and errors are returned as (className, argument) tuples rather than raised, so that
+    the store may be served to other processes (MemoryStoreManager).
+    """
+
+    def __init__(self):
+        self.__storeD = {}
+        self.__lock = threading.RLock()
+
+    def execute(self, storeName, databaseName, collectionName, methodName, args, kwargs):
+        """Run the named operation on a store, database or collection.
+
+        Returns:
+            (bool, object): True and the operation result or False and the error tuple (className, argument)
+        """
+        try:
+            with self.__lock:
+                storeD = self.__storeD.setdefault(storeName, OrderedDict())
+                if collectionName is not None:
+                    obj = _StoreCollection(storeD, databaseName, collectionName)
+                elif databaseName is not None:
+                    obj = _StoreDatabase(storeD, databaseName)
+                else:
+                    obj = _StoreClient(storeD)
+                return True, getattr(obj, methodName)(*args, **kwargs)
+        except BulkWriteError as e:
+            return False, (type(e).__name__, e.details)
+        except (PyMongoError, InvalidDocument) as e:
+            return False, (type(e).__name__, str(e))
+
+    def clear(self, storeName=None):
+        with self.__lock:
+            if storeName is None:
+                self.__storeD.clear()
+            else:
+                self.__storeD.pop(storeName, None)
+        return True
+
+
+_SERVER_STORE = None
+
+
+def _getServerStore():
+    """Return the store instance served by the store server process."""
+    global _SERVER_STORE  # pylint: disable=global-statement
+    if _SERVER_STORE is None:
+        _SERVER_STORE = MemoryStore()
+    return _SERVER_STORE
+
+
+class MemoryStoreManager(BaseManager):
+    pass
+
+
+MemoryStoreManager.register("getMemoryStore", callable=_getServerStore)
+
+_STORE = None
+_STORE_MANAGER = None
+_STORE_LOCK = threading.Lock()
+
+
+def _getStore():
+    """Return the store shared by this process and its child processes.
+
+    The store server process is started on first use.  Processes forked afterwards (e.g. MultiProcUtil workers)
+    inherit the proxy and share the store content.  Daemonic processes, which cannot start child processes, fall
+    back to a store private to the process.
+    """
+    global _STORE, _STORE_MANAGER  # pylint: disable=global-statement
+    with _STORE_LOCK:
+        if _STORE is None:
+            if multiprocessing.current_process().daemon:
+                _STORE = MemoryStore()
+            else:
+                try:
+                    _STORE_MANAGER = MemoryStoreManager()
+                    _STORE_MANAGER.start()
+                    _STORE = _STORE_MANAGER.getMemoryStore()  # pylint: disable=no-member
+                except Exception as e:
+                    logger.warning("Store server failing with %s - using a store private to this process", str(e))
+                    _STORE = MemoryStore()
+        return _STORE
+
+
+_ERROR_CLASS_D = {
+    "BulkWriteError": BulkWriteError,
+    "CollectionInvalid": CollectionInvalid,
+    "DocumentTooLarge": DocumentTooLarge,
+    "DuplicateKeyError": DuplicateKeyError,
+    "InvalidDocument": InvalidDocument,
+}
+
+
+class MemoryCollection(object):
+    def __init__(self, dbObj, collectionName):
+        self.__db = dbObj
+        self.name = collectionName
+
+    @property
+    def full_name(self):
+        return "%s.%s" % (self.__db.name, self.name)
+
+    def __execute(self, methodName, *args, **kwargs):
+        return self.__db.execute(self.name, methodName, *args, **kwargs)
+
+    def insert_one(self, document, bypass_document_validation=False):  # pylint: disable=unused-argument
+        if "_id" not in document:
+            document["_id"] = ObjectId()
+        return self.__execute("insert_one", document)
+
+    def insert_many(self, documents, ordered=True, bypass_document_validation=False):  # pylint: disable=unused-argument
+        documents = list(documents)
+        for dObj in documents:
+            if "_id" not in dObj:
+                dObj["_id"] = ObjectId()
+        return self.__execute("insert_many", documents, ordered=ordered)
+
+    def find(self, filter=None, projection=None):  # pylint: disable=redefined-builtin
+        return self.__execute("find", filter=filter, projection=projection)
+
+    def find_one(self, filter=None, projection=None):  # pylint: disable=redefined-builtin
+        return self.__execute("find_one", filter=filter, projection=projection)
+
+    def count_documents(self, filter):  # pylint: disable=redefined-builtin
+        return self.__execute("count_documents", filter)
+
+    def delete_many(self, filter):  # pylint: disable=redefined-builtin
+        return self.__execute("delete_many", filter)
+
+    def replace_one(self, filter, replacement, upsert=False):  # pylint: disable=redefined-builtin
+        return self.__execute("replace_one", filter, replacement, upsert=upsert)
+
+    def update_many(self, filter, update, upsert=False, array_filters=None):  # pylint: disable=redefined-builtin,unused-argument
+        return self.__execute("update_many", filter, update, upsert=upsert)
+
+    def create_index(self, keys, name=None, unique=False, **kwargs):  # pylint: disable=unused-argument
+        return self.__execute("create_index", keys, name=name, unique=unique)
+
+    def drop_index(self, index_or_name):
+        return self.__execute("drop_index", index_or_name)
+
+    def list_indexes(self):
+        return self.__execute("list_indexes")
+
+    def reindex(self):
+        return True
+
+
+class MemoryDatabase(object):
+    def __init__(self, clientObj, databaseName):
+        self.__client = clientObj
+        self.name = databaseName
+
+    def execute(self, collectionName, methodName, *args, **kwargs):
+        return self.__client.execute(self.name, collectionName, methodName, *args, **kwargs)
+
+    def __getitem__(self, collectionName):
+        return self.get_collection(collectionName)
+
+    def get_collection(self, collectionName):
+        return MemoryCollection(self, collectionName)
+
+    def create_collection(self, collectionName, **kwargs):
+        self.execute(None, "create_collection", collectionName, **kwargs)
+        return self.get_collection(collectionName)
+
+    def drop_collection(self, collectionName):
+        return self.execute(None, "drop_collection", collectionName)
+
+    def list_collection_names(self):
+        return self.execute(None, "list_collection_names")
+
+    def command(self, command, *args, **kwargs):  # pylint: disable=unused-argument
+        return self.execute(None, "command", command)
+
+
+class MemoryDbClient(object):
+    """Native dictionary backed client implementing the pymongo client API subset used by MongoDbUtil."""
+
+    def __init__(self, storeName="default"):
+        self.__storeName = storeName if storeName else "default"
+
+    def execute(self, databaseName, collectionName, methodName, *args, **kwargs):
+        """Run the named operation in the shared store and raise any operation error in the calling process."""
+        ok, rV = _getStore().execute(self.__storeName, databaseName, collectionName, methodName, args, kwargs)
+        if not ok:
+            raise _ERROR_CLASS_D.get(rV[0], OperationFailure)(rV[1])
+        return rV
+
+    @property
+    def admin(self):
+        return self["admin"]
+
+    def __getitem__(self, databaseName):
+        return MemoryDatabase(self, databaseName)
+
+    def get_database(self, databaseName):
+        return MemoryDatabase(self, databaseName)
+
+    def list_database_names(self):
+        return self.execute(None, None, "list_database_names")
+
+    def drop_database(self, databaseName):
+        self.execute(None, None, "drop_database", databaseName)
+
+    def close(self):
+        pass
+
+
+def clearMemoryStore(storeName=None):
+    """Remove the content of the named store (or all stores if storeName is None)."""
+    return _getStore().clear(storeName)
@@ -28,6 +28,15 @@
 #                      support locator object lists.
 #      6-Aug-2019 jdw  Add schema generation option and move dictionary API instantiation into load() method.
 #     18-May-2020 jdw  Add brute force document purging for loadType=replace
+#     18-Oct-2026 agent  Add overflow storage of oversized document sub-objects as an alternative to pruning
+#     18-Oct-2026 agent  Add per-stage load metrics collected in each worker and exported as JSON or Prometheus text
+#     18-Oct-2026 agent  Add concurrentCollections option to load collections on separate writer threads within each worker
+#     18-Oct-2026 agent  Add pipelined loading overlapping document generation with background writes bounded by queue size
+#     18-Oct-2026 agent  Map each container once when loading multiple collections (SchemaDefDataPrep.processDocumentsMulti())
+#     18-Oct-2026 agent  Read containers on demand in loadWorker() and stream documents with SchemaDefDataPrep.processDocumentsIter()
+#     18-Oct-2026 agent  Add changedEntriesOnly option to load only the entries changed since the last load (LoadWatermark)
+#     18-Oct-2026 agent  Add containerCachePath option to read parsed containers from a binary container cache
+#     18-Oct-2026 agent  Add prefetchCount option to read ahead the input files of the following entries in loadWorker()
 #
 ##
 """
@@ -45,8 +54,10 @@ __license__ = "Apache 2.0"
 import logging
 import operator
 import os
+import itertools
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 import bson
 
@@ -56,12 +67,17 @@ from mmcif.api.DictMethodRunner import DictMethodRunner
 from rcsb.db.define.DictionaryApiProviderWrapper import DictionaryApiProviderWrapper
 from rcsb.db.helpers.DictMethodResourceProvider import DictMethodResourceProvider
 from rcsb.db.mongo.Connection import Connection
+from rcsb.db.mongo.DocumentOverflowUtil import DocumentOverflowUtil
 from rcsb.db.mongo.MongoDbUtil import MongoDbUtil
 from rcsb.db.processors.DataExchangeStatus import DataExchangeStatus
 from rcsb.db.processors.DataTransformFactory import DataTransformFactory
 from rcsb.db.processors.SchemaDefDataPrep import SchemaDefDataPrep
+from rcsb.db.utils.LoadMetrics import LoadMetrics
+from rcsb.db.utils.LoadWatermark import LoadWatermark
+from rcsb.db.utils.RepositoryManifest import entryFileId
 from rcsb.db.utils.RepositoryProvider import RepositoryProvider
 from rcsb.db.utils.SchemaProvider import SchemaProvider
+from rcsb.db.utils.WriterPipeline import WriterPipeline
 from rcsb.utils.multiproc.MultiProcUtil import MultiProcUtil
 
 logger = logging.getLogger(__name__)
@@ -490,6 +506,10 @@ class PdbxLoader(object):
         maxStepLength=2000,
         useSchemaCache=True,
         rebuildSchemaFlag=False,
+        containerCachePath=None,
+        containerCacheSizeMB=None,
+        prefetchCount=0,
+        prefetchSizeMB=64,
     ):
         """  Worker methods for loading primary data content following mapping conventions in external schema definitions.
 
@@ -503,6 +523,10 @@ class PdbxLoader(object):
             verbose (bool, optional): Description
             readBackCheck (bool, optional): read back and check each loaded object
             maxStepLength (int, optional): limit multiprocessing steps
+            containerCachePath (str, optional): directory path of a binary cache of parsed containers (default: no cache)
+            containerCacheSizeMB (float, optional): approximate limit on the size of the container cache (MB)
+            prefetchCount (int, optional): number of entries whose input files are read ahead on a background thread in each worker (default: 0)
+            prefetchSizeMB (float, optional): approximate limit on the size of the input files read ahead in each worker (MB)
 
         """
         self.__verbose = verbose
@@ -525,9 +549,19 @@ class PdbxLoader(object):
         self.__mpFormat = "[%(levelname)s] %(asctime)s %(processName)s-%(module)s.%(funcName)s: %(message)s"
         #
         self.__schP = SchemaProvider(self.__cfgOb, self.__cachePath, useCache=self.__useSchemaCache, rebuildFlag=self.__rebuildSchemaFlag)
-        self.__rpP = RepositoryProvider(cfgOb=self.__cfgOb, numProc=self.__numProc, fileLimit=self.__fileLimit, cachePath=self.__cachePath)
+        self.__rpP = RepositoryProvider(
+            cfgOb=self.__cfgOb,
+            numProc=self.__numProc,
+            fileLimit=self.__fileLimit,
+            cachePath=self.__cachePath,
+            containerCachePath=containerCachePath,
+            containerCacheSizeMB=containerCacheSizeMB,
+            prefetchCount=prefetchCount,
+            prefetchSizeMB=prefetchSizeMB,
+        )
         #
         self.__statusList = []
+        self.__loadMetrics = LoadMetrics()
         #
         self.__sectionName = "site_info_configuration"
         self.__dmh = None
@@ -551,6 +585,14 @@ class PdbxLoader(object):
         updateSchemaOnReplace=True,
         validateFailures=True,
         reloadPartial=True,
+        overflowDocumentSize=None,
+        metricsFilePath=None,
+        metricsFormat="json",
+        concurrentCollections=False,
+        pipelineQueueSizeMB=None,
+        pipelineBatchSize=2,
+        changedEntriesOnly=False,
+        compareDigest=False,
     ):
         """Driver method for loading PDBx/mmCIF content into the Mongo document store.
 
@@ -570,6 +612,21 @@ class PdbxLoader(object):
             updateSchemaOnReplace (bool, optional): Update validation schema for loadType == 'replace'
             validateFailures (bool, optional): output validation report on load failures
             reloadPartial (bool, optional): on load failures attempt reload of partial objects.
+            overflowDocumentSize (float, optional): detach sub-objects from documents exceeding this size limit (MB) into
+                                                    the side collection <collectionName>_overflow rather than pruning
+            metricsFilePath (str, optional): export per-stage load timing and volume metrics to this file path
+            metricsFormat (str, optional): metrics export format 'json' or 'prometheus' (node exporter text file)
+            concurrentCollections (bool, optional): create collections and load the documents for each collection on separate
+                                                    threads (overlapping database writes with the generation of the documents
+                                                    for the next batch of pipelineBatchSize entries in each worker)
+            pipelineQueueSizeMB (float, optional): hand documents to background writer threads in each worker while the next
+                                                   batch of entries is transformed, limiting queued documents to this size (MB)
+            pipelineBatchSize (int, optional): number of entries transformed in each pipelined batch (pipelineQueueSizeMB or
+                                               concurrentCollections)
+            changedEntriesOnly (bool, optional): for entry databases (pdbx, pdbx_core) replace only the entries whose repository
+                                                 files were added or modified since the last load recorded in the load watermark
+                                                 and purge the entries removed from the repository
+            compareDigest (bool, optional): treat files with a changed modification time but the recorded content digest as unchanged
         Returns:
             bool: True on success or False otherwise
 
@@ -577,6 +634,7 @@ class PdbxLoader(object):
         try:
             #
             self.__statusList = []
+            self.__loadMetrics = LoadMetrics()
             desp = DataExchangeStatus()
             statusStartTimestamp = desp.setStartTime()
             #
@@ -595,7 +653,35 @@ class PdbxLoader(object):
                 return ok
             # ---
             self.__dmh = DictMethodRunner(dictApi, modulePathMap=modulePathMap, resourceProvider=dmrP)
-            locatorObjList = self.__rpP.getLocatorObjList(contentType=databaseName, inputPathList=inputPathList, mergeContentTypes=mergeContentTypes)
+            #
+            sd, _, fullCollectionNameList, docIndexD = self.__schP.getSchemaInfo(databaseName, dataTyping="ANY")
+            collectionNameList = collectionLoadList if collectionLoadList else fullCollectionNameList
+            #
+            lw = stateD = diffD = None
+            fullSetupL = []
+            if changedEntriesOnly:
+                if databaseName not in ["pdbx", "pdbx_core"] or inputPathList:
+                    logger.error("Changed entry loading requires an entry database (pdbx or pdbx_core) without an input path list - %s load aborted", databaseName)
+                    return False
+                with self.__loadMetrics.timer("locator"):
+                    stateD = self.__rpP.getEntryFileStateD(mergeContentTypes=mergeContentTypes)
+                    lw = LoadWatermark(self.__getWatermarkPath(databaseName))
+                    # Collections without a recorded load (e.g. the first changed entry load) or missing from the database
+                    # are set up (indices and validation schema) as for a full load and all entries are loaded.
+                    fullSetupL = [cN for cN in collectionNameList if lw.getTimestamp(cN) is None or not self.__collectionExists(databaseName, cN)]
+                    if fullSetupL:
+                        logger.info("Setting up collections %r for a full load of %s", fullSetupL, databaseName)
+                        lw.clear(fullSetupL)
+                    diffD = lw.getDiff(stateD, collectionNameList, useDigest=compareDigest)
+                    inputPathList = [stateD[idCode][0][0] for idCode in diffD["added"] + diffD["modified"]]
+                # existing documents for changed entries are replaced rather than recreating the collections
+                loadType = "replace"
+            #
+            with self.__loadMetrics.timer("locator"):
+                if changedEntriesOnly and not inputPathList:
+                    locatorObjList = []
+                else:
+                    locatorObjList = self.__rpP.getLocatorObjList(contentType=databaseName, inputPathList=inputPathList, mergeContentTypes=mergeContentTypes)
             logger.info("Loading database %s (%r) with path length %d", databaseName, loadType, len(locatorObjList))
             #
             if saveInputFileListPath:
@@ -619,33 +705,40 @@ class PdbxLoader(object):
             optD["validationLevel"] = validationLevel
             optD["validateFailures"] = validateFailures
             optD["reloadPartial"] = reloadPartial
+            optD["overflowDocumentSize"] = overflowDocumentSize
+            optD["collectMetrics"] = metricsFilePath is not None
+            optD["concurrentCollections"] = concurrentCollections
+            optD["pipelineQueueSizeMB"] = pipelineQueueSizeMB
+            optD["pipelineBatchSize"] = pipelineBatchSize
             # ---------------- - ---------------- - ---------------- - ---------------- - ---------------- -
             #
 
             numProc = self.__numProc
             chunkSize = self.__chunkSize if locatorObjList and self.__chunkSize < len(locatorObjList) else 0
             #
-            sd, _, fullCollectionNameList, docIndexD = self.__schP.getSchemaInfo(databaseName, dataTyping="ANY")
-
-            collectionNameList = collectionLoadList if collectionLoadList else fullCollectionNameList
-
+            setupStartTime = time.time()
+            setupArgL = []
             for collectionName in collectionNameList:
-                if loadType == "full":
-                    self.__removeCollection(databaseName, collectionName)
-                    indexDL = docIndexD[collectionName] if collectionName in docIndexD else []
-                    bsonSchema = None
-                    if validationLevel and validationLevel in ["min", "full"]:
-                        bsonSchema = self.__schP.getJsonSchema(databaseName, collectionName, encodingType="BSON", level=validationLevel)
-                    ok = self.__createCollection(databaseName, collectionName, indexDL=indexDL, bsonSchema=bsonSchema)
-                    logger.debug("Collection create return status %r", ok)
-                elif loadType == "replace" and updateSchemaOnReplace:
-                    bsonSchema = None
-                    if validationLevel and validationLevel in ["min", "full"]:
-                        bsonSchema = self.__schP.getJsonSchema(databaseName, collectionName, encodingType="BSON", level=validationLevel)
-                    if bsonSchema:
-                        ok = self.__updateCollectionSchema(databaseName, collectionName, bsonSchema=bsonSchema)
-                        if not ok:
-                            logger.info("Schema update failing for %s (%s)", databaseName, collectionName)
+                setupLoadType = "full" if collectionName in fullSetupL else loadType
+                indexDL = docIndexD[collectionName] if collectionName in docIndexD else []
+                bsonSchema = None
+                if (setupLoadType == "full" or updateSchemaOnReplace) and validationLevel and validationLevel in ["min", "full"]:
+                    bsonSchema = self.__schP.getJsonSchema(databaseName, collectionName, encodingType="BSON", level=validationLevel)
+                if bsonSchema and overflowDocumentSize:
+                    bsonSchema = DocumentOverflowUtil().addOverflowSchema(bsonSchema, encodingType="BSON")
+                setupArgL.append((databaseName, collectionName, setupLoadType, indexDL, bsonSchema, updateSchemaOnReplace, overflowDocumentSize))
+            #
+            if concurrentCollections and len(setupArgL) > 1:
+                with ThreadPoolExecutor(max_workers=len(setupArgL)) as executor:
+                    setupOkL = list(executor.map(lambda args: self.__setupCollection(*args), setupArgL))
+            else:
+                setupOkL = [self.__setupCollection(*args) for args in setupArgL]
+            logger.debug("Collection setup return status %r", setupOkL)
+            self.__loadMetrics.addTime("setup", time.time() - setupStartTime)
+            failSetupL = [collectionName for collectionName, setupOk in zip(collectionNameList, setupOkL) if collectionName in fullSetupL and not setupOk]
+            if failSetupL:
+                logger.error("Collection setup failing for %s collections %r - changed entry load aborted", databaseName, failSetupL)
+                return False
             #
             dtf = DataTransformFactory(schemaDefAccessObj=sd, filterType=filterType)
             optD["schemaDefAccess"] = sd
@@ -663,14 +756,17 @@ class PdbxLoader(object):
                 numLists = max(numLists, numProc)
                 subLists = [locatorObjList[i::numLists] for i in range(numLists)]
             else:
-                subLists = [locatorObjList]
+                subLists = [locatorObjList] if locatorObjList or not changedEntriesOnly else []
             #
             if subLists:
                 logger.info("Starting load of %s (%r) using numProc %d outer subtask count %d subtask length %d", databaseName, loadType, numProc, len(subLists), len(subLists[0]))
+            elif changedEntriesOnly:
+                logger.info("No changed entries to load for %s", databaseName)
             else:
                 logger.error("Path partitioning fails for %s (%r) using numProc %d", databaseName, loadType, numProc)
             #
             failList = []
+            rejectPathList = []
             for ii, subList in enumerate(subLists):
                 logger.info("Running outer subtask %d of %d length %d", ii + 1, len(subLists), len(subList))
                 #
@@ -679,7 +775,10 @@ class PdbxLoader(object):
                 mpu.setWorkingDir(self.__cachePath)
                 mpu.setOptions(optionsD=optD)
                 mpu.set(workerObj=self, workerMethod="loadWorker")
-                ok, failListT, _, _ = mpu.runMulti(dataList=subList, numProc=numProc, numResults=1, chunkSize=chunkSize)
+                ok, failListT, retListsT, _ = mpu.runMulti(dataList=subList, numProc=numProc, numResults=2, chunkSize=chunkSize)
+                for metricsD in retListsT[0]:
+                    self.__loadMetrics.merge(metricsD)
+                rejectPathList.extend(retListsT[1])
                 logger.info("Completed outer subtask %d of %d length %d with failure count %d status %r", ii + 1, len(subLists), len(subList), len(failListT), ok)
                 failList.extend(failListT)
             failList = list(set(failList))
@@ -691,8 +790,16 @@ class PdbxLoader(object):
                 logger.info("Writing failure path %s length %d status %r", failedFilePath, len(failList), wOk)
             #
             ok = len(failList) == 0
+            if changedEntriesOnly:
+                skipPathList = failedPathList + rejectPathList
+                ok = self.__updateChangedEntries(databaseName, collectionNameList, overflowDocumentSize, lw, stateD, diffD, locatorObjList, skipPathList, compareDigest) and ok
             self.__end(startTime, "Loading operation completed with status " + str(ok))
             #
+            if metricsFilePath:
+                labelD = {"database": databaseName, "load_type": loadType, "collections": ",".join(collectionNameList)}
+                mOk = self.__loadMetrics.write(metricsFilePath, fmt=metricsFormat, labelD=labelD, elapsedSeconds=time.time() - startTime)
+                logger.info("Writing load metrics %s (%s) status %r", metricsFilePath, metricsFormat, mOk)
+            #
             # Create the status objects for the current operations
             # ----
             sFlag = "Y" if ok else "N"
@@ -719,6 +826,10 @@ class PdbxLoader(object):
     def getLoadStatus(self):
         return self.__statusList
 
+    def getLoadMetrics(self):
+        """Return the merged per-stage timing and volume metrics for the last load operation."""
+        return self.__loadMetrics.getMetrics()
+
     def loadWorker(self, dataList, procName, optionsD, workingDir):
         """ Multi-proc worker method for MongoDb loading -
 
@@ -727,148 +838,173 @@ class PdbxLoader(object):
         locatorObjList -> containerList -> docList  ->|LOAD|<-  .... return success locatorObjList
 
         """
+        writer = None
+        prefetcher = None
         try:
             startTime = self.__begin(message=procName)
             # Recover common options
             styleType = optionsD["styleType"]
             filterType = optionsD["filterType"]
-            readBackCheck = optionsD["readBackCheck"]
             logSize = "logSize" in optionsD and optionsD["logSize"]
             dataSelectors = optionsD["dataSelectors"]
             loadType = optionsD["loadType"]
             databaseName = optionsD["databaseName"]
-            pruneDocumentSize = optionsD["pruneDocumentSize"]
             sd = optionsD["schemaDefAccess"]
             dtf = optionsD["dataTransformFactory"]
             collectionNameList = optionsD["collectionNameList"]
             useNameFlag = optionsD["useNameFlag"]
-            validationLevel = optionsD["validationLevel"]
-            validateFailures = optionsD["validateFailures"]
-            reloadPartial = optionsD["reloadPartial"]
+            overflowDocumentSize = optionsD.get("overflowDocumentSize", None)
+            concurrentCollections = optionsD.get("concurrentCollections", False)
+            pipelineQueueSizeMB = optionsD.get("pipelineQueueSizeMB", None)
+            pipelineBatchSize = max(1, optionsD.get("pipelineBatchSize", 2))
+            collectMetrics = optionsD.get("collectMetrics", False)
+            metrics = LoadMetrics()
+            # Collections purged by container identifier include any overflow collections
+            purgeCollectionNameList = collectionNameList
+            if overflowDocumentSize:
+                purgeCollectionNameList = collectionNameList + [DocumentOverflowUtil().getOverflowCollectionName(cN) for cN in collectionNameList]
             #
             sdp = SchemaDefDataPrep(schemaDefAccessObj=sd, dtObj=dtf, workPath=workingDir, verbose=self.__verbose)
+            #
+            # Documents are handed to background writer threads (one per collection for concurrentCollections) while
+            # the next batch of entries is parsed and transformed.  Without a writer the worker input is a single batch.
+            if pipelineQueueSizeMB or (concurrentCollections and len(collectionNameList) > 1):
+                streamNames = collectionNameList if concurrentCollections else None
+                writer = WriterPipeline(self.__loadCollection, streamNames=streamNames, maxQueueMB=pipelineQueueSizeMB)
+            batchList = [dataList[ii : ii + pipelineBatchSize] for ii in range(0, len(dataList), pipelineBatchSize)] if writer else [dataList]
+            # The input files of the following entries are read on a background thread while the current entry is processed
+            prefetcher = self.__rpP.getLocatorPrefetcher(dataList)
+            locatorIter = iter(prefetcher) if prefetcher else iter(dataList)
             # -------------------------------------------
             # -- Create map of  cIdD{ container identifier} =  locatorObj
             #
             collectionName = None
             cIdD = {}
-            cNameL = []
-            containerList = []
-            for locatorObj in dataList:
-                # JDW
-                cL = self.__rpP.getContainerList([locatorObj])
-                if cL:
-                    cNameL.append(cL[0].getName().upper().strip())
-                    cId = cL[0].getName() if useNameFlag else cL[0].getProp("uid")
-                    cIdD[cId] = locatorObj
-                    containerList.extend(cL)
-            # -- Apply methods to each container -
-            for container in containerList:
-                if self.__dmh:
-                    self.__dmh.apply(container)
-                else:
-                    logger.debug("%s No dynamic method handler for ", procName)
-            # -----
-            if loadType != "full":
-                for collectionName in collectionNameList:
-                    logger.debug("Purging objects from %s for %d containers", collectionName, len(cNameL))
-                    ok = self.__purgeDocuments(databaseName, collectionName, cNameL)
-                    logger.debug("%s %s - loadType %r cNameL %r (%r)", databaseName, collectionName, loadType, cNameL, ok)
-                    # --
-            # -----
             failContainerIdS = set()
             rejectContainerIdS = set()
             cardinalIdFailS = set()
-            # -----
-            for collectionName in collectionNameList:
-                ok = True
-                # ---------------- - ---------------- - ---------------- - ---------------- - ---------------- -
-                docIdL = sd.getDocumentKeyAttributeNames(collectionName)
-                replaceIdL = sd.getDocumentReplaceAttributeNames(collectionName)
-                #
-                tableIdExcludeList = sd.getCollectionExcluded(collectionName)
-                tableIdIncludeList = sd.getCollectionSelected(collectionName)
-                sliceFilter = sd.getCollectionSliceFilter(collectionName)
-                sdp.setSchemaIdExcludeList(tableIdExcludeList)
-                sdp.setSchemaIdIncludeList(tableIdIncludeList)
-                #
-                logger.debug("%s databaseName %s collectionName %s slice filter %s", procName, databaseName, collectionName, sliceFilter)
-                logger.debug("%s databaseName %s include list %r", procName, databaseName, tableIdIncludeList)
-                logger.debug("%s databaseName %s exclude list %r", procName, databaseName, tableIdExcludeList)
-                #
-                dList, containerIdList, rejectIdList = sdp.processDocuments(
-                    containerList,
-                    styleType=styleType,
-                    filterType=filterType,
-                    dataSelectors=dataSelectors,
-                    sliceFilter=sliceFilter,
-                    useNameFlag=useNameFlag,
-                    collectionName=collectionName,
-                )
-                #
-                # -- JDWJDW
-                # logger.info("loadType %r collectionName %r replaceIdL %r idList %r", loadType, collectionName, replaceIdL, containerIdList)
-                # --
-                # ------
-                # Collect the container identifiers for the rejected containers (paths for logging only)
-                # Note that rejections are NOT treated as failures!
-                #
-                rejectPathList = []
-                for cId in rejectIdList:
-                    rejectContainerIdS.add(cId)
-                    locObj = cIdD[cId]
-                    rejectPathList.extend(self.__rpP.getLocatorPaths([locObj], locatorIndex=0))
-                rejectPathList = list(set(rejectPathList))
-                #
-                if logSize:
-                    self.__logDocumentSize(procName, dList, docIdL)
-
-                dList = sdp.addDocumentPrivateAttributes(dList, collectionName)
-                dList = sdp.addDocumentSubCategoryAggregates(dList, collectionName)
-                #
-                # --- And after adjustments create index
-                #     to map dList -> containerNamList  using dList(uniqId) -> containterName
-                #
-                indexDoc = {}
-                try:
-                    for dD, cId in zip(dList, containerIdList):
-                        dIdTup = self.__getKeyValues(dD, docIdL)
-                        indexDoc[dIdTup] = cId
-                except Exception as e:
-                    logger.exception("Failing cN %r  dD %r with %s", cId, dD, str(e))
-
-                #
-                if dList:
-                    ok, _, failDocIdS = self.__loadDocuments(
-                        databaseName, collectionName, dList, docIdL, replaceIdL=replaceIdL, loadType=loadType, readBackCheck=readBackCheck, pruneDocumentSize=pruneDocumentSize
+            # list of (collectionName, failed document identifier set or future, indexDoc, rejectPathList)
+            writeResultList = []
+            for batch in batchList:
+                cNameL = []
+                if collectMetrics:
+                    metrics.addCount("input_bytes", self.__getInputSize(batch))
+                # -----
+                # Containers are read on demand and released once their documents are generated.
+                # For multiple collections map the tables of each container once and project the result onto each collection
+                batchIter = itertools.islice(locatorIter, len(batch))
+                containerIter = self.__iterContainers(procName, batchIter, cIdD, cNameL, useNameFlag, metrics)
+                if len(collectionNameList) > 1:
+                    docIter = sdp.processDocumentsMultiIter(
+                        containerIter, collectionNameList, styleType=styleType, filterType=filterType, dataSelectors=dataSelectors, useNameFlag=useNameFlag,
                     )
-                #
-                if failDocIdS:
-
-                    logger.info("Initial load failures: %r", failDocIdS)
-                    fList = []
-                    for dD in dList:
-                        tId = self.__getKeyValues(dD, docIdL)
-                        if tId in failDocIdS:
-                            fList.append(dD)
-                            if validateFailures:
-                                logger.info("Validating document %r", tId)
-                                self.__validateDocuments(databaseName, collectionName, [dD], docIdL, schemaLevel=validationLevel)
+                elif collectionNameList:
+                    collectionName = collectionNameList[0]
+                    sliceFilter = sd.getCollectionSliceFilter(collectionName)
+                    sdp.setSchemaIdExcludeList(sd.getCollectionExcluded(collectionName))
+                    sdp.setSchemaIdIncludeList(sd.getCollectionSelected(collectionName))
+                    logger.debug("%s databaseName %s collectionName %s slice filter %s", procName, databaseName, collectionName, sliceFilter)
+                    docIter = sdp.processDocumentsIter(
+                        containerIter,
+                        styleType=styleType,
+                        filterType=filterType,
+                        dataSelectors=dataSelectors,
+                        sliceFilter=sliceFilter,
+                        useNameFlag=useNameFlag,
+                        collectionName=collectionName,
+                    )
+                else:
+                    docIter = []
+                    for _ in containerIter:
+                        pass
+                docD = {collectionName: ([], []) for collectionName in collectionNameList}
+                rejectIdS = set()
+                mapStartTime = time.time()
+                readSeconds = metrics.getTime("parse") + metrics.getTime("dict_methods")
+                for cId, cName, doc in docIter:
+                    if doc is None:
+                        rejectIdS.add(cId)
+                    else:
+                        docD[cName][0].append(doc)
+                        docD[cName][1].append(cId)
+                # skip any locators of this batch that were not read (keeping the shared locator iterator aligned with the batches)
+                for _ in batchIter:
+                    pass
+                readSeconds = metrics.getTime("parse") + metrics.getTime("dict_methods") - readSeconds
+                metrics.addTime("schema_mapping", max(0.0, time.time() - mapStartTime - readSeconds))
+                # -----
+                if loadType != "full":
+                    with metrics.timer("purge"):
+                        for collectionName in purgeCollectionNameList:
+                            logger.debug("Purging objects from %s for %d containers", collectionName, len(cNameL))
+                            ok = self.__purgeDocuments(databaseName, collectionName, cNameL)
+                            logger.debug("%s %s - loadType %r cNameL %r (%r)", databaseName, collectionName, loadType, cNameL, ok)
+                            # --
+                # -----
+                for collectionName in collectionNameList:
+                    # ---------------- - ---------------- - ---------------- - ---------------- - ---------------- -
+                    docIdL = sd.getDocumentKeyAttributeNames(collectionName)
+                    replaceIdL = sd.getDocumentReplaceAttributeNames(collectionName)
+                    dList, containerIdList = docD[collectionName]
+                    rejectIdList = list(rejectIdS)
+                    #
+                    # -- JDWJDW
+                    # logger.info("loadType %r collectionName %r replaceIdL %r idList %r", loadType, collectionName, replaceIdL, containerIdList)
+                    # --
+                    # ------
+                    # Collect the container identifiers for the rejected containers (paths for logging only)
+                    # Note that rejections are NOT treated as failures!
                     #
-                    #  -- Try and repair failDocIdS --
+                    rejectPathList = []
+                    for cId in rejectIdList:
+                        rejectContainerIdS.add(cId)
+                        locObj = cIdD[cId]
+                        rejectPathList.extend(self.__rpP.getLocatorPaths([locObj], locatorIndex=0))
+                    rejectPathList = list(set(rejectPathList))
                     #
-                    if reloadPartial:
-                        logger.debug("Attempting corrections on documents %r", failDocIdS)
-                        fList = self.__validateAndFix(databaseName, collectionName, fList, docIdL, schemaLevel=validationLevel)
-
-                        fOk, _, failDocIdS = self.__loadDocuments(
-                            databaseName, collectionName, fList, docIdL, replaceIdL=replaceIdL, loadType=loadType, readBackCheck=readBackCheck, pruneDocumentSize=pruneDocumentSize
-                        )
-                        logger.info("Final load (%r) failures: %r", fOk, failDocIdS)
+                    if logSize:
+                        self.__logDocumentSize(procName, dList, docIdL)
+
+                    with metrics.timer("aggregates"):
+                        dList = sdp.addDocumentPrivateAttributes(dList, collectionName)
+                        dList = sdp.addDocumentSubCategoryAggregates(dList, collectionName)
+                    metrics.addCount("documents", len(dList))
+                    docBytes = self.__getDocumentSize(dList) if collectMetrics or pipelineQueueSizeMB else 0
+                    if collectMetrics:
+                        metrics.addCount("document_bytes", docBytes)
+                    #
+                    # --- And after adjustments create index
+                    #     to map dList -> containerNamList  using dList(uniqId) -> containterName
+                    #
+                    indexDoc = {}
+                    try:
+                        for dD, cId in zip(dList, containerIdList):
+                            dIdTup = self.__getKeyValues(dD, docIdL)
+                            indexDoc[dIdTup] = cId
+                    except Exception as e:
+                        logger.exception("Failing cN %r  dD %r with %s", cId, dD, str(e))
 
+                    #
+                    if writer:
+                        with metrics.timer("writer_wait"):
+                            fut = writer.submit(collectionName, docBytes, databaseName, collectionName, dList, docIdL, replaceIdL, optionsD, metrics)
+                        writeResultList.append((collectionName, fut, indexDoc, rejectPathList))
+                    else:
+                        failDocIdS = self.__loadCollection(databaseName, collectionName, dList, docIdL, replaceIdL, optionsD, metrics)
+                        writeResultList.append((collectionName, failDocIdS, indexDoc, rejectPathList))
+            #
+            if prefetcher:
+                prefetcher.close()
+            if writer:
+                with metrics.timer("writer_wait"):
+                    writer.close()
+            for collectionName, failDocIdS, indexDoc, rejectPathList in writeResultList:
+                if writer:
+                    failDocIdS = failDocIdS.result()
                 # ------
                 # Collect the container identifiers for the successful loads (paths for logging only)
                 #
+                metrics.addCount("failed_documents", len(failDocIdS))
                 failPathList = []
                 for dId in failDocIdS:
                     cId = indexDoc[dId]
@@ -890,27 +1026,153 @@ class PdbxLoader(object):
             #  cIdD[cId] = locatorObj
             # ----
             retList = [locatorObj for cId, locatorObj in cIdD.items() if cId not in failContainerIdS]
+            # rejected entry paths are returned so that these entries are not recorded as loaded in any load watermark
+            rejectPathList = self.__rpP.getLocatorPaths([cIdD[cId] for cId in rejectContainerIdS], locatorIndex=0)
             logger.debug("%s %s load worker returns  successes %d rejects %d failures %d", procName, databaseName, len(retList), len(rejectContainerIdS), len(failContainerIdS))
+            metrics.addCount("rejected_containers", len(rejectContainerIdS))
             #
             if cardinalIdFailS:
                 # remove all collection objects related to a load failure
-                for collectionName in collectionNameList:
-                    logger.info("Purging all objects from %s for failed ids: %r", collectionName, cardinalIdFailS)
-                    ok = self.__purgeDocuments(databaseName, collectionName, list(cardinalIdFailS))
+                with metrics.timer("purge"):
+                    for collectionName in purgeCollectionNameList:
+                        logger.info("Purging all objects from %s for failed ids: %r", collectionName, cardinalIdFailS)
+                        ok = self.__purgeDocuments(databaseName, collectionName, list(cardinalIdFailS))
             #
             ok = len(failContainerIdS) == 0
+            metrics.addCount("failed_containers", len(failContainerIdS))
             self.__end(startTime, procName + " with status " + str(ok))
-            return retList, [], []
+            return retList, [metrics.getMetrics()], rejectPathList, []
 
         except Exception as e:
             # logger.error("Failing for dataList %r" % dataList)
             logger.exception("Failing with %s", str(e))
+            if prefetcher:
+                prefetcher.close()
+            if writer:
+                writer.close()
 
-        return [], [], []
+        return [], [], [], []
 
     # -------------- -------------- -------------- -------------- -------------- -------------- --------------
     #                                        ---  Supporting code follows ---
     #
+    def __getWatermarkPath(self, databaseName):
+        return os.path.join(self.__cachePath if self.__cachePath else ".", "%s-%s-load-watermark.pic" % (self.__resourceName, databaseName))
+
+    def __updateChangedEntries(self, databaseName, collectionNameList, overflowDocumentSize, lw, stateD, diffD, locatorObjList, skipPathList, compareDigest):
+        """Purge the documents of entries removed from the repository and record the file state of the successfully
+        loaded and purged entries in the load watermark.  Entries with failed or rejected (data selector) loads in
+        skipPathList are not recorded (the documents of rejected entries are purged by the worker).
+        """
+        ok = True
+        removedIdList = []
+        if diffD["removed"]:
+            purgeCollectionNameList = collectionNameList
+            if overflowDocumentSize:
+                purgeCollectionNameList = collectionNameList + [DocumentOverflowUtil().getOverflowCollectionName(cN) for cN in collectionNameList]
+            with self.__loadMetrics.timer("purge"):
+                for collectionName in purgeCollectionNameList:
+                    ok = self.__purgeDocuments(databaseName, collectionName, diffD["removed"]) and ok
+            removedIdList = diffD["removed"] if ok else []
+            logger.info("Purging %d removed entries from %s status %r", len(diffD["removed"]), databaseName, ok)
+        #
+        skipIdS = set([entryFileId(os.path.basename(pth)) for pth in skipPathList])
+        loadedIdList = [idCode for idCode in [entryFileId(os.path.basename(pth)) for pth in self.__rpP.getLocatorPaths(locatorObjList)] if idCode and idCode not in skipIdS]
+        wOk = lw.update(stateD, collectionNameList, loadedIdList, removedIdList, useDigest=compareDigest)
+        logger.info("Updating load watermark for %s with %d loaded and %d removed entries status %r", databaseName, len(loadedIdList), len(removedIdList), wOk)
+        return ok and wOk
+
+    def __iterContainers(self, procName, locatorObjList, cIdD, cNameL, useNameFlag, metrics):
+        """Generate the data containers for the input locators one locator at a time applying any dictionary methods.
+
+        The container identifier index (cIdD) and the upper case container name list (cNameL) are updated as
+        each locator is read.
+        """
+        for locatorObj in locatorObjList:
+            with metrics.timer("parse"):
+                cL = self.__rpP.getContainerList([locatorObj])
+            if not cL:
+                continue
+            cNameL.append(cL[0].getName().upper().strip())
+            cId = cL[0].getName() if useNameFlag else cL[0].getProp("uid")
+            cIdD[cId] = locatorObj
+            metrics.addCount("containers", len(cL))
+            # -- Apply methods to each container -
+            with metrics.timer("dict_methods"):
+                for container in cL:
+                    if self.__dmh:
+                        self.__dmh.apply(container)
+                    else:
+                        logger.debug("%s No dynamic method handler for ", procName)
+            for container in cL:
+                yield container
+
+    def __loadCollection(self, databaseName, collectionName, dList, docIdL, replaceIdL, optionsD, metrics):
+        """Load the input documents into a single collection then validate and attempt to repair any load failures.
+
+        This method is run on a collection writer thread when collections are loaded concurrently.
+
+        Returns:
+            set: key value tuples for documents which could not be loaded
+        """
+        loadType = optionsD["loadType"]
+        readBackCheck = optionsD["readBackCheck"]
+        pruneDocumentSize = optionsD["pruneDocumentSize"]
+        validationLevel = optionsD["validationLevel"]
+        validateFailures = optionsD["validateFailures"]
+        reloadPartial = optionsD["reloadPartial"]
+        overflowDocumentSize = optionsD.get("overflowDocumentSize", None)
+        failDocIdS = set()
+        if not dList:
+            return failDocIdS
+        #
+        _, _, failDocIdS = self.__loadDocuments(
+            databaseName,
+            collectionName,
+            dList,
+            docIdL,
+            replaceIdL=replaceIdL,
+            loadType=loadType,
+            readBackCheck=readBackCheck,
+            pruneDocumentSize=pruneDocumentSize,
+            overflowDocumentSize=overflowDocumentSize,
+            metrics=metrics,
+        )
+        #
+        if failDocIdS:
+            logger.info("Initial load failures: %r", failDocIdS)
+            fList = []
+            for dD in dList:
+                tId = self.__getKeyValues(dD, docIdL)
+                if tId in failDocIdS:
+                    fList.append(dD)
+                    if validateFailures:
+                        logger.info("Validating document %r", tId)
+                        with metrics.timer("validation"):
+                            self.__validateDocuments(databaseName, collectionName, [dD], docIdL, schemaLevel=validationLevel)
+            #
+            #  -- Try and repair failDocIdS --
+            #
+            if reloadPartial:
+                logger.debug("Attempting corrections on documents %r", failDocIdS)
+                with metrics.timer("validation"):
+                    fList = self.__validateAndFix(databaseName, collectionName, fList, docIdL, schemaLevel=validationLevel)
+
+                fOk, _, failDocIdS = self.__loadDocuments(
+                    databaseName,
+                    collectionName,
+                    fList,
+                    docIdL,
+                    replaceIdL=replaceIdL,
+                    loadType=loadType,
+                    readBackCheck=readBackCheck,
+                    pruneDocumentSize=pruneDocumentSize,
+                    overflowDocumentSize=overflowDocumentSize,
+                    metrics=metrics,
+                )
+                logger.info("Final load (%r) failures: %r", fOk, failDocIdS)
+        return failDocIdS
+
     def __validateAndFix(self, databaseName, collectionName, dList, docIdL, schemaLevel="full"):
         """[summary]
 
@@ -1010,6 +1272,26 @@ class PdbxLoader(object):
                 logger.exception("Validation processing error %s", str(e))
         return eCount
 
+    def __getInputSize(self, locatorObjList):
+        """Return the total size (bytes) of the local input files referenced by the input locator list."""
+        numBytes = 0
+        for pth in self.__rpP.getLocatorPaths(locatorObjList):
+            try:
+                numBytes += os.path.getsize(pth)
+            except Exception:
+                pass
+        return numBytes
+
+    def __getDocumentSize(self, dList):
+        """Return the total BSON encoded size (bytes) of the input document list."""
+        numBytes = 0
+        for dD in dList:
+            try:
+                numBytes += len(bson.BSON.encode(dD))
+            except Exception:
+                pass
+        return numBytes
+
     def __logDocumentSize(self, procName, dList, docIdL):
         maxDocumentMegaBytes = -1
         thresholdMB = 15.8
@@ -1077,6 +1359,50 @@ class PdbxLoader(object):
             logger.exception("Failing with %s", str(e))
         return False
 
+    def __collectionExists(self, databaseName, collectionName):
+        """Return True if the input collection exists -
+        """
+        try:
+            with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName) as client:
+                mg = MongoDbUtil(client)
+                return mg.collectionExists(databaseName, collectionName)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+        return False
+
+    def __setupCollection(self, databaseName, collectionName, loadType, indexDL, bsonSchema, updateSchemaOnReplace, overflowDocumentSize):
+        """Create (loadType='full') or update the validation schema (loadType='replace') for the input collection."""
+        ok = True
+        if loadType == "full":
+            self.__removeCollection(databaseName, collectionName)
+            ok = self.__createCollection(databaseName, collectionName, indexDL=indexDL, bsonSchema=bsonSchema)
+            logger.debug("Collection create return status %r", ok)
+        elif loadType == "replace" and updateSchemaOnReplace and bsonSchema:
+            ok = self.__updateCollectionSchema(databaseName, collectionName, bsonSchema=bsonSchema)
+            if not ok:
+                logger.info("Schema update failing for %s (%s)", databaseName, collectionName)
+        if overflowDocumentSize:
+            oOk = self.__createOverflowCollection(databaseName, collectionName, overWrite=loadType == "full")
+            logger.debug("Overflow collection create return status %r", oOk)
+            ok = ok and oOk
+        return ok
+
+    def __createOverflowCollection(self, databaseName, collectionName, overWrite=True):
+        """Create the overflow collection for the input parent collection and index on parent document identifier -
+        """
+        try:
+            overflowCollectionName = DocumentOverflowUtil().getOverflowCollectionName(collectionName)
+            with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName) as client:
+                mg = MongoDbUtil(client)
+                if not overWrite and mg.collectionExists(databaseName, overflowCollectionName):
+                    return True
+                ok1 = mg.createCollection(databaseName, overflowCollectionName, overWrite=overWrite)
+                ok2 = mg.createIndex(databaseName, overflowCollectionName, ["_parent_id"], indexName="parent", indexType="DESCENDING", uniqueFlag=False)
+            return ok1 and ok2
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+        return False
+
     def __updateCollectionSchema(self, databaseName, collectionName, bsonSchema=None, validationLevel="strict", validationAction="error"):
         """Update validation schema for the input collection -
         """
@@ -1169,32 +1495,58 @@ class PdbxLoader(object):
         logger.debug("Pruning returns document list length %d", len(dList))
         return oL
 
-    def __loadDocuments(self, databaseName, collectionName, dList, docIdL, replaceIdL=None, loadType="full", readBackCheck=False, pruneDocumentSize=None):
+    def __loadDocuments(
+        self,
+        databaseName,
+        collectionName,
+        dList,
+        docIdL,
+        replaceIdL=None,
+        loadType="full",
+        readBackCheck=False,
+        pruneDocumentSize=None,
+        overflowDocumentSize=None,
+        metrics=None,
+    ):
         #
         # Load database/collection with input document list -
         #
         rIdL = []
+        oDList = []
+        dou = DocumentOverflowUtil(limitMB=overflowDocumentSize, keyNames=list(set(docIdL + (replaceIdL if replaceIdL else [])))) if overflowDocumentSize else None
+        metrics = metrics if metrics else LoadMetrics()
 
         logger.debug("databaseName %s collectionName %s docIdL %r", databaseName, collectionName, docIdL)
         inputDocIdS = {self.__getKeyValues(dD, docIdL) for dD in dList}
         failDocIdS = set()
         successDocIdS = set()
+        rejectDocIdS = set()
 
         try:
             with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName) as client:
                 mg = MongoDbUtil(client)
                 #
                 if loadType == "replace" and replaceIdL:
-                    deleteTupL = mg.deleteList(databaseName, collectionName, dList, replaceIdL)
-                    logger.debug("Deleted document status %r", deleteTupL)
-                if pruneDocumentSize:
-                    dList = self.__pruneBySize(dList, limitMB=pruneDocumentSize)
+                    with metrics.timer("purge"):
+                        deleteTupL = mg.deleteList(databaseName, collectionName, dList, replaceIdL)
+                        logger.debug("Deleted document status %r", deleteTupL)
+                        if dou:
+                            deleteTupL = mg.deleteList(databaseName, dou.getOverflowCollectionName(collectionName), dList, replaceIdL)
+                            logger.debug("Deleted overflow document status %r", deleteTupL)
+                if dou:
+                    with metrics.timer("overflow"):
+                        dList, oDList, rejectList = dou.detach(dList)
+                    rejectDocIdS = {self.__getKeyValues(dD, docIdL) for dD in rejectList}
+                elif pruneDocumentSize:
+                    with metrics.timer("prune"):
+                        dList = self.__pruneBySize(dList, limitMB=pruneDocumentSize)
                 #
-                rIdL.extend(mg.insertList(databaseName, collectionName, dList, keyNames=docIdL, salvage=True))
+                with metrics.timer("insert"):
+                    rIdL.extend(mg.insertList(databaseName, collectionName, dList, keyNames=docIdL, salvage=True))
                 # ---
                 #  If there is a failure then determine the specific successes and failures -
                 #
-                successDocIdS = inputDocIdS
+                successDocIdS = inputDocIdS - rejectDocIdS
                 if len(rIdL) != len(dList):
                     sIdS = set()
                     try:
@@ -1208,9 +1560,15 @@ class PdbxLoader(object):
                 # enumerate the failures
                 failDocIdS = inputDocIdS - successDocIdS
                 #
-
+                if oDList:
+                    with metrics.timer("insert"):
+                        ovFailDocIdS = self.__loadOverflowDocuments(mg, databaseName, dou.getOverflowCollectionName(collectionName), dList, docIdL, oDList, rIdL)
+                    metrics.addCount("overflow_documents", len(oDList))
+                    successDocIdS = successDocIdS - ovFailDocIdS
+                    failDocIdS = failDocIdS | ovFailDocIdS
                 #
                 if readBackCheck:
+                    readBackStartTime = time.time()
                     # build an index of the input document list
                     indD = {}
                     try:
@@ -1231,16 +1589,33 @@ class PdbxLoader(object):
                         if rObj != dList[jj]:
                             rbStatus = False
                             break
+                    metrics.addTime("readback", time.time() - readBackStartTime)
                 #
                 if readBackCheck and not rbStatus:
                     return False, successDocIdS, failDocIdS
                 #
-            return len(rIdL) == len(dList), successDocIdS, failDocIdS
+            return len(rIdL) == len(dList) and not rejectDocIdS, successDocIdS, failDocIdS
         except Exception as e:
             logger.exception("Failing with %s", str(e))
 
         return False, [], inputDocIdS
 
+    def __loadOverflowDocuments(self, mg, databaseName, overflowCollectionName, dList, docIdL, oDList, rIdL):
+        """Load overflow documents for successfully inserted parent documents and return the key tuples of any
+        parent documents with incomplete overflow content.
+        """
+        failDocIdS = set()
+        try:
+            parentIdS = set(rIdL)
+            oDL = [oD for oD in oDList if oD["_parent_id"] in parentIdS]
+            orIdS = set(mg.insertList(databaseName, overflowCollectionName, oDL, keyNames=["_parent_id", "overflow_key", "overflow_part"], salvage=True))
+            failParentIdS = {oD["_parent_id"] for oD in oDL if oD.get("_id", None) not in orIdS}
+            failDocIdS = {self.__getKeyValues(dD, docIdL) for dD in dList if dD.get("_id", None) in failParentIdS}
+            logger.debug("Loaded overflow documents %d of %d (parent failures %d)", len(orIdS), len(oDL), len(failDocIdS))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+        return failDocIdS
+
     def __getKeyValues(self, dct, keyNames):
         """Return the tuple of values corresponding to the input dictionary of key names expressed in dot notation.
 
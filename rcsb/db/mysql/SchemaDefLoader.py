@@ -25,6 +25,8 @@
 # 11-Nov-2018 jdw  add DrugBank and CCDC mapping path details.
 # 31-Mar-2019 jdw add more speific tests for null value suggested by
 #                 issue = MySQL SchemaDefLoader skip zero values #19
+# 18-Oct-2026 agent add optional binary cache of parsed containers
+# 18-Oct-2026 agent add optional read-ahead of input files (prefetchCount)
 ##
 """
 Generic mapper of PDBx/mmCIF instance data to SQL loadable data files based on external
@@ -60,7 +62,22 @@ class SchemaDefLoader(object):
     """ Map PDBx/mmCIF instance data to SQL loadable data using external schema definition.
     """
 
-    def __init__(self, cfgOb, schemaDefObj, cfgSectionName="site_info_configuration", dbCon=None, cachePath=".", workPath=".", cleanUp=False, warnings="default", verbose=True):
+    def __init__(
+        self,
+        cfgOb,
+        schemaDefObj,
+        cfgSectionName="site_info_configuration",
+        dbCon=None,
+        cachePath=".",
+        workPath=".",
+        cleanUp=False,
+        warnings="default",
+        verbose=True,
+        containerCachePath=None,
+        containerCacheSizeMB=None,
+        prefetchCount=0,
+        prefetchSizeMB=64,
+    ):
         self.__verbose = verbose
         self.__debug = False
         self.__cfgOb = cfgOb
@@ -84,7 +101,14 @@ class SchemaDefLoader(object):
         self.__warningAction = warnings
         dtf = DataTransformFactory(schemaDefAccessObj=self.__sD, filterType=self.__fTypeRow)
         self.__sdp = SchemaDefDataPrep(schemaDefAccessObj=self.__sD, dtObj=dtf, workPath=self.__cachePath, verbose=self.__verbose)
-        self.__rpP = RepositoryProvider(cfgOb=self.__cfgOb, cachePath=self.__cachePath)
+        self.__rpP = RepositoryProvider(
+            cfgOb=self.__cfgOb,
+            cachePath=self.__cachePath,
+            containerCachePath=containerCachePath,
+            containerCacheSizeMB=containerCacheSizeMB,
+            prefetchCount=prefetchCount,
+            prefetchSizeMB=prefetchSizeMB,
+        )
         #
         schemaName = self.__sD.getName()
         modulePathMap = self.__cfgOb.get("DICT_METHOD_HELPER_MODULE_PATH_MAP", sectionName=sectionName)
@@ -12,6 +12,14 @@
 #                 Refactor time critical sections of processRecords()
 #                 to minimize costly functon calls for simple casts.
 # 24-Mar-2019 jdw adjust null value filtering
+# 18-Oct-2026 agent add compiled per-table row transformers (getRowTransformer()) replacing per-attribute
+#                   lookups and functools.reduce() in processRecord()
+# 18-Oct-2026 agent add memoized fast path parsing for mmCIF date and date-time values
+# 18-Oct-2026 agent bind precomputed enumeration normalization maps into the cast step for enumerated strings
+# 18-Oct-2026 agent add option to key transformed rows by schema attribute name with attribute exclusions
+# 18-Oct-2026 agent return unchanged values from string casts, truncation, white space and character
+#                   reference filters without allocating new values
+# 18-Oct-2026 agent remove the unused white space pattern in DataTransform()
 ##
 """
 Factory for functional elements of the transformations between input data and
@@ -25,9 +33,10 @@ __license__ = "Apache 2.0"
 
 
 import collections
+import datetime
+import functools
 import logging
 import re
-from functools import reduce
 
 import dateutil.parser
 import pytz
@@ -35,8 +44,40 @@ from rcsb.db.utils.TextUtil import unescapeXmlCharRef
 
 TrfValue = collections.namedtuple("TrfValue", "value, atId, origLength, isNull")
 
+# mmCIF null value tokens
+_NULL_TOKENS = frozenset(["?", ".", ""])
+
 logger = logging.getLogger(__name__)
 
+# mmCIF date and date-time grammar  yyyy-mm-dd[:hh:mm[:ss]]
+DATE_PATTERN = re.compile(r"^(\d{4})-(\d{2})-(\d{2})(?::(\d{2}):(\d{2})(?::(\d{2}))?)?$")
+
+
+@functools.lru_cache(maxsize=8192)
+def parseDate(value):
+    """ Return a datetime object for the input date (optional time) string (yyyy-mm-dd:hh:mm:ss).
+
+        Values following the mmCIF date grammar are parsed directly, other values are parsed using dateutil.
+        Results are memoized as the same dates recur across many rows and containers.
+    """
+    mObj = DATE_PATTERN.match(value)
+    if mObj:
+        try:
+            return datetime.datetime(*[int(v) for v in mObj.groups() if v is not None])
+        except ValueError:
+            pass
+    return dateutil.parser.parse(value.replace(":", " ", 1))
+
+
+@functools.lru_cache(maxsize=8192)
+def castDateTimeToIsoString(value):
+    return parseDate(value).replace(tzinfo=pytz.UTC).isoformat()
+
+
+@functools.lru_cache(maxsize=8192)
+def castDateToIsoString(value):
+    return parseDate(value).isoformat()[:10]
+
 
 class DataTransformInfo(object):
     """ Map transformation attribute filter names to data transformation filter implementations.
@@ -94,8 +135,10 @@ class DataTransformFactory(object):
         #
         self.__wsPattern = re.compile(r"\s+", flags=re.UNICODE | re.MULTILINE)
         self.__dti = DataTransformInfo()
-        self.__dT = self.__build()
         self.__nullValueD = {"string": "", "integer": r"\N", "float": r"\N", "date": r"\N", "datetime": r"\N"}
+        self.__dT = self.__build()
+        # compiled row transformers keyed by (tableId, attribute name tuple, key options)
+        self.__rowTrfD = {}
 
     def __build(self):
         """ Internal method that stores transformations for each table so that these may
@@ -111,6 +154,7 @@ class DataTransformFactory(object):
             aD = {}
             typeD = {}
             pureCastD = {}
+            enumMapD = {}
             for atId in tObj.getAttributeIdList():
                 if tObj.isOtherAttributeType(atId):
                     # skip attributes with no mapping correspondence
@@ -170,17 +214,34 @@ class DataTransformFactory(object):
                 #
                 if len(aD[atId]) == 1 and atId in typeD and typeD[atId] in ["string", "float", "integer"]:
                     pureCastD[tObj.getAttributeName(atId)] = typeD[atId]
+                elif typeD.get(atId) == "string" and [func.__name__ for func in aD[atId]] == ["castString", "normalizeEnum"]:
+                    # enumerated strings are normalized in the cast step using the precomputed map
+                    pureCastD[tObj.getAttributeName(atId)] = "enum"
+                    enumMapD[tObj.getAttributeName(atId)] = tObj.getEnumNormalizationMap(atId)
             # Transformation functions keyed by attribute 'name'
             tD["atIdD"] = tObj.getMapAttributeIdDict()
             tD["atNameD"] = tObj.getMapAttributeNameDict()
             tD["atNullValues"] = tObj.getAppNullValueDict()
             tD["atFuncD"] = {tD["atIdD"][k]: v for k, v in aD.items()}
             tD["pureCast"] = pureCastD
+            tD["enumMapD"] = enumMapD
             #
             fD[tableId] = tD
         ##
         return fD
 
+    def __getstate__(self):
+        # compiled row transformers (closures) are rebuilt on demand and the table transformations
+        # (which include the read-only enumeration maps) are rebuilt on unpickling
+        stateD = self.__dict__.copy()
+        stateD.pop("_DataTransformFactory__dT", None)
+        stateD["_DataTransformFactory__rowTrfD"] = {}
+        return stateD
+
+    def __setstate__(self, stateD):
+        self.__dict__.update(stateD)
+        self.__dT = self.__build()
+
     def get(self, tableId):
         try:
             return self.__dT[tableId]
@@ -198,51 +259,105 @@ class DataTransformFactory(object):
             return   d[atId]=rowdata for the input row list
 
         """
-        # get the transform object for the current table
-        #
-        # Avoiding method call ...
-        # dT = self.get(tableId)
-        dT = self.__dT[tableId] if tableId in self.__dT else {}
-        #
-        atName = None
-        try:
-            dD = {} if self.__transFlags["dropEmpty"] else {k: v for k, v in dT["atNullValues"].items()}
-            for ii, atName in enumerate(attributeNameList):
-                if atName not in dT["atNameD"]:
-                    continue
-                #
-                # nullFlag = False if row[ii] else True
-                nullFlag = False if row[ii] is not None else True
-                #
-                # Incorporate pure casts into this loop for performance -
-                if atName in dT["pureCast"]:
-                    if nullFlag and self.__transFlags["dropEmpty"]:
-                        continue
-                    if (row[ii] == "?") or (row[ii] == ".") or (row[ii]) == "":
-                        if self.__transFlags["dropEmpty"]:
+        return self.getRowTransformer(tableId, attributeNameList)(row, containerName=containerName)
+
+    def getRowTransformer(self, tableId, attributeNameList, nameKeys=False, excludeAttributeIdS=None):
+        """ Return a function transforming input rows (lists ordered according to the input attribute
+            names list) for the input table -
+
+            trf(row, containerName=None) -> d[atId]=rowdata
+
+            Args:
+                nameKeys (bool, optional): key the transformed rows by schema attribute name rather than attribute Id
+                excludeAttributeIdS (frozenset, optional): attribute Ids omitted from the transformed rows
+
+            Transformers are compiled once for each table, input attribute name list and key options.
+        """
+        ky = (tableId, tuple(attributeNameList), nameKeys, excludeAttributeIdS)
+        if ky not in self.__rowTrfD:
+            self.__rowTrfD[ky] = self.__compileRowTransformer(ky)
+        return self.__rowTrfD[ky]
+
+    def __compileRowTransformer(self, ky):
+        """ Return a function applying the compiled transformation steps for the input table, attribute name list
+            and key options (ky) to an input row in a single loop.
+        """
+        tableId, attributeNameTup, nameKeys, excludeAttributeIdS = ky
+        stepT, nullValueD = self.__compileRowSteps(tableId, attributeNameTup, nameKeys=nameKeys, excludeAttributeIdS=excludeAttributeIdS)
+        dropEmpty = self.__transFlags["dropEmpty"]
+        nullTokenS = _NULL_TOKENS
+
+        def transformRow(row, containerName=None):
+            dD = {} if dropEmpty else dict(nullValueD)
+            atName = None
+            try:
+                for ii, atId, atName, isPure, castFunc, nullValue, funcT, outKey in stepT:
+                    val = row[ii]
+                    if isPure:
+                        # Incorporate pure casts into this loop for performance -
+                        if val is None and dropEmpty:
                             continue
-                        else:
-                            dD[dT["atNameD"][atName]] = self.__nullValueD[dT["pureCast"][atName]]
+                        if val in nullTokenS:
+                            if not dropEmpty:
+                                dD[outKey] = nullValue
                             continue
+                        dD[outKey] = val if castFunc is None else castFunc(val)
                     else:
-                        if dT["pureCast"][atName] == "string":
-                            dD[dT["atNameD"][atName]] = row[ii]
-                        elif dT["pureCast"][atName] == "integer":
-                            dD[dT["atNameD"][atName]] = int(row[ii])
-                        elif dT["pureCast"][atName] == "float":
-                            dD[dT["atNameD"][atName]] = float(row[ii])
-                        continue
+                        # Apply the list of functions on an initial value (i.e. TrfValue for the ii(th) element of the row.
+                        vT = TrfValue(val, atId, 0, val is None)
+                        for func in funcT:
+                            vT = func(vT)
+                        if dropEmpty and vT.isNull:
+                            continue
+                        dD[outKey] = vT.value
+            except Exception as e:
+                logger.error("Failing for %r table %s atName %s with %s", containerName, tableId, atName, str(e))
+            return dD
+
+        return transformRow
+
+    def __compileRowSteps(self, tableId, attributeNameList, nameKeys=False, excludeAttributeIdS=None):
+        """ Compile the transformations for the input table and attribute name list into a flat tuple of steps:
+
+            (row index, attribute Id, attribute name, is pure cast, cast function or None, null value, transformation function list, output key)
+
+            Returns: step tuple, null value dictionary (with output keys)
+        """
+        if tableId not in self.__dT:
+            logger.error("Missing table %r", tableId)
+        dT = self.__dT[tableId] if tableId in self.__dT else {"atNameD": {}, "pureCast": {}, "atFuncD": {}, "atNullValues": {}, "enumMapD": {}}
+        excludeAttributeIdS = excludeAttributeIdS if excludeAttributeIdS else frozenset()
+        if nameKeys:
+            sObj = self.__sD.getSchemaObject(tableId)
+            keyD = {atId: sObj.getAttributeName(atId) for atId in list(dT["atNameD"].values()) + list(dT["atNullValues"].keys())}
+        else:
+            keyD = {atId: atId for atId in list(dT["atNameD"].values()) + list(dT["atNullValues"].keys())}
+        castD = {"string": None, "integer": int, "float": float}
+        stepL = []
+        for ii, atName in enumerate(attributeNameList):
+            if atName not in dT["atNameD"]:
+                continue
+            atId = dT["atNameD"][atName]
+            if atId in excludeAttributeIdS:
+                continue
+            if atName in dT["pureCast"]:
+                castType = dT["pureCast"][atName]
+                if castType == "enum":
+                    stepL.append((ii, atId, atName, True, self.__makeEnumCast(dT["enumMapD"][atName]), self.__nullValueD["string"], (), keyD[atId]))
                 else:
-                    # Apply list of functions on an initial value (i.e. TrfValue for the ii(th) element of the row.
-                    vT = reduce(lambda x, y: y(x), dT["atFuncD"][atName], TrfValue(row[ii], dT["atNameD"][atName], 0, nullFlag))
-                    if self.__transFlags["dropEmpty"] and vT.isNull:
-                        continue
-                    dD[dT["atNameD"][atName]] = vT.value
-        except Exception as e:
-            logger.error("Failing for %r table %s atName %s with %s", containerName, tableId, atName, str(e))
-            # logger.exception("Failing for %r table %r atName %r with %s", containerName, tableId, atName, str(e))
+                    stepL.append((ii, atId, atName, True, castD[castType], self.__nullValueD[castType], (), keyD[atId]))
+            else:
+                stepL.append((ii, atId, atName, False, None, None, tuple(dT["atFuncD"][atName]), keyD[atId]))
+        nullValueD = {keyD[atId]: val for atId, val in dT["atNullValues"].items() if atId not in excludeAttributeIdS}
+        return tuple(stepL), nullValueD
+
+    def __makeEnumCast(self, enumMap):
+        enumMap = enumMap if enumMap else {}
+
+        def castEnum(val):
+            return enumMap.get(val.lower(), val) if val is not None else val
 
-        return dD
+        return castEnum
 
 
 class DataTransform(object):
@@ -256,8 +371,6 @@ class DataTransform(object):
 
     def __init__(self, tObj):
         #
-        self.__wsPattern = re.compile(r"\s+", flags=re.UNICODE | re.MULTILINE)
-
         # SchemaDef Table Object -
         #
         #
@@ -276,11 +389,13 @@ class DataTransform(object):
         # origLength = len(trfTup.value)
         # if ((origLength == 0) or (trfTup.value == '?') or (trfTup.value == '.')):
         #    return TrfValue(self.__nullValueString, trfTup.atId, origLength, True)
+        eD = self.__tObj.getEnumNormalizationMap(trfTup.atId)
+        if not eD:
+            return TrfValue(trfTup.value, trfTup.atId, trfTup.origLength, False)
         if trfTup.value and isinstance(trfTup.value, (list,)):
-            tL = [self.__tObj.normalizeEnum(trfTup.atId, t) for t in trfTup.value]
-            nVal = tL
+            nVal = [eD.get(str(t).lower(), t) for t in trfTup.value]
         else:
-            nVal = self.__tObj.normalizeEnum(trfTup.atId, trfTup.value)
+            nVal = eD.get(str(trfTup.value).lower(), trfTup.value)
         # logger.info("Normalizing %r %r - normalized %r", trfTup.atId, trfTup.value, nVal)
         return TrfValue(nVal, trfTup.atId, trfTup.origLength, False)
 
@@ -303,7 +418,7 @@ class DataTransform(object):
             return trfTup
         if (trfTup.value == "?") or (trfTup.value == ".") or (not trfTup.value):
             return TrfValue(self.__nullValueString, trfTup.atId, trfTup.origLength, True)
-        return TrfValue(trfTup.value, trfTup.atId, trfTup.origLength, False)
+        return trfTup
 
     def castIterableString(self, trfTup):
         """
@@ -371,8 +486,7 @@ class DataTransform(object):
         origLength = len(trfTup.value)
         if (origLength == 0) or (trfTup.value == "?") or (trfTup.value == "."):
             return TrfValue(self.__nullValueOther, trfTup.atId, origLength, True)
-        tv = trfTup.value.replace(":", " ", 1)
-        return TrfValue(dateutil.parser.parse(tv), trfTup.atId, origLength, False)
+        return TrfValue(parseDate(trfTup.value), trfTup.atId, origLength, False)
 
     def castDateTimeToIsoDate(self, trfTup):
         """ Cast the input date (optional time) string (yyyy-mm-dd:hh::mm:ss) to a Python DateTime object -
@@ -384,10 +498,7 @@ class DataTransform(object):
         origLength = len(trfTup.value)
         if (origLength == 0) or (trfTup.value == "?") or (trfTup.value == "."):
             return TrfValue(self.__nullValueOther, trfTup.atId, origLength, True)
-        tv = trfTup.value.replace(":", " ", 1)
-        tS = dateutil.parser.parse(tv).replace(tzinfo=pytz.UTC).isoformat()
-
-        return TrfValue(tS, trfTup.atId, origLength, False)
+        return TrfValue(castDateTimeToIsoString(trfTup.value), trfTup.atId, origLength, False)
 
     def castDateToIsoDate(self, trfTup):
         """ Cast the input date (optional time) string (yyyy-mm-dd:hh::mm:ss) to a Python DateTime object -
@@ -399,10 +510,7 @@ class DataTransform(object):
         origLength = len(trfTup.value)
         if (origLength == 0) or (trfTup.value == "?") or (trfTup.value == "."):
             return TrfValue(self.__nullValueOther, trfTup.atId, origLength, True)
-        tv = trfTup.value.replace(":", " ", 1)
-        tS = dateutil.parser.parse(tv).isoformat()
-
-        return TrfValue(tS[:10], trfTup.atId, origLength, False)
+        return TrfValue(castDateToIsoString(trfTup.value), trfTup.atId, origLength, False)
 
     def castDateToString(self, trfTup):
         """ Cast the input date (optional time) string (yyyy-mm-dd:hh::mm:ss) as a string unchanged -
@@ -423,7 +531,9 @@ class DataTransform(object):
         """
         if trfTup.isNull:
             return trfTup
-        value = self.__wsPattern.sub("", trfTup.value)
+        value = "".join(trfTup.value.split())
+        if len(value) == len(trfTup.value):
+            return trfTup
         return TrfValue(value, trfTup.atId, trfTup.origLength, False)
 
     def truncateString(self, trfTup):
@@ -433,14 +543,17 @@ class DataTransform(object):
         """
         if trfTup.isNull:
             return trfTup
-        return TrfValue(trfTup.value[: self.__tObj.getAttributeWidth(trfTup.atId)], trfTup.atId, trfTup.origLength, False)
+        width = self.__tObj.getAttributeWidth(trfTup.atId)
+        if width is None or len(trfTup.value) <= width:
+            return trfTup
+        return TrfValue(trfTup.value[:width], trfTup.atId, trfTup.origLength, False)
 
     def translateXMLCharRefs(self, trfTup):
         """ Convert XML Character references to unicode.
 
             Return:  ReturnValue tuple
         """
-        if trfTup.isNull:
+        if trfTup.isNull or "&" not in trfTup.value:
             return trfTup
         return TrfValue(unescapeXmlCharRef(trfTup.value), trfTup.atId, trfTup.origLength, False)
 
@@ -449,7 +562,7 @@ class DataTransform(object):
 
             Return:  ReturnValue tuple
         """
-        if trfTup.isNull:
+        if trfTup.isNull or not any("&" in v for v in trfTup.value):
             return trfTup
         #
         vL = [unescapeXmlCharRef(v) for v in trfTup.value]
@@ -31,6 +31,17 @@
 #       5-Feb-2019  jdw generalize locatorList to locatorObjList and associated dependent changes,
 #                       and add __mergeContainers() -
 #      22-Sep-2019  jdw use sorted order of table objects within documents
+#      18-Oct-2026  agent add processDocumentsMulti() to map each container once and project the result
+#                         for each collection
+#      18-Oct-2026  agent use compiled row transformers from DataTransformFactory.getRowTransformer()
+#      18-Oct-2026  agent map unsliced rowwise_by_name[_with_cardinality] documents directly to the named
+#                         document organization in processDocuments()
+#      18-Oct-2026  agent add generator variants processDocumentsIter() and processDocumentsMultiIter()
+#      18-Oct-2026  agent compile data selector definitions once into a predicate for each selector list
+#      18-Oct-2026  agent precompute subcategory aggregate plans for each collection
+#      18-Oct-2026  agent map only the tables consuming categories present in each container using a
+#                         cached category to table index
+#      18-Oct-2026  agent cache merge key getters for merged instance categories (__mapInstanceCategoryList())
 #
 #
 ##
@@ -48,6 +59,7 @@ __license__ = "Apache 2.0"
 import datetime
 import logging
 import time
+from operator import itemgetter
 
 from rcsb.db.processors.SchemaDefReShape import SchemaDefReShape
 from rcsb.utils.io.MarshalUtil import MarshalUtil
@@ -63,7 +75,6 @@ class SchemaDefDataPrep(object):
 
     def __init__(self, schemaDefAccessObj, dtObj=None, workPath=None, verbose=True):
         self.__verbose = verbose
-        self.__debug = False
         self.__sD = schemaDefAccessObj
         self.__mU = MarshalUtil(workPath=workPath)
         self.__dtObj = dtObj
@@ -73,6 +84,15 @@ class SchemaDefDataPrep(object):
         self.__schemaIdExcludeD = {}
         self.__schemaIdIncludeD = {}
         #
+        # compiled data selector predicates keyed by the tuple of selector names
+        self.__selectorD = {}
+        # subcategory aggregate plans keyed by (collectionName, removeSubCategoryPrefix)
+        self.__subCategoryPlanD = {}
+        # table mapping plans and category -> table indices keyed by the table selection
+        self.__mapPlanD = {}
+        # merge key getters keyed by (tableId, categoryName, attribute name tuple)
+        self.__mergeKeyD = {}
+        #
         self.__reShape = SchemaDefReShape(schemaDefAccessObj, workPath=workPath, verbose=verbose)
         #
 
@@ -286,34 +306,139 @@ class SchemaDefDataPrep(object):
         schemaDataDictList = []
         containerIdList = []
         rejectIdList = []
-        for container in containerList:
-            schemaDataDictById, _, rL = self.__process([container], filterType, dataSelectors=dataSelectors, useNameFlag=useNameFlag)
-            rejectIdList.extend(rL)
+        for cId, _, doc in self.processDocumentsIter(
+            containerList, styleType=styleType, filterType=filterType, dataSelectors=dataSelectors, sliceFilter=sliceFilter, useNameFlag=useNameFlag, collectionName=collectionName
+        ):
+            if doc is None:
+                rejectIdList.append(cId)
+            else:
+                schemaDataDictList.append(doc)
+                containerIdList.append(cId)
+
+        rejectIdList = list(set(rejectIdList))
+        logger.debug("containerIdList %r schemaDataDictList %r", containerIdList, schemaDataDictList)
+        #
+        return schemaDataDictList, containerIdList, rejectIdList
+
+    def processDocumentsIter(self, containers, styleType="rowwise_by_id", filterType="none", dataSelectors=None, sliceFilter=None, useNameFlag=True, collectionName=None):
+        """ Generator variant of processDocuments() yielding the documents for each input container as soon as
+            the container is processed.  The input containers may be any iterable (e.g. a generator reading
+            containers on demand) so that only the current container need be held in memory.
+
+            Yields: (container identifier, collectionName, document) for each document, and
+                    (container identifier, None, None) for each container rejected by the data selectors.
+
+            Arguments are as described for processDocuments().
+        """
+        # unsliced documents in these styles are mapped directly with schema attribute name keys
+        fuseFlag = not sliceFilter and styleType in ["rowwise_by_name", "rowwise_by_name_with_cardinality"]
+        for container in containers:
+            schemaDataDictById, _, rL = self.__process([container], filterType, dataSelectors=dataSelectors, useNameFlag=useNameFlag, nameKeys=fuseFlag, collectionName=collectionName)
+            for cId in rL:
+                yield cId, None, None
             if not schemaDataDictById:
                 continue
             #
             logger.debug("Reshape container %s for collection %s using slice filter %s", container.getName(), collectionName, sliceFilter)
-            sddL = self.__reShape.applySlicedShape(schemaDataDictById, styleType=styleType, sliceFilter=sliceFilter, collectionName=collectionName)
+            if fuseFlag:
+                sddL = [self.__nameTables(schemaDataDictById, styleType)]
+            else:
+                sddL = self.__reShape.applySlicedShape(schemaDataDictById, styleType=styleType, sliceFilter=sliceFilter, collectionName=collectionName)
             if not sddL:
                 logger.debug("No result on reshaping container %s collection %s slice filter %s", container.getName(), collectionName, sliceFilter)
+                continue
+            # Match the container name to the generated reshaped objects
+            cId = self.__getContainerId(container, useNameFlag)
+            for sdd in sddL:
+                yield cId, collectionName, sdd
+
+    def processDocumentsMulti(self, containerList, collectionNameList, styleType="rowwise_by_id", filterType="none", dataSelectors=None, useNameFlag=True):
+        """ Return document lists for each of the input collections.  The tables selected by any collection are
+            mapped once for each input container and the mapped data are then projected onto the tables selected
+            by each collection (subject to the collection include and exclude lists) and reshaped using the
+            collection slice filter.
+
+            Returns: rD{collectionName: (schemaDataDictList, containerIdList)}, rejectIdList
+
+            Arguments are as described for processDocuments().   Any include or exclude lists set with
+            setSchemaIdIncludeList() or setSchemaIdExcludeList() are not used by this method.
+        """
+        rD = {collectionName: ([], []) for collectionName in collectionNameList}
+        rejectIdList = []
+        for cId, collectionName, doc in self.processDocumentsMultiIter(
+            containerList, collectionNameList, styleType=styleType, filterType=filterType, dataSelectors=dataSelectors, useNameFlag=useNameFlag
+        ):
+            if doc is None:
+                rejectIdList.append(cId)
             else:
-                schemaDataDictList.extend(sddL)
-                #
-                # Match the container name to the generated reshaped objects
-                try:
-                    if useNameFlag:
-                        cId = container.getName()
-                    else:
-                        cId = container.getProp("uid")
-                except Exception:
-                    cId = container.getName()
-                cIdList = [cId for i in range(len(sddL))]
-                containerIdList.extend(cIdList)
+                rD[collectionName][0].append(doc)
+                rD[collectionName][1].append(cId)
+        #
+        return rD, list(set(rejectIdList))
 
-        rejectIdList = list(set(rejectIdList))
-        logger.debug("containerIdList %r schemaDataDictList %r", containerIdList, schemaDataDictList)
+    def processDocumentsMultiIter(self, containers, collectionNameList, styleType="rowwise_by_id", filterType="none", dataSelectors=None, useNameFlag=True):
+        """ Generator variant of processDocumentsMulti() yielding the documents for all input collections as soon
+            as each container is processed.
+
+            Yields: (container identifier, collectionName, document) for each document, and
+                    (container identifier, None, None) for each container rejected by the data selectors.
+        """
+        try:
+            allTableIdList = self.__sD.getSchemaIdList()
+            tableIdD = {}
+            for collectionName in collectionNameList:
+                includeL = self.__sD.getCollectionSelected(collectionName)
+                excludeS = set(self.__sD.getCollectionExcluded(collectionName))
+                tableIdD[collectionName] = {tId for tId in (includeL if includeL else allTableIdList) if tId not in excludeS}
+            unionTableIdList = sorted(set().union(*tableIdD.values())) if tableIdD else []
+            sliceFilterD = {collectionName: self.__sD.getCollectionSliceFilter(collectionName) for collectionName in collectionNameList}
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            return
         #
-        return schemaDataDictList, containerIdList, rejectIdList
+        for container in containers:
+            try:
+                schemaDataDictById, _, rL = self.__process([container], filterType, dataSelectors=dataSelectors, useNameFlag=useNameFlag, tableIdList=unionTableIdList)
+                for cId in rL:
+                    yield cId, None, None
+                if not schemaDataDictById:
+                    continue
+                cId = self.__getContainerId(container, useNameFlag)
+                for collectionName in collectionNameList:
+                    sddById = {tId: v for tId, v in schemaDataDictById.items() if tId in tableIdD[collectionName]}
+                    if not sddById:
+                        continue
+                    sliceFilter = sliceFilterD[collectionName]
+                    logger.debug("Reshape container %s for collection %s using slice filter %s", container.getName(), collectionName, sliceFilter)
+                    sddL = self.__reShape.applySlicedShape(sddById, styleType=styleType, sliceFilter=sliceFilter, collectionName=collectionName)
+                    if not sddL:
+                        logger.debug("No result on reshaping container %s collection %s slice filter %s", container.getName(), collectionName, sliceFilter)
+                        continue
+                    for sdd in sddL:
+                        yield cId, collectionName, sdd
+            except Exception as e:
+                logger.exception("Failing for container %s with %s", container.getName(), str(e))
+
+    def __nameTables(self, schemaDataDictByIdNamedRows, styleType):
+        """ Return the document for input data with rows keyed by attribute name using the schema name of each table
+            (with unit cardinality tables as a single row dictionary for the rowwise_by_name_with_cardinality style).
+        """
+        rD = {}
+        for schemaId, rowDList in schemaDataDictByIdNamedRows.items():
+            schemaObjName = self.__sD.getSchemaName(schemaId)
+            if styleType == "rowwise_by_name_with_cardinality" and len(rowDList) == 1 and self.__sD.hasUnitCardinality(schemaId):
+                rD[schemaObjName] = rowDList[0]
+            else:
+                rD[schemaObjName] = rowDList
+        return rD
+
+    def __getContainerId(self, container, useNameFlag):
+        try:
+            if useNameFlag:
+                return container.getName()
+            return container.getProp("uid")
+        except Exception:
+            return container.getName()
 
     def addDocumentPrivateAttributes(self, docList, collectionName, styleType="rowwise_by_name"):
         """ For the input collection, add private document attributes to the input document list.
@@ -356,113 +481,87 @@ class SchemaDefDataPrep(object):
             logger.error("Unsupported document style %s", styleType)
             return docList
         try:
-            dD = {}
-            scAgL = self.__sD.getSubCategoryAggregates(collectionName)
-            if scAgL:
-                scAgD = {}
-                logger.debug("%s processing subcategory aggregates %r", collectionName, scAgL)
-                for scAg in scAgL:
-                    scD = {}
-                    sIdL = self.__sD.getSubCategorySchemaIdList(scAg)
-                    for sId in sIdL:
-                        atIdL = self.__sD.getSubCategoryAttributeIdList(sId, scAg)
-                        scD[self.__sD.getSchemaName(sId)] = [self.__sD.getAttributeName(sId, atId) for atId in atIdL]
-                    scAgD[scAg] = scD
-                logger.debug("%s subcategory aggregate name dictionary %r", collectionName, scAgD)
-                #
-                for doc in docList:
-                    for scAg, scD in scAgD.items():
-                        for sName in scD:
-                            # logger.info("sName %s scAg %r scD %r", sName, scAg, scD)
-                            if sName not in doc:
-                                continue
-                            #
-                            hasUnitCard = self.__sD.getSubCategoryAggregatesUnitCardinality(collectionName, scAg)
-                            atNameAllL = scD[sName]
-                            logger.debug("\n -- %s %s agg %s unit cardinality %r obj %s type %r", sName, collectionName, hasUnitCard, scAg, sName, type(doc[sName]))
-                            # logger.info("\n -- %s %s type %r", sName, collectionName, type(doc[sName]))
-                            # logger.info("\n -- %s %s atNameAllL %r", sName, collectionName, atNameAllL)
-                            if isinstance(doc[sName], list):
-                                for rowD in doc[sName]:
-                                    atNameL = list(set(atNameAllL).intersection(set(rowD.keys())))
-                                    # logger.info(" - QQQ - sName %s atNameAllL %r rowD.keys()(set) %r atNameL %r", sName, set(atNameAllL), set(rowD.keys()), atNameL)
-                                    if atNameL and set(atNameL).issubset(set(rowD.keys())):
-                                        # logger.info(" - TTT - sName %s (%r) %r", sName, hasUnitCard, [type(rowD[atName]) for atName in atNameL])
-                                        if hasUnitCard:
-                                            # all members of the the subcategory must be simple types -
-                                            dD = {}
-                                            for atName in atNameL:
-                                                cAtName = atName.replace(scAg + "_", "") if removeSubCategoryPrefix else atName
-                                                # dD[cAtName] = rowD[atName]
-                                                # JDW filter missing values -
-                                                if not rowD[atName] or rowD[atName] in [".", "?"]:
-                                                    continue
-                                                dD[cAtName] = rowD[atName]
-                                            rowD[scAg] = dD
-                                        else:
-                                            # all members of the the subcategory must be list type -
-                                            atLenL = [len(rowD[atName]) for atName in atNameL]
-                                            atLen = min(atLenL)
-                                            # logger.info("%s %s %r Candidate list row is %r", scAg, sName, atNameL, rowD)
-                                            # copy all of the data to the new aggregate object
-                                            rL = []
-                                            for ii in range(atLen):
-                                                dD = {}
-                                                for atName in atNameL:
-                                                    cAtName = atName.replace(scAg + "_", "") if removeSubCategoryPrefix else atName
-                                                    # JDW filter missing values
-                                                    if not rowD[atName][ii] or rowD[atName][ii] in [".", "?"]:
-                                                        continue
-                                                    dD[cAtName] = rowD[atName][ii]
-                                                rL.append(dD)
-                                            rowD[scAg] = rL
-                                        #
-                                        for atName in atNameL:
-                                            del rowD[atName]
-                                        logger.debug("Processed list row is %r", rowD)
-                            elif isinstance(doc[sName], dict):
-                                atNameL = list(set(atNameAllL).intersection(set(doc[sName].keys())))
-                                if atNameL and set(atNameL).issubset(set(doc[sName].keys())):
-                                    # logger.info("Candidate dict row is %r", doc[sName])
-                                    if hasUnitCard:
-                                        # all members of the the subcategory must be simple types -
-                                        dD = {}
-                                        dD = {}
-                                        for atName in atNameL:
-                                            cAtName = atName.replace(scAg + "_", "") if removeSubCategoryPrefix else atName
-                                            # JDW filter missing values
-                                            if not doc[sName][atName] or doc[sName][atName] in [".", "?"]:
-                                                continue
-                                            dD[cAtName] = doc[sName][atName]
-                                        doc[sName][scAg] = dD
-                                    else:
-                                        # all members of the the subcategory must be list type -
-                                        atLenL = [len(doc[sName][atName]) for atName in atNameL]
-                                        atLen = min(atLenL)
-                                        # copy all of the data to the new aggregate object
-                                        rL = []
-                                        for ii in range(atLen):
-                                            dD = {}
-                                            for atName in atNameL:
-                                                cAtName = atName.replace(scAg + "_", "") if removeSubCategoryPrefix else atName
-                                                # JDW filter missing values
-                                                if not doc[sName][atName][ii] or doc[sName][atName][ii] in [".", "?"]:
-                                                    continue
-                                                dD[cAtName] = doc[sName][atName][ii]
-                                            rL.append(dD)
-                                        doc[sName][scAg] = rL
-                                    #
-                                    for atName in atNameL:
-                                        del doc[sName][atName]
-                                    logger.debug("Processed dict row is %r", doc[sName])
-                            else:
-                                logger.error("%s unanticipated document data type for sName %s", collectionName, sName)
-
+            ky = (collectionName, removeSubCategoryPrefix)
+            if ky not in self.__subCategoryPlanD:
+                self.__subCategoryPlanD[ky] = self.__makeSubCategoryAggregatePlan(collectionName, removeSubCategoryPrefix)
+            planD = self.__subCategoryPlanD[ky]
+            if not planD:
+                return docList
+            #
+            for doc in docList:
+                for sName, aggL in planD.items():
+                    if sName not in doc:
+                        continue
+                    obj = doc[sName]
+                    if isinstance(obj, list):
+                        for rowD in obj:
+                            for scAg, hasUnitCard, atNameAllT, cAtNameD in aggL:
+                                self.__aggregateSubCategory(rowD, scAg, hasUnitCard, atNameAllT, cAtNameD)
+                    elif isinstance(obj, dict):
+                        for scAg, hasUnitCard, atNameAllT, cAtNameD in aggL:
+                            self.__aggregateSubCategory(obj, scAg, hasUnitCard, atNameAllT, cAtNameD)
+                    else:
+                        logger.error("%s unanticipated document data type for sName %s", collectionName, sName)
         except Exception as e:
-            logger.exception("Failing with %s : %r", str(e), list(dD.items())[:5])
+            logger.exception("Failing with %s", str(e))
         #
         return docList
 
+    def __makeSubCategoryAggregatePlan(self, collectionName, removeSubCategoryPrefix):
+        """ Return the subcategory aggregates for the input collection organized by schema object name -
+
+            planD[<schemaObjName>] = [(subcategory, has unit cardinality, (atName, ...), {atName: aggregate atName, ...}), ...]
+
+            Aggregates for each schema object are listed in the collection subcategory aggregate order.
+        """
+        planD = {}
+        scAgL = self.__sD.getSubCategoryAggregates(collectionName)
+        logger.debug("%s processing subcategory aggregates %r", collectionName, scAgL)
+        for scAg in scAgL:
+            hasUnitCard = self.__sD.getSubCategoryAggregatesUnitCardinality(collectionName, scAg)
+            for sId in self.__sD.getSubCategorySchemaIdList(scAg):
+                atNameL = [self.__sD.getAttributeName(sId, atId) for atId in self.__sD.getSubCategoryAttributeIdList(sId, scAg)]
+                cAtNameD = {atName: atName.replace(scAg + "_", "") if removeSubCategoryPrefix else atName for atName in atNameL}
+                planD.setdefault(self.__sD.getSchemaName(sId), []).append((scAg, hasUnitCard, tuple(atNameL), cAtNameD))
+        logger.debug("%s subcategory aggregate plan %r", collectionName, planD)
+        return planD
+
+    def __aggregateSubCategory(self, rowD, scAg, hasUnitCard, atNameAllT, cAtNameD):
+        """ Replace the subcategory attributes in the input row dictionary with the aggregate object rowD[scAg]
+            (a dictionary for unit cardinality aggregates of simple values or a list of dictionaries built from
+            the list values of the subcategory attributes).  Missing values are omitted.
+        """
+        atNameL = [atName for atName in atNameAllT if atName in rowD]
+        if not atNameL:
+            return
+        if hasUnitCard:
+            # all members of the the subcategory must be simple types -
+            dD = {}
+            for atName in atNameL:
+                val = rowD[atName]
+                # JDW filter missing values -
+                if not val or val in [".", "?"]:
+                    continue
+                dD[cAtNameD[atName]] = val
+            rowD[scAg] = dD
+        else:
+            # all members of the the subcategory must be list type -
+            atLen = min([len(rowD[atName]) for atName in atNameL])
+            rL = []
+            for ii in range(atLen):
+                dD = {}
+                for atName in atNameL:
+                    val = rowD[atName][ii]
+                    # JDW filter missing values
+                    if not val or val in [".", "?"]:
+                        continue
+                    dD[cAtNameD[atName]] = val
+                rL.append(dD)
+            rowD[scAg] = rL
+        #
+        for atName in atNameL:
+            del rowD[atName]
+
     def __fetch(self, locatorObjList, filterType, dataSelectors=None, useNameFlag=True):
         """ Internal method to create loadable data corresponding to the table schema definition
             from the input list of data files.
@@ -510,9 +609,10 @@ class SchemaDefDataPrep(object):
 
         return schemaDataDictF, containerIdList, rejectLocatorObjList
 
-    def __process(self, containerList, filterType, dataSelectors=None, useNameFlag=True):
+    def __process(self, containerList, filterType, dataSelectors=None, useNameFlag=True, tableIdList=None, nameKeys=False, collectionName=None):
         """ Internal method to create loadable data corresponding to the table schema definition
-            from the input container list.
+            from the input container list (optionally limited to the input table id list).  With nameKeys
+            rows are keyed by attribute name omitting the excluded attributes of the input collection.
 
             Returns: dictionary d[<tableId>] = [ row1Dict[attributeId]=value,  row2dict[], .. ]
                                 and
@@ -540,7 +640,7 @@ class SchemaDefDataPrep(object):
                 else:
                     rejectIdList.append(cA.getProp("uid"))
         #
-        self.__mapData(cL, schemaDataDict, filterType)
+        self.__mapData(cL, schemaDataDict, filterType, tableIdList=tableIdList, nameKeys=nameKeys, collectionName=collectionName)
         schemaDataDictF = {}
         if "drop-empty-tables" in filterType:
             for k, v in schemaDataDict.items():
@@ -566,35 +666,52 @@ class SchemaDefDataPrep(object):
             return True
         try:
             logger.debug("On container %s applying selectors: %r", container.getName(), dataSelectors)
-            for cs in dataSelectors:
-                csDL = self.__sD.getDataSelectors(cs)
-                for csD in csDL:
-                    tn = csD["CATEGORY_NAME"]
-                    an = csD["ATTRIBUTE_NAME"]
-                    vals = csD["VALUES"]
-                    logger.debug("Applying selector %s: tn %s an %s vals %r", cs, tn, an, vals)
-                    if not container.exists(tn):
-                        return False
-                    catObj = container.getObj(tn)
-                    numRows = catObj.getRowCount()
-                    if numRows:
-                        for ii in range(numRows):
-                            logger.debug("Testing %s type %r row %d of %d", an, type(an), ii, numRows)
-                            v = catObj.getValue(attributeName=an, rowIndex=ii)
-                            if v not in vals:
-                                logger.debug("Selector %s rejects : tn %s an %s value %r", cs, tn, an, v)
-                                return False
-                    else:
-                        logger.debug("Selector %s rejects container with missing category %s", cs, tn)
-                        return False
-            #
-            # all selectors satisfied
-            return True
+            ky = tuple(dataSelectors)
+            if ky not in self.__selectorD:
+                self.__selectorD[ky] = self.__compileDataSelectors(dataSelectors)
+            return self.__selectorD[ky](container)
         except Exception as e:
             logger.exception("Failing with %s", str(e))
 
         return False
 
+    def __compileDataSelectors(self, dataSelectors):
+        """ Return a predicate function testing a container against the selection definitions of the input selectors.
+
+            Each selection (category, attribute, accepted values) must be satisfied by every row of the category.
+            A missing or empty category or a missing attribute rejects the container (a missing attribute is logged as an error).
+        """
+        selL = []
+        for cs in dataSelectors:
+            for csD in self.__sD.getDataSelectors(cs):
+                vals = csD["VALUES"]
+                try:
+                    valS = frozenset(vals)
+                except TypeError:
+                    valS = vals
+                selL.append((cs, csD["CATEGORY_NAME"], csD["ATTRIBUTE_NAME"], valS))
+        selT = tuple(selL)
+
+        def testSelectors(container):
+            for cs, tn, an, valS in selT:
+                catObj = container.getObj(tn)
+                rowList = catObj.getRowList() if catObj is not None else None
+                if not rowList:
+                    logger.debug("Selector %s rejects container with missing category %s", cs, tn)
+                    return False
+                ii = catObj.getAttributeIndex(an)
+                if ii < 0:
+                    logger.error("Selector %s failing for container %s with missing attribute %s.%s", cs, container.getName(), tn, an)
+                    return False
+                for row in rowList:
+                    if row[ii] not in valS:
+                        logger.debug("Selector %s rejects : tn %s an %s value %r", cs, tn, an, row[ii])
+                        return False
+            # all selectors satisfied
+            return True
+
+        return testSelectors
+
     def __showOverwrite(self):
         #
         if self.__verbose:
@@ -635,10 +752,14 @@ class SchemaDefDataPrep(object):
 
         return True
 
-    def __mapData(self, containerList, schemaDataDict, filterType="none"):
+    def __mapData(self, containerList, schemaDataDict, filterType="none", tableIdList=None, nameKeys=False, collectionName=None):
         """
            Process instance data in the input container list and map these data to the
-           table schema definitions to the current selected table list.
+           table schema definitions to the current selected table list (or to the input table id list
+           which overrides any current include and exclude selections).
+
+           With nameKeys, row dictionaries are keyed by attribute name and the excluded attributes
+           of the input collection are omitted.
 
            Returns: mapped data as a list of dictionaries with attribute Id key for
                     each schema table.  Data are appended to any existing table in
@@ -647,51 +768,88 @@ class SchemaDefDataPrep(object):
 
         """
         # Respect any input selection otherwise use all schema defined tables -
-        if self.__schemaIdIncludeD:
+        schemaIdExcludeD = self.__schemaIdExcludeD
+        if tableIdList is not None:
+            selectedTableIdList = tableIdList
+            schemaIdExcludeD = {}
+        elif self.__schemaIdIncludeD:
             selectedTableIdList = list(self.__schemaIdIncludeD.keys())
         else:
             selectedTableIdList = self.__sD.getSchemaIdList()
         #
+        ky = (tuple(sorted(selectedTableIdList)), tuple(sorted(schemaIdExcludeD)), nameKeys, collectionName if nameKeys else None)
+        if ky not in self.__mapPlanD:
+            self.__mapPlanD[ky] = self.__makeMapPlan(ky[0], schemaIdExcludeD, nameKeys, collectionName)
+        planL, categoryIndexD, syntheticL = self.__mapPlanD[ky]
+        #
         for myContainer in containerList:
-            for tableId in sorted(selectedTableIdList):
-                if not self.__sD.hasSchemaObject(tableId):
-                    # logger.debug("Skipping undefined table %s" % tableId)
-                    continue
-                if tableId in self.__schemaIdExcludeD:
-                    # logger.debug("Skipping excluded table %s" % tableId)
-                    continue
+            for tableId, _, _, _, _ in planL:
                 if tableId not in schemaDataDict:
                     schemaDataDict[tableId] = []
-                tObj = self.__sD.getSchemaObject(tableId)
-                #
-                # Instance categories that are mapped to the current table -
-                #
-                mapCategoryNameList = tObj.getMapInstanceCategoryList()
+            # Only tables consuming categories present in the container (and purely synthetic tables) are mapped
+            planIdxS = set(syntheticL)
+            for categoryName in myContainer.getObjNameList():
+                if categoryName in categoryIndexD:
+                    planIdxS.update(categoryIndexD[categoryName])
+            #
+            for ii in sorted(planIdxS):
+                tableId, tObj, mapCategoryNameList, excludeAttributeIdS, otherAttributeL = planL[ii]
                 numMapCategories = len(mapCategoryNameList)
-                #
-                # Attribute Ids that are not directly mapped to the schema (e.g. functions)
-                #
-                otherAttributeIdList = tObj.getMapOtherAttributeIdList()
-                #
-
                 if numMapCategories == 1:
-                    rowDList = self.__mapInstanceCategory(tObj, mapCategoryNameList[0], myContainer, filterType)
+                    rowDList = self.__mapInstanceCategory(tObj, mapCategoryNameList[0], myContainer, filterType, nameKeys=nameKeys, excludeAttributeIdS=excludeAttributeIdS)
                 elif numMapCategories == 0:
                     # For a purely synthetic category with only method mappings,  create a placeholder row dictionary.
-                    rowDList = [{k: None for k in otherAttributeIdList}]
-                elif numMapCategories >= 1:
-                    rowDList = self.__mapInstanceCategoryList(tObj, mapCategoryNameList, myContainer, filterType)
+                    rowDList = [{atKey: None for _, atKey, _, _ in otherAttributeL}]
+                else:
+                    rowDList = self.__mapInstanceCategoryList(tObj, mapCategoryNameList, myContainer, filterType, nameKeys=nameKeys, excludeAttributeIdS=excludeAttributeIdS)
 
-                for atId in otherAttributeIdList:
-                    fName = tObj.getMapAttributeFunction(atId)
-                    fArgs = tObj.getMapAttributeFunctionArgs(atId)
-                    self.__evalMapFunction(dataContainer=myContainer, rowDList=rowDList, attributeId=atId, functionName=fName, functionArgs=fArgs)
+                for _, atKey, fName, fArgs in otherAttributeL:
+                    self.__evalMapFunction(dataContainer=myContainer, rowDList=rowDList, attributeId=atKey, functionName=fName, functionArgs=fArgs)
 
                 schemaDataDict[tableId].extend(rowDList)
 
         return schemaDataDict
 
-    def __mapInstanceCategory(self, tObj, categoryName, myContainer, filterType):
+    def __makeMapPlan(self, selectedTableIdList, schemaIdExcludeD, nameKeys, collectionName):
+        """ Return the mapping plan for the input (sorted) table selection -
+
+            planL = [(tableId, schema object, mapped instance category list, excluded attribute Id set, [(atId, atKey, function, args), ...]), ...]
+            categoryIndexD = {instance category name: [plan index, ...], ...}
+            syntheticL = [plan index of tables with no mapped instance categories, ...]
+        """
+        attributeExcludeD = {}
+        if nameKeys:
+            for schemaId, atId in self.__sD.getCollectionExcludedAttributes(collectionName, asSchemaIds=True):
+                attributeExcludeD.setdefault(schemaId, set()).add(atId)
+            attributeExcludeD = {schemaId: frozenset(atIdS) for schemaId, atIdS in attributeExcludeD.items()}
+        #
+        planL = []
+        categoryIndexD = {}
+        syntheticL = []
+        for tableId in selectedTableIdList:
+            if not self.__sD.hasSchemaObject(tableId) or tableId in schemaIdExcludeD:
+                continue
+            tObj = self.__sD.getSchemaObject(tableId)
+            # Instance categories that are mapped to the current table -
+            mapCategoryNameList = tObj.getMapInstanceCategoryList()
+            # Attribute Ids that are not directly mapped to the schema (e.g. functions)
+            excludeAttributeIdS = attributeExcludeD.get(tableId)
+            otherAttributeL = []
+            for atId in tObj.getMapOtherAttributeIdList():
+                if excludeAttributeIdS and atId in excludeAttributeIdS:
+                    continue
+                atKey = tObj.getAttributeName(atId) if nameKeys else atId
+                otherAttributeL.append((atId, atKey, tObj.getMapAttributeFunction(atId), tObj.getMapAttributeFunctionArgs(atId)))
+            #
+            ii = len(planL)
+            planL.append((tableId, tObj, mapCategoryNameList, excludeAttributeIdS, otherAttributeL))
+            if not mapCategoryNameList:
+                syntheticL.append(ii)
+            for categoryName in mapCategoryNameList:
+                categoryIndexD.setdefault(categoryName, []).append(ii)
+        return planL, categoryIndexD, syntheticL
+
+    def __mapInstanceCategory(self, tObj, categoryName, myContainer, filterType, nameKeys=False, excludeAttributeIdS=None):
         """ Extract data from the input instance category and map these data to the organization
             in the input table schema definition object.
 
@@ -707,14 +865,15 @@ class SchemaDefDataPrep(object):
         if catObj is None:
             return retList
         attributeNameList = catObj.getAttributeList()
+        containerName = myContainer.getName()
+        trf = self.__dtObj.getRowTransformer(tObj.getId(), attributeNameList, nameKeys=nameKeys, excludeAttributeIdS=excludeAttributeIdS)
         #
         for row in catObj.getRowList():
-            dD = self.__dtObj.processRecord(tObj.getId(), row, attributeNameList, containerName=myContainer.getName())
-            retList.append(dD)
+            retList.append(trf(row, containerName=containerName))
 
         return retList
 
-    def __mapInstanceCategoryList(self, tObj, categoryNameList, myContainer, filterType):
+    def __mapInstanceCategoryList(self, tObj, categoryNameList, myContainer, filterType, nameKeys=False, excludeAttributeIdS=None):
         """ Extract data from the input instance categories and map these data to the organization
             in the input table schema definition object.
 
@@ -727,43 +886,63 @@ class SchemaDefDataPrep(object):
         # Consider mD as orderdict
         _ = filterType
         mD = {}
+        containerName = myContainer.getName()
         for categoryName in categoryNameList:
             catObj = myContainer.getObj(categoryName)
             if catObj is None:
                 continue
             attributeNameList = catObj.getAttributeList()
-            attributeIndexDict = catObj.getAttributeIndexDict()
             #
-            # dictionary of merging indices for each attribute in this category -
+            # getter for the tuple of merging index values in each row of this category -
             #
-            indL = tObj.getMapMergeIndexAttributes(categoryName)
+            ky = (tObj.getId(), categoryName, tuple(attributeNameList))
+            if ky not in self.__mergeKeyD:
+                self.__mergeKeyD[ky] = self.__makeMergeKeyGetter(tObj.getMapMergeIndexAttributes(categoryName), catObj.getAttributeIndexDict())
+            getKey, indexList = self.__mergeKeyD[ky]
+            trf = self.__dtObj.getRowTransformer(tObj.getId(), attributeNameList, nameKeys=nameKeys, excludeAttributeIdS=excludeAttributeIdS)
 
             for row in catObj.getRowList():
-                # assign merge index
-                mK = []
-                for atName in indL:
-                    try:
-                        mK.append(row[attributeIndexDict[atName]])
-                    except Exception as e:
-                        # would reflect a serious issue of missing key-
-                        if self.__debug:
-                            logger.exception("Failing with %s", str(e))
-                #
+                try:
+                    tk = getKey(row)
+                except IndexError:
+                    # short row - keep the merging values that are present
+                    tk = tuple([row[ii] for ii in indexList if ii < len(row)])
 
-                dD = self.__dtObj.processRecord(tObj.getId(), row, attributeNameList, containerName=myContainer.getName())
+                dD = trf(row, containerName=containerName)
 
                 #
                 # Update this row using exact matching of the merging key --
                 # jdw  - will later add more complex comparisons
                 #
-                tk = tuple(mK)
-                if tk not in mD:
-                    mD[tk] = {}
-
-                mD[tk].update(dD)
+                if tk in mD:
+                    mD[tk].update(dD)
+                else:
+                    mD[tk] = dD
 
         return mD.values()
 
+    def __makeMergeKeyGetter(self, indL, attributeIndexDict):
+        """ Return a function returning the tuple of merging index values (indL) from an instance
+            category row and the list of row positions of these values.  Merging attributes missing
+            from the category are omitted from the key.
+        """
+        indexList = [attributeIndexDict[atName] for atName in indL if atName in attributeIndexDict]
+        if len(indexList) > 1:
+            getter = itemgetter(*indexList)
+        elif indexList:
+            ii = indexList[0]
+
+            def getter(row):
+                return (row[ii],)
+
+        else:
+
+            def getter(row):
+                _ = row
+                return ()
+
+        return getter, indexList
+
 
 if __name__ == "__main__":
     pass
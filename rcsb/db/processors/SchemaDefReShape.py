@@ -7,6 +7,7 @@
 # Updates:
 #    15-Aug-2018 jdw add next() method for py2 compatibility
 #    16-Aug-2018 jdw add remaining layouts for sliced schema
+#    18-Oct-2026 agent add one-pass slicing for the rowwise_by_name and columnwise_by_name styles
 ##
 """
 Companion class to reshape data objects produced by SchemaDefDataPrep()
@@ -113,8 +114,12 @@ class SchemaDefReShape(object):
         """
         return self.__reshapeSchemaData(schemaDataDictById, styleType=styleType, collectionName=collectionName)
 
-    def applySlicedShape(self, schemaDataDictById, styleType="rowwise_by_name", sliceFilter=None, collectionName=None):
-        """
+    def applySlicedShape(self, schemaDataDictById, styleType="rowwise_by_name", sliceFilter=None, collectionName=None, onePass=True):
+        """ Reshape the input data and split the result by the values of the parent items of the input slice filter.
+
+            Args:
+                onePass (bool, optional): bucket rows by slice value in a single pass (default) rather than
+                                          scanning all rows for each slice value
         """
         rL = []
         if sliceFilter:
@@ -127,12 +132,18 @@ class SchemaDefReShape(object):
             if sliceValues.isEmpty():
                 return rL
             #
-            flagNew = True
             # JDW - This path is better performing -
-            if styleType == "rowwise_by_name_with_cardinality" and flagNew:
+            if styleType == "rowwise_by_name_with_cardinality" and onePass:
                 logger.debug("Invoking one-pass slice filter %s", sliceFilter)
                 rL = self.__sliceRowwiseByNameWithCardOnePass(schemaDataDictById, sliceFilter, sliceIndex, collectionName=collectionName)
                 logger.debug("Completed one-pass slice filter %s", sliceFilter)
+            elif styleType in ["rowwise_by_name", "columnwise_by_name"] and onePass:
+                try:
+                    rL = self.__sliceOnePass(schemaDataDictById, sliceFilter, sliceValues, sliceIndex, styleType=styleType, collectionName=collectionName)
+                except TypeError as e:
+                    # unhashable slice key values
+                    logger.debug("One-pass slice filter %s failing with %s", sliceFilter, str(e))
+                    rL = self.applySlicedShape(schemaDataDictById, styleType=styleType, sliceFilter=sliceFilter, collectionName=collectionName, onePass=False)
             else:
                 # JDW - This path works but is not well performing
                 for ii, sliceValue in enumerate(sliceValues):
@@ -464,6 +475,78 @@ class SchemaDefReShape(object):
 
     # ---------------------- ---------------------- ---------------------- ---------------------- ----------------------
     #
+    def __sliceOnePass(self, schemaDataDictById, sliceFilter, sliceValues, sliceIndex, styleType="rowwise_by_name", collectionName=None):
+        """ Slice and reshape the input data in the rowwise_by_name or columnwise_by_name style using a single
+            pass over the rows of each schema object.  Rows are bucketed by the tuple of their slice key values
+            and are assigned to each slice value with the same selection rules as __inSlice().
+
+            Returns: list of reshaped data dictionaries in slice value order
+        """
+        attributeExcludeD = self.__sD.getCollectionExcludedAttributes(collectionName, asSchemaIds=True)
+        sliceL = list(sliceValues)
+        # parent items (pCat, pAt) in the order of the values in each slice value tuple
+        parentKeyL = [pvTup[0] for pvTup in sliceL[0]] if sliceL else []
+        #
+        # schemaId -> (schemaObjName, schemaObj, renamed row list, bucket dictionary or None for all rows)
+        tableL = []
+        for schemaId in schemaDataDictById:
+            schemaObj = self.__sD.getSchemaObject(schemaId)
+            lExtra = schemaObj.isSliceExtra(sliceFilter)
+            if schemaId not in sliceIndex and not lExtra:
+                continue
+            schemaObjName = self.__sD.getSchemaName(schemaId)
+            iRowDList = schemaDataDictById[schemaId]
+            atNameD = {}
+            oRowDList = []
+            for iRowD in iRowDList:
+                oRowD = {}
+                for atId in iRowD:
+                    if (schemaId, atId) in attributeExcludeD:
+                        continue
+                    if atId not in atNameD:
+                        atNameD[atId] = schemaObj.getAttributeName(atId)
+                    oRowD[atNameD[atId]] = iRowD[atId]
+                oRowDList.append(oRowD)
+            #
+            bucketD = None
+            if not lExtra:
+                bucketD = {}
+                chAtLL = [sliceIndex[schemaId][pKey] if pKey in sliceIndex[schemaId] else None for pKey in parentKeyL]
+                if None not in chAtLL:
+                    for ii, iRowD in enumerate(iRowDList):
+                        valSL = [{iRowD[chAt] for chAt in chAtL if chAt in iRowD} for chAtL in chAtLL]
+                        for vT in itertools.product(*valSL):
+                            bucketD.setdefault(vT, []).append(ii)
+            tableL.append((schemaObjName, schemaObj, oRowDList, bucketD))
+        #
+        rL = []
+        usedS = set()
+        for sliceValue in sliceL:
+            vT = tuple([pvTup[1] for pvTup in sliceValue])
+            rD = {}
+            for schemaObjName, schemaObj, oRowDList, bucketD in tableL:
+                if bucketD is None:
+                    rowIdxL = range(len(oRowDList))
+                else:
+                    rowIdxL = bucketD[vT] if vT in bucketD else []
+                # rows shared by more than one slice are copied
+                sRowDList = []
+                for ii in rowIdxL:
+                    sRowDList.append(copy.copy(oRowDList[ii]) if (id(oRowDList), ii) in usedS else oRowDList[ii])
+                    usedS.add((id(oRowDList), ii))
+                #
+                if styleType == "columnwise_by_name":
+                    colD = {}
+                    for oRowD in sRowDList:
+                        for atName, val in oRowD.items():
+                            colD.setdefault(atName, []).append(val)
+                    if colD or schemaObj.isMandatory():
+                        rD[schemaObjName] = colD
+                elif sRowDList or schemaObj.isMandatory():
+                    rD[schemaObjName] = sRowDList
+            rL.append(rD)
+        return rL
+
     def __sliceRowwiseByNameWithCardOnePass(self, schemaDataDictById, sliceFilter, sliceIndex, collectionName=None):
         debug = False
         #
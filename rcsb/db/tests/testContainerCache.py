@@ -0,0 +1,137 @@
+##
+# File:    testContainerCache.py
+# Author:  agent
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#
+##
+"""
+Tests for the binary cache of parsed data containers.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "agent"
+__email__ = "agent@local"
+__license__ = "Apache 2.0"
+
+import logging
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from mmcif.api.DataCategory import DataCategory
+from mmcif.api.PdbxContainers import DataContainer
+
+from rcsb.db.utils.ContainerCache import ContainerCache
+from rcsb.utils.io.MarshalUtil import MarshalUtil
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+
+class ContainerCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = tempfile.mkdtemp()
+        self.__cachePath = os.path.join(self.__workPath, "container-cache")
+        self.__mU = MarshalUtil()
+        self.__pathList = []
+        for ii in range(4):
+            filePath = os.path.join(self.__workPath, "%dabc.cif" % (ii + 1))
+            self.__writeEntry(filePath, "%dABC" % (ii + 1), 200)
+            self.__pathList.append(filePath)
+        self.__numRead = 0
+        self.__startTime = time.time()
+        logger.debug("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        shutil.rmtree(self.__workPath, ignore_errors=True)
+        endTime = time.time()
+        logger.debug("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def __writeEntry(self, filePath, name, numRows, mtime=None):
+        container = DataContainer(name)
+        container.append(DataCategory("atom_site", ["id", "type_symbol", "Cartn_x"], [[str(ii), "C", "%.3f" % (ii * 0.5)] for ii in range(numRows)]))
+        self.__mU.doExport(filePath, [container], fmt="mmcif")
+        if mtime:
+            os.utime(filePath, (mtime, mtime))
+
+    def __readContainers(self, locatorObj):
+        self.__numRead += 1
+        return self.__mU.doImport(locatorObj, fmt="mmcif")
+
+    def __assertSame(self, cL1, cL2):
+        self.assertEqual([container.getName() for container in cL1], [container.getName() for container in cL2])
+        for c1, c2 in zip(cL1, cL2):
+            self.assertEqual(c1.getObjNameList(), c2.getObjNameList())
+            for catName in c1.getObjNameList():
+                self.assertEqual(c1.getObj(catName).getAttributeList(), c2.getObj(catName).getAttributeList())
+                self.assertEqual(c1.getObj(catName).getRowList(), c2.getObj(catName).getRowList())
+
+    def testContainerCache(self):
+        """Test case - cached containers match parsed containers and changed files are parsed again"""
+        try:
+            cc = ContainerCache(self.__cachePath)
+            refL = [self.__readContainers(pth) for pth in self.__pathList]
+            self.__numRead = 0
+            for _ in range(2):
+                for pth, cL in zip(self.__pathList, refL):
+                    self.__assertSame(cc.getContainerList(pth, self.__readContainers), cL)
+            self.assertEqual(self.__numRead, len(self.__pathList))
+            self.assertEqual(cc.getStats()["hits"], len(self.__pathList))
+            # -- cached entries are shared across instances
+            cc = ContainerCache(self.__cachePath)
+            self.__assertSame(cc.getContainerList(self.__pathList[0], self.__readContainers), refL[0])
+            self.assertEqual(cc.getStats()["hits"], 1)
+            # -- a changed input file is parsed again
+            self.__writeEntry(self.__pathList[0], "1ABC", 210, mtime=1.0e9)
+            cL = cc.getContainerList(self.__pathList[0], self.__readContainers)
+            self.assertEqual(cL[0].getObj("atom_site").getRowCount(), 210)
+            self.assertEqual(cc.getStats()["misses"], 1)
+            # -- merged locator objects are keyed by all component files
+            locatorObj = ({"locator": self.__pathList[1], "fmt": "mmcif", "kwargs": {}}, {"locator": self.__pathList[2], "fmt": "mmcif", "kwargs": {}})
+            cc.getContainerList(locatorObj, lambda lObj: self.__readContainers(lObj[0]["locator"]))
+            self.__assertSame(cc.getContainerList(locatorObj, self.__readContainers), refL[1])
+            self.assertEqual(cc.getStats()["hits"], 2)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testContainerCacheDigestAndEviction(self):
+        """Test case - digest keys ignore modification times and the cache size is bounded"""
+        try:
+            cc = ContainerCache(self.__cachePath, useDigest=True)
+            cc.getContainerList(self.__pathList[0], self.__readContainers)
+            os.utime(self.__pathList[0], (1.0e9, 1.0e9))
+            cc.getContainerList(self.__pathList[0], self.__readContainers)
+            self.assertEqual(cc.getStats()["hits"], 1)
+            #
+            entrySize = sum([os.path.getsize(os.path.join(dirPath, fn)) for dirPath, _, fL in os.walk(self.__cachePath) for fn in fL])
+            shutil.rmtree(self.__cachePath)
+            cc = ContainerCache(self.__cachePath, maxSizeMB=2.5 * entrySize / 1048576.0)
+            for pth in self.__pathList:
+                cc.getContainerList(pth, self.__readContainers)
+            numEntries = sum([len(fL) for _, _, fL in os.walk(self.__cachePath)])
+            self.assertGreater(cc.getStats()["evictions"], 0)
+            self.assertLess(numEntries, len(self.__pathList))
+            self.assertGreater(numEntries, 0)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+def suiteContainerCache():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(ContainerCacheTests("testContainerCache"))
+    suiteSelect.addTest(ContainerCacheTests("testContainerCacheDigestAndEviction"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = suiteContainerCache()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
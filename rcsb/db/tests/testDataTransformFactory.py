@@ -0,0 +1,339 @@
+##
+# File:    testDataTransformFactory.py
+# Author:  agent
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#   18-Oct-2026 agent add date cast tests and micro-benchmarks
+#   18-Oct-2026 agent add tests of precomputed enumeration normalization maps and pickling
+#   18-Oct-2026 agent test attribute name keyed row transformers with attribute exclusions
+#   18-Oct-2026 agent add string filter fast path tests and micro-benchmarks
+##
+"""
+Tests and micro-benchmarks for data transformation casting and string filter functions.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "agent"
+__email__ = "agent@local"
+__license__ = "Apache 2.0"
+
+import html
+import logging
+import os
+import pickle
+import time
+import unittest
+from functools import reduce
+
+import dateutil.parser
+import pytz
+
+from rcsb.db.define.SchemaDefAccess import SchemaDefAccess
+from rcsb.db.processors.DataTransformFactory import DataTransform, DataTransformFactory, TrfValue, parseDate
+from rcsb.db.utils.RepositoryProvider import RepositoryProvider
+from rcsb.utils.config.ConfigUtil import ConfigUtil
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+
+class DataTransformFactoryTests(unittest.TestCase):
+    def setUp(self):
+        self.__dateList = ["2019-%02d-%02d" % (1 + ii % 12, 1 + ii % 28) for ii in range(40)]
+        self.__dateList += ["2019-%02d-%02d:%02d:%02d" % (1 + ii % 12, 1 + ii % 28, ii % 24, ii % 60) for ii in range(40)]
+        self.__dateList += ["2019-03-04:10:11:12", "12-JAN-2019", "2019-02-30:10:11"]
+        self.__numIter = 200
+        self.__textList = ["PROTEIN", "Hemoglobin alpha chain", "&lt;b&gt; bold &amp; &#945;-helix", "x-ray diffraction", "&Psi; angle", "a & b", ""]
+        self.__startTime = time.time()
+        logger.debug("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.debug("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def __dateutilParse(self, value):
+        return dateutil.parser.parse(value.replace(":", " ", 1))
+
+    def testDateCasts(self):
+        """Test case - fast path date casts match the dateutil parser results"""
+        try:
+            dt = DataTransform(None)
+            for value in self.__dateList:
+                try:
+                    refObj = self.__dateutilParse(value)
+                except ValueError:
+                    with self.assertRaises(ValueError):
+                        parseDate(value)
+                    continue
+                tV = TrfValue(value, "date", 0, False)
+                self.assertEqual(dt.castDateToObj(tV).value, refObj)
+                self.assertEqual(dt.castDateTimeToIsoDate(tV).value, refObj.replace(tzinfo=pytz.UTC).isoformat())
+                self.assertEqual(dt.castDateToIsoDate(tV).value, refObj.isoformat()[:10])
+            #
+            tV = TrfValue("?", "date", 0, False)
+            self.assertTrue(dt.castDateToIsoDate(tV).isNull)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testDateCastBenchmark(self):
+        """Micro-benchmark - per-value cost of date casting using dateutil and the memoized fast path"""
+        try:
+            valueList = [value for value in self.__dateList[:80]] * self.__numIter
+            startTime = time.time()
+            for value in valueList:
+                self.__dateutilParse(value).replace(tzinfo=pytz.UTC).isoformat()
+            refSeconds = time.time() - startTime
+            #
+            dt = DataTransform(None)
+            startTime = time.time()
+            for value in valueList:
+                dt.castDateTimeToIsoDate(TrfValue(value, "date", 0, False))
+            fastSeconds = time.time() - startTime
+            logger.info(
+                "Date cast per-value cost (usec) dateutil %.3f fast path %.3f (speedup %.1f)",
+                1.0e6 * refSeconds / len(valueList),
+                1.0e6 * fastSeconds / len(valueList),
+                refSeconds / max(fastSeconds, 1.0e-9),
+            )
+            self.assertLess(fastSeconds, refSeconds)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def __getStringCells(self):
+        """Return the non-null string cells of the categories of a mock repository entry."""
+        mockTopPath = os.path.join(TOPDIR, "rcsb", "mock-data")
+        configPath = os.path.join(TOPDIR, "rcsb", "db", "config", "exdb-config-example.yml")
+        cfgOb = ConfigUtil(configPath=configPath, defaultSectionName="site_info_configuration", mockTopPath=mockTopPath)
+        rpP = RepositoryProvider(cfgOb=cfgOb, numProc=1, fileLimit=1, cachePath=os.path.join(TOPDIR, "CACHE"))
+        containerList = rpP.getContainerList(rpP.getLocatorObjList(contentType="pdbx")[:1])
+        cellList = []
+        for container in containerList:
+            for catName in container.getObjNameList():
+                for row in container.getObj(catName).getRowList():
+                    cellList.extend([val for val in row if isinstance(val, str) and val not in ["?", ".", ""]])
+        return cellList
+
+    def __unescapeAll(self, dt, cellList):
+        startTime = time.time()
+        refList = [TrfValue(html.unescape(val), "text", 0, False) for val in cellList]
+        refSeconds = time.time() - startTime
+        startTime = time.time()
+        fastList = [dt.translateXMLCharRefs(TrfValue(val, "text", 0, False)) for val in cellList]
+        fastSeconds = time.time() - startTime
+        self.assertEqual(refList, fastList)
+        return refSeconds, fastSeconds
+
+    def testStringFilters(self):
+        """Test case - string filters return unchanged values as is and translate character references"""
+        try:
+            dt = DataTransform(None)
+            for value in self.__textList:
+                tV = TrfValue(value, "text", len(value), False)
+                rV = dt.translateXMLCharRefs(tV)
+                self.assertEqual(rV.value, html.unescape(value))
+                if "&" not in value:
+                    self.assertIs(rV, tV)
+                self.assertEqual(dt.stripWhiteSpace(tV).value, "".join(value.split()))
+            #
+            tV = TrfValue(self.__textList, "text", 0, False)
+            self.assertEqual(dt.translateXMLCharRefsIt(tV).value, [html.unescape(value) for value in self.__textList])
+            tV = TrfValue(self.__textList[:2], "text", 0, False)
+            self.assertIs(dt.translateXMLCharRefsIt(tV), tV)
+            tV = TrfValue("PROTEIN", "text", 7, False)
+            self.assertIs(dt.castString(tV), tV)
+            self.assertTrue(dt.castString(TrfValue(".", "text", 1, False)).isNull)
+            #
+            cellList = self.__textList * 20000
+            refSeconds, fastSeconds = self.__unescapeAll(dt, cellList)
+            logger.info("Character reference translation (%d values) html.unescape %.4f fast path %.4f seconds", len(cellList), refSeconds, fastSeconds)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testEntryStringFilterBenchmark(self):
+        """Micro-benchmark - character reference translation over the string cells of a repository entry"""
+        try:
+            cellList = self.__getStringCells()
+            self.assertGreater(len(cellList), 0)
+            refSeconds, fastSeconds = self.__unescapeAll(DataTransform(None), cellList * 10)
+            logger.info("Entry string cells (%d values) html.unescape %.4f fast path %.4f seconds", 10 * len(cellList), refSeconds, fastSeconds)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def __getSchemaDefAccess(self):
+        """Return schema definition accessors for a single table with attributes of each transformed type."""
+        atL = [
+            # (attribute Id, attribute name, app type, width, enumeration, filter types, iterable delimiter)
+            ("ID", "id", "varchar", 10, [], [], None),
+            ("NAME", "name", "varchar", 20, [], ["TRANSLATE_XMLCHARREFS"], None),
+            ("CODE", "code", "varchar", 20, [], ["STRIP_WS"], None),
+            ("METHOD", "method", "varchar", 40, ["X-RAY DIFFRACTION", "Solution NMR"], [], None),
+            ("COUNT", "count", "int", 0, [], [], None),
+            ("VALUE", "value", "float", 0, [], [], None),
+            ("DATE", "date", "date", 0, [], [], None),
+            ("DATETIME", "datetime", "datetime", 0, [], [], None),
+            ("KEYWORDS", "keywords", "varchar", 80, [], [], ","),
+            ("SCORES", "scores", "float", 0, [], [], ","),
+        ]
+        tD = {
+            "SCHEMA_ID": "TEST_TABLE",
+            "SCHEMA_NAME": "test_table",
+            "ATTRIBUTES": {atId: atName for atId, atName, _, _, _, _, _ in atL},
+            "ATTRIBUTE_INFO": {},
+            "ATTRIBUTE_MAP": {atId: {"CATEGORY": "test_table", "ATTRIBUTE": atName} for atId, atName, _, _, _, _, _ in atL},
+        }
+        for ii, (atId, _, appType, width, enumL, filterL, delimiter) in enumerate(atL):
+            tD["ATTRIBUTE_INFO"][atId] = {"APP_TYPE": appType, "ORDER": ii + 1, "WIDTH": width, "ENUMERATION": enumL, "FILTER_TYPES": filterL, "ITERABLE_DELIMITER": delimiter}
+        # attribute without an instance mapping
+        tD["ATTRIBUTES"]["ORDINAL"] = "ordinal"
+        tD["ATTRIBUTE_INFO"]["ORDINAL"] = {"APP_TYPE": "int", "ORDER": len(atL) + 1, "WIDTH": 0, "ENUMERATION": [], "FILTER_TYPES": [], "ITERABLE_DELIMITER": None}
+        tD["ATTRIBUTE_MAP"]["ORDINAL"] = {"CATEGORY": None, "ATTRIBUTE": None}
+        return SchemaDefAccess({"DATABASE_NAME": "test", "SCHEMA_DICT": {"TEST_TABLE": tD}, "SLICE_PARENT_ITEMS": {}, "SLICE_PARENT_FILTERS": {}})
+
+    def __getRowList(self):
+        rowList = [
+            ["1", "alpha &amp; beta", " A B\tC ", "x-ray diffraction", "12", "1.5", "2019-03-04", "2019-03-04:10:11:12", "a, b,c", "1.0, 2.5"],
+            ["2", "a very long protein name", "ABC", "SOLUTION NMR", "?", ".", "?", ".", "?", "."],
+            ["3", "", ".", "Electron Microscopy", "", "-2e3", "12-JAN-2019", "2019-02-03", "single", "3"],
+            ["4", None, None, None, None, None, None, None, None, None],
+            ["5", "&Psi; angle", "X Y", "X-RAY DIFFRACTION", "notAnInteger", "2.0", "2019-01-01", "2019-01-01", "c", "4"],
+        ]
+        return rowList
+
+    def __processRecordReference(self, dtf, tableId, row, attributeNameList, dropEmpty):
+        """Per-attribute transformation of an input row (as performed prior to compiling row transformers)."""
+        dT = dtf.get(tableId)
+        nullValueD = {"string": "", "integer": r"\N", "float": r"\N"}
+        pureCastD = {atName: castType for atName, castType in dT["pureCast"].items() if castType in nullValueD}
+        atName = None
+        dD = {} if dropEmpty else dict(dT["atNullValues"])
+        try:
+            for ii, atName in enumerate(attributeNameList):
+                if atName not in dT["atNameD"]:
+                    continue
+                nullFlag = row[ii] is None
+                if atName in pureCastD:
+                    if nullFlag and dropEmpty:
+                        continue
+                    if row[ii] in ["?", ".", ""]:
+                        if not dropEmpty:
+                            dD[dT["atNameD"][atName]] = nullValueD[pureCastD[atName]]
+                        continue
+                    if pureCastD[atName] == "string":
+                        dD[dT["atNameD"][atName]] = row[ii]
+                    elif pureCastD[atName] == "integer":
+                        dD[dT["atNameD"][atName]] = int(row[ii])
+                    elif pureCastD[atName] == "float":
+                        dD[dT["atNameD"][atName]] = float(row[ii])
+                else:
+                    vT = reduce(lambda x, y: y(x), dT["atFuncD"][atName], TrfValue(row[ii], dT["atNameD"][atName], 0, nullFlag))
+                    if dropEmpty and vT.isNull:
+                        continue
+                    dD[dT["atNameD"][atName]] = vT.value
+        except Exception as e:
+            logger.debug("Reference transformation failing for %s with %s", atName, str(e))
+        return dD
+
+    def __assertSameRecord(self, rD, refD):
+        self.assertEqual(rD, refD)
+        self.assertEqual({ky: type(val) for ky, val in rD.items()}, {ky: type(val) for ky, val in refD.items()})
+
+    def testCompiledRowTransformer(self):
+        """Test case - compiled row transformers match the per-attribute transformation of each row"""
+        try:
+            sD = self.__getSchemaDefAccess()
+            sObj = sD.getSchemaObject("TEST_TABLE")
+            atNameList = sObj.getMapAttributeNameList()
+            filterTypeList = [
+                "",
+                "drop-empty-attributes",
+                "drop-empty-attributes|convert-iterables|normalize-enums|translateXMLCharRefs",
+                "skip-max-width|convert-iterables|normalize-enums|translateXMLCharRefs",
+            ]
+            for filterType in filterTypeList:
+                dropEmpty = "drop-empty-attributes" in filterType
+                dtf = DataTransformFactory(schemaDefAccessObj=sD, filterType=filterType)
+                # -- input attribute order differs from the schema order and includes an unmapped attribute
+                for nameList in [atNameList, list(reversed(atNameList)) + ["unmapped"]]:
+                    for row in self.__getRowList():
+                        inpRow = row if nameList is atNameList else list(reversed(row)) + ["x"]
+                        refD = self.__processRecordReference(dtf, "TEST_TABLE", inpRow, nameList, dropEmpty)
+                        self.__assertSameRecord(dtf.processRecord("TEST_TABLE", inpRow, nameList), refD)
+                        # -- keyed by attribute name with exclusions
+                        trf = dtf.getRowTransformer("TEST_TABLE", nameList, nameKeys=True, excludeAttributeIdS=frozenset(["ID"]))
+                        self.__assertSameRecord(trf(inpRow), {sObj.getAttributeName(atId): val for atId, val in refD.items() if atId != "ID"})
+                #
+                rD = dtf.processRecord("TEST_TABLE", self.__getRowList()[0], atNameList)
+                name = "alpha & beta" if "translateXMLCharRefs" in filterType else "alpha &amp; beta"
+                self.assertEqual((rD["NAME"], rD["CODE"], rD["COUNT"], rD["VALUE"], rD["DATE"]), (name, "ABC", 12, 1.5, "2019-03-04"))
+                if "normalize-enums" in filterType:
+                    self.assertEqual(rD["METHOD"], "X-RAY DIFFRACTION")
+                if "convert-iterables" in filterType:
+                    self.assertEqual((rD["KEYWORDS"], rD["SCORES"]), (["a", "b", "c"], [1.0, 2.5]))
+                rD = dtf.processRecord("TEST_TABLE", self.__getRowList()[1], atNameList)
+                self.assertEqual(rD["NAME"], "a very long protein name" if "skip-max-width" in filterType else "a very long protein ")
+                # -- a failing cast returns the attributes transformed prior to the failure
+                rD = dtf.processRecord("TEST_TABLE", self.__getRowList()[4], atNameList)
+                self.assertNotEqual(rD.get("VALUE"), 2.0)
+                self.assertEqual(rD["ID"], "5")
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testEnumNormalizationMaps(self):
+        """Test case - precomputed enumeration normalization maps and pickled schema accessors and transform factories"""
+        try:
+            sD = self.__getSchemaDefAccess()
+            sObj = sD.getSchemaObject("TEST_TABLE")
+            eD = sObj.getEnumNormalizationMap("METHOD")
+            self.assertEqual(dict(eD), {"x-ray diffraction": "X-RAY DIFFRACTION", "solution nmr": "Solution NMR"})
+            self.assertIs(sD.getSchemaObject("TEST_TABLE").getEnumNormalizationMap("METHOD"), eD)
+            self.assertIsNone(sObj.getEnumNormalizationMap("NAME"))
+            with self.assertRaises(TypeError):
+                eD["electron microscopy"] = "ELECTRON MICROSCOPY"
+            self.assertEqual(sObj.normalizeEnum("METHOD", "solution NMR"), "Solution NMR")
+            self.assertEqual(sObj.normalizeEnum("METHOD", "neutron diffraction"), "neutron diffraction")
+            #
+            atNameList = sObj.getMapAttributeNameList()
+            dtf = DataTransformFactory(schemaDefAccessObj=sD, filterType="skip-max-width|normalize-enums")
+            self.assertEqual(dtf.get("TEST_TABLE")["pureCast"]["method"], "enum")
+            self.assertEqual(DataTransformFactory(schemaDefAccessObj=sD, filterType="skip-max-width").get("TEST_TABLE")["pureCast"]["method"], "string")
+            rDL = [dtf.processRecord("TEST_TABLE", row, atNameList) for row in self.__getRowList()]
+            self.assertEqual([rD.get("METHOD") for rD in rDL], ["X-RAY DIFFRACTION", "Solution NMR", "Electron Microscopy", None, "X-RAY DIFFRACTION"])
+            #
+            # -- pickled accessors and factories (after compiling row transformers) rebuild the normalization maps
+            sD2 = pickle.loads(pickle.dumps(sD))
+            self.assertEqual(dict(sD2.getSchemaObject("TEST_TABLE").getEnumNormalizationMap("METHOD")), dict(eD))
+            sObj2 = pickle.loads(pickle.dumps(sObj))
+            self.assertEqual(sObj2.normalizeEnum("METHOD", "solution NMR"), "Solution NMR")
+            dtf2 = pickle.loads(pickle.dumps(dtf))
+            self.assertEqual([dtf2.processRecord("TEST_TABLE", row, atNameList) for row in self.__getRowList()], rDL)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+def suiteDataTransform():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(DataTransformFactoryTests("testDateCasts"))
+    suiteSelect.addTest(DataTransformFactoryTests("testDateCastBenchmark"))
+    suiteSelect.addTest(DataTransformFactoryTests("testStringFilters"))
+    suiteSelect.addTest(DataTransformFactoryTests("testEntryStringFilterBenchmark"))
+    suiteSelect.addTest(DataTransformFactoryTests("testCompiledRowTransformer"))
+    suiteSelect.addTest(DataTransformFactoryTests("testEnumNormalizationMaps"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = suiteDataTransform()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
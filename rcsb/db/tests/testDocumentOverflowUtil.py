@@ -0,0 +1,146 @@
+##
+# File:    testDocumentOverflowUtil.py
+# Author:  agent
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#
+##
+"""
+Tests for detaching and restoring oversized document content using overflow collections.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "agent"
+__email__ = "agent@local"
+__license__ = "Apache 2.0"
+
+import copy
+import logging
+import time
+import unittest
+
+from rcsb.db.mongo.DocumentOverflowUtil import DocumentOverflowUtil
+from rcsb.db.mongo.MemoryDbClient import MemoryDbClient, clearMemoryStore
+from rcsb.db.mongo.MongoDbUtil import MongoDbUtil
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+
+
+class DocumentOverflowUtilTests(unittest.TestCase):
+    def setUp(self):
+        self.__dbName = "test_database"
+        self.__collectionName = "test_collection"
+        self.__storeName = "overflow-test-store"
+        self.__startTime = time.time()
+        logger.debug("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        clearMemoryStore(self.__storeName)
+        endTime = time.time()
+        logger.debug("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def __makeDocument(self, entryId, nRows):
+        return {
+            "rcsb_id": entryId,
+            "rcsb_entry_container_identifiers": {"entry_id": entryId},
+            "struct": {"title": "Title for %s" % entryId},
+            "atom_site": [{"id": ii, "label_atom_id": "CA", "Cartn_x": float(ii) * 0.5} for ii in range(nRows)],
+            "pdbx_vrpt_summary": {"note": "x" * 4000},
+        }
+
+    def testDetachRestore(self):
+        """Test case - detach oversized content, load parent and overflow documents, and restore the original document
+        """
+        try:
+            dou = DocumentOverflowUtil(limitMB=0.01, keyNames=["rcsb_entry_container_identifiers.entry_id"])
+            dList = [self.__makeDocument("1ABC", 2000), self.__makeDocument("2ABC", 5)]
+            refList = copy.deepcopy(dList)
+            dList, oDList, rejectList = dou.detach(dList)
+            self.assertEqual(len(rejectList), 0)
+            self.assertGreater(len(oDList), 1)
+            self.assertIn(dou.getStubKey(), dList[0])
+            self.assertNotIn("atom_site", dList[0])
+            self.assertNotIn(dou.getStubKey(), dList[1])
+            self.assertTrue(all(oD["rcsb_entry_container_identifiers"]["entry_id"] == "1ABC" for oD in oDList))
+            #
+            mg = MongoDbUtil(MemoryDbClient(storeName=self.__storeName))
+            ok = mg.createCollection(self.__dbName, self.__collectionName)
+            self.assertTrue(ok)
+            rIdL = mg.insertList(self.__dbName, self.__collectionName, dList, keyNames=["rcsb_id"])
+            self.assertEqual(len(rIdL), 2)
+            orIdL = mg.insertList(self.__dbName, dou.getOverflowCollectionName(self.__collectionName), oDList, keyNames=["_parent_id", "overflow_key", "overflow_part"])
+            self.assertEqual(len(orIdL), len(oDList))
+            #
+            for refD in refList:
+                dObj = mg.fetchOne(self.__dbName, self.__collectionName, "rcsb_id", refD["rcsb_id"])
+                dObj = dou.restore(mg, self.__dbName, self.__collectionName, dObj)
+                dObj.pop("_id")
+                self.assertEqual(dObj, refD)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testDetachDictReject(self):
+        """Test case - split oversized dictionary content and reject documents which cannot be brought within the size limit
+        """
+        try:
+            dou = DocumentOverflowUtil(limitMB=0.01, keyNames=["rcsb_entry_container_identifiers.entry_id"])
+            dictD = self.__makeDocument("1ABC", 5)
+            dictD["rcsb_nonpolymer_instance_validation_score"] = {"score_%04d" % ii: {"value": float(ii), "note": "y" * 40} for ii in range(400)}
+            itemD = self.__makeDocument("2ABC", 5)
+            itemD["atom_site"].append({"id": 5, "label_atom_id": "z" * 12000})
+            keyD = self.__makeDocument("3ABC", 5)
+            keyD["rcsb_entry_container_identifiers"]["note"] = "k" * 12000
+            dList = [dictD, itemD, keyD]
+            refD = copy.deepcopy(dictD)
+            #
+            dList, oDList, rejectList = dou.detach(dList)
+            self.assertEqual([dD["rcsb_id"] for dD in dList], ["1ABC"])
+            self.assertEqual([dD["rcsb_id"] for dD in rejectList], ["2ABC", "3ABC"])
+            partL = [oD for oD in oDList if oD["overflow_key"] == "rcsb_nonpolymer_instance_validation_score"]
+            self.assertGreater(len(partL), 1)
+            self.assertTrue(all(oD["overflow_part_type"] == "dict" for oD in partL))
+            self.assertTrue(all(oD["_parent_id"] == dList[0]["_id"] for oD in oDList))
+            #
+            mg = MongoDbUtil(MemoryDbClient(storeName=self.__storeName))
+            rIdL = mg.insertList(self.__dbName, self.__collectionName, dList, keyNames=["rcsb_id"])
+            self.assertEqual(len(rIdL), 1)
+            orIdL = mg.insertList(self.__dbName, dou.getOverflowCollectionName(self.__collectionName), oDList, keyNames=["_parent_id", "overflow_key", "overflow_part"])
+            self.assertEqual(len(orIdL), len(oDList))
+            dObj = mg.fetchOne(self.__dbName, self.__collectionName, "rcsb_id", "1ABC")
+            dObj = dou.restore(mg, self.__dbName, self.__collectionName, dObj)
+            dObj.pop("_id")
+            self.assertEqual(dObj, refD)
+            self.assertEqual(list(dObj["rcsb_nonpolymer_instance_validation_score"].keys()), list(refD["rcsb_nonpolymer_instance_validation_score"].keys()))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testOverflowSchema(self):
+        """Test case - add the overflow reference stub to a collection schema
+        """
+        try:
+            dou = DocumentOverflowUtil()
+            sD = {"bsonType": "object", "properties": {"rcsb_id": {"bsonType": "string"}}, "additionalProperties": False}
+            rD = dou.addOverflowSchema(sD, encodingType="BSON")
+            self.assertIn(dou.getStubKey(), rD["properties"])
+            self.assertNotIn(dou.getStubKey(), sD["properties"])
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+def documentOverflowSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(DocumentOverflowUtilTests("testDetachRestore"))
+    suiteSelect.addTest(DocumentOverflowUtilTests("testDetachDictReject"))
+    suiteSelect.addTest(DocumentOverflowUtilTests("testOverflowSchema"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = documentOverflowSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
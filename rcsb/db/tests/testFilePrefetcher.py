@@ -0,0 +1,120 @@
+##
+# File:    testFilePrefetcher.py
+# Author:  agent
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#
+##
+"""
+Tests for the read-ahead of input files on a background thread.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "agent"
+__email__ = "agent@local"
+__license__ = "Apache 2.0"
+
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from rcsb.db.utils.FilePrefetcher import FilePrefetcher
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+
+class FilePrefetcherTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = tempfile.mkdtemp()
+        self.__pathList = []
+        for ii in range(10):
+            filePath = os.path.join(self.__workPath, "%dabc.cif" % ii)
+            with open(filePath, "wb") as ofh:
+                ofh.write(b"x" * 100000)
+            self.__pathList.append(filePath)
+        self.__lock = threading.Lock()
+        self.__requestList = []
+        self.__startTime = time.time()
+        logger.debug("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        shutil.rmtree(self.__workPath, ignore_errors=True)
+        endTime = time.time()
+        logger.debug("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def __getPaths(self, item):
+        with self.__lock:
+            self.__requestList.append(item)
+        return [item, item + ".missing"]
+
+    def testPrefetchOrderAndLimits(self):
+        """Test case - items are returned in order and read-ahead is bounded by count and size"""
+        try:
+            itemL = []
+            for item in FilePrefetcher(self.__pathList, self.__getPaths, numAhead=3, maxSizeMB=1):
+                itemL.append(item)
+                time.sleep(0.02)
+                with self.__lock:
+                    numAhead = len([pth for pth in self.__requestList if self.__pathList.index(pth) > len(itemL) - 1])
+                self.assertLessEqual(numAhead, 3)
+            self.assertEqual(itemL, self.__pathList)
+            self.assertGreater(len(self.__requestList), 0)
+            self.assertEqual(len(self.__requestList), len(set(self.__requestList)))
+            #
+            # -- size limit allows a single file ahead of the consumer
+            self.__requestList = []
+            fP = FilePrefetcher(self.__pathList, self.__getPaths, numAhead=5, maxSizeMB=0.05)
+            itemL = []
+            for item in fP:
+                time.sleep(0.02)
+                with self.__lock:
+                    numAhead = len([pth for pth in self.__requestList if self.__pathList.index(pth) > len(itemL)])
+                self.assertLessEqual(numAhead, 1)
+                itemL.append(item)
+            self.assertEqual(itemL, self.__pathList)
+            statsD = fP.getStats()
+            self.assertEqual(statsD["bytes"], statsD["files"] * 100000)
+            self.assertEqual(statsD["skipped"], statsD["items"])
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testPrefetchClose(self):
+        """Test case - the read-ahead thread stops when iteration is not completed"""
+        try:
+            numThreads = threading.active_count()
+            with FilePrefetcher(self.__pathList, self.__getPaths, numAhead=2) as fP:
+                for ii, _ in enumerate(fP):
+                    if ii == 2:
+                        break
+            self.assertEqual(threading.active_count(), numThreads)
+            self.assertLessEqual(len(self.__requestList), 5)
+            # -- no read-ahead
+            self.__requestList = []
+            self.assertEqual(list(FilePrefetcher(self.__pathList, self.__getPaths, numAhead=0)), self.__pathList)
+            self.assertEqual(self.__requestList, [])
+            self.assertEqual(threading.active_count(), numThreads)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+def suiteFilePrefetcher():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(FilePrefetcherTests("testPrefetchOrderAndLimits"))
+    suiteSelect.addTest(FilePrefetcherTests("testPrefetchClose"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = suiteFilePrefetcher()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
@@ -0,0 +1,94 @@
+##
+# File:    testLoadMetrics.py
+# Author:  agent
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#
+##
+"""
+Tests for accumulating, merging and exporting load stage metrics.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "agent"
+__email__ = "agent@local"
+__license__ = "Apache 2.0"
+
+import logging
+import os
+import time
+import unittest
+
+from rcsb.db.utils.LoadMetrics import LoadMetrics
+from rcsb.utils.io.MarshalUtil import MarshalUtil
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+
+class LoadMetricsTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = os.path.join(HERE, "test-output")
+        self.__startTime = time.time()
+        logger.debug("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.debug("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def testMergeExport(self):
+        """ Verify merging worker metrics and export in JSON and Prometheus text formats.
+        """
+        try:
+            wL = []
+            for ii in range(3):
+                wM = LoadMetrics()
+                with wM.timer("parse"):
+                    time.sleep(0.01)
+                wM.addTime("insert", 0.5)
+                wM.addCount("documents", 10 + ii)
+                wL.append(wM.getMetrics())
+            #
+            lM = LoadMetrics()
+            for mD in wL:
+                self.assertTrue(lM.merge(mD))
+            self.assertEqual(lM.getCount("documents"), 33)
+            self.assertAlmostEqual(lM.getTime("insert"), 1.5)
+            self.assertGreaterEqual(lM.getTime("parse"), 0.03)
+            self.assertEqual(lM.getMetrics()["worker_count"], 3)
+            #
+            fp = os.path.join(self.__workPath, "load-metrics.json")
+            ok = lM.write(fp, fmt="json", labelD={"database": "pdbx_core"}, elapsedSeconds=2.0)
+            self.assertTrue(ok)
+            rD = MarshalUtil().doImport(fp, fmt="json")
+            self.assertEqual(rD["counts"]["documents"], 33)
+            self.assertAlmostEqual(rD["documents_per_second"], 16.5)
+            #
+            fp = os.path.join(self.__workPath, "load-metrics.prom")
+            ok = lM.write(fp, fmt="prometheus", labelD={"database": "pdbx_core"}, elapsedSeconds=2.0)
+            self.assertTrue(ok)
+            with open(fp, "r", encoding="utf-8") as ifh:
+                tS = ifh.read()
+            self.assertIn('rcsb_db_load_count{database="pdbx_core",name="documents"} 33', tS)
+            self.assertIn('rcsb_db_load_stage_seconds{database="pdbx_core",stage="insert"} 1.500000', tS)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+def suiteLoadMetrics():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(LoadMetricsTests("testMergeExport"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = suiteLoadMetrics()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
@@ -0,0 +1,152 @@
+##
+# File:    testLoadWatermark.py
+# Author:  agent
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#  18-Oct-2026 agent add test of cleared collection records
+##
+"""
+Tests for load watermarks and repository entry change detection.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "agent"
+__email__ = "agent@local"
+__license__ = "Apache 2.0"
+
+import logging
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from rcsb.db.utils.LoadWatermark import LoadWatermark
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+
+class LoadWatermarkTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = tempfile.mkdtemp()
+        self.__watermarkPath = os.path.join(self.__workPath, "cache", "MONGO_DB-pdbx_core-load-watermark.pic")
+        self.__collectionNameList = ["pdbx_core_entry", "pdbx_core_entity"]
+        self.__idCodeList = ["1abc", "1abd", "1abe", "2xyz"]
+        for idCode in self.__idCodeList:
+            self.__write(idCode, "data_%s\n" % idCode)
+        self.__startTime = time.time()
+        logger.debug("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        shutil.rmtree(self.__workPath, ignore_errors=True)
+        endTime = time.time()
+        logger.debug("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def __getPath(self, idCode):
+        return os.path.join(self.__workPath, idCode[1:3], idCode + ".cif")
+
+    def __write(self, idCode, text, mtime=None):
+        filePath = self.__getPath(idCode)
+        if not os.path.isdir(os.path.dirname(filePath)):
+            os.makedirs(os.path.dirname(filePath))
+        with open(filePath, "w", encoding="utf-8") as ofh:
+            ofh.write(text)
+        if mtime:
+            os.utime(filePath, (mtime, mtime))
+
+    def __getStateD(self):
+        stateD = {}
+        for idCode in self.__idCodeList:
+            filePath = self.__getPath(idCode)
+            if os.access(filePath, os.R_OK):
+                st = os.stat(filePath)
+                stateD[idCode] = ((filePath, st.st_size, st.st_mtime), None)
+        return stateD
+
+    def testChangedEntries(self):
+        """Test case - added, modified and removed entries relative to the last recorded load"""
+        try:
+            lw = LoadWatermark(self.__watermarkPath)
+            stateD = self.__getStateD()
+            diffD = lw.getDiff(stateD, self.__collectionNameList)
+            self.assertEqual(diffD["added"], self.__idCodeList)
+            self.assertEqual(diffD["modified"] + diffD["removed"], [])
+            # -- record a partial load (1abe failed)
+            self.assertTrue(lw.update(stateD, self.__collectionNameList, ["1abc", "1abd", "2xyz"], []))
+            #
+            lw = LoadWatermark(self.__watermarkPath)
+            self.assertIsNotNone(lw.getTimestamp("pdbx_core_entry"))
+            self.assertIsNone(lw.getTimestamp("pdbx_core_assembly"))
+            diffD = lw.getDiff(self.__getStateD(), self.__collectionNameList)
+            self.assertEqual((diffD["added"], diffD["modified"], diffD["removed"], diffD["unchanged"]), (["1abe"], [], [], 3))
+            # -- a collection without a recorded load requires all entries
+            diffD = lw.getDiff(self.__getStateD(), ["pdbx_core_assembly"])
+            self.assertEqual(diffD["added"], self.__idCodeList)
+            #
+            self.__write("1abc", "data_1abc\nmodified\n")
+            os.remove(self.__getPath("2xyz"))
+            self.__idCodeList.remove("2xyz")
+            stateD = self.__getStateD()
+            diffD = lw.getDiff(stateD, self.__collectionNameList)
+            self.assertEqual((diffD["added"], diffD["modified"], diffD["removed"]), (["1abe"], ["1abc"], ["2xyz"]))
+            self.assertTrue(lw.update(stateD, self.__collectionNameList, diffD["added"] + diffD["modified"], diffD["removed"]))
+            #
+            diffD = LoadWatermark(self.__watermarkPath).getDiff(self.__getStateD(), self.__collectionNameList)
+            self.assertEqual((diffD["added"], diffD["modified"], diffD["removed"], diffD["unchanged"]), ([], [], [], 3))
+            # -- merged content added for an entry
+            stateD = self.__getStateD()
+            stateD["1abd"] = (stateD["1abd"][0], (self.__getPath("1abd") + ".xml", 10, 1.0))
+            diffD = LoadWatermark(self.__watermarkPath).getDiff(stateD, self.__collectionNameList)
+            self.assertEqual(diffD["modified"], ["1abd"])
+            # -- a cleared collection requires all entries
+            lw = LoadWatermark(self.__watermarkPath)
+            lw.clear(["pdbx_core_entry"])
+            self.assertIsNone(lw.getTimestamp("pdbx_core_entry"))
+            self.assertIsNotNone(lw.getTimestamp("pdbx_core_entity"))
+            diffD = lw.getDiff(self.__getStateD(), ["pdbx_core_entry"])
+            self.assertEqual(diffD["added"], self.__idCodeList)
+            diffD = lw.getDiff(self.__getStateD(), ["pdbx_core_entity"])
+            self.assertEqual((diffD["added"], diffD["unchanged"]), ([], 3))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testDigestComparison(self):
+        """Test case - files with changed modification times but unchanged content are unchanged using digests"""
+        try:
+            lw = LoadWatermark(self.__watermarkPath)
+            stateD = self.__getStateD()
+            self.assertTrue(lw.update(stateD, self.__collectionNameList, self.__idCodeList, [], useDigest=True))
+            #
+            self.__write("1abc", "data_1abc\n", mtime=1.0e9)
+            self.__write("1abd", "data_1abX\n", mtime=1.0e9)
+            stateD = self.__getStateD()
+            lw = LoadWatermark(self.__watermarkPath)
+            diffD = lw.getDiff(stateD, self.__collectionNameList)
+            self.assertEqual(diffD["modified"], ["1abc", "1abd"])
+            diffD = lw.getDiff(stateD, self.__collectionNameList, useDigest=True)
+            self.assertEqual(diffD["modified"], ["1abd"])
+            self.assertTrue(lw.update(stateD, self.__collectionNameList, diffD["modified"], [], useDigest=True))
+            # -- modification times of unchanged entries are refreshed
+            diffD = LoadWatermark(self.__watermarkPath).getDiff(stateD, self.__collectionNameList)
+            self.assertEqual((diffD["added"], diffD["modified"], diffD["removed"]), ([], [], []))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+def suiteLoadWatermark():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(LoadWatermarkTests("testChangedEntries"))
+    suiteSelect.addTest(LoadWatermarkTests("testDigestComparison"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = suiteLoadWatermark()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
@@ -0,0 +1,158 @@
+##
+# File:    testMemoryDbClient.py
+# Author:  agent
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#
+##
+"""
+Test cases for MongoDbUtil operations using the in-memory document store backend.
+
+"""
+__docformat__ = "restructuredtext en"
+__author__ = "agent"
+__email__ = "agent@local"
+__license__ = "Apache 2.0"
+
+import logging
+import os
+import time
+import unittest
+
+from rcsb.db.mongo.Connection import Connection
+from rcsb.db.mongo.MemoryDbClient import clearMemoryStore
+from rcsb.db.mongo.MongoDbUtil import MongoDbUtil
+from rcsb.utils.config.ConfigUtil import ConfigUtil
+from rcsb.utils.multiproc.MultiProcUtil import MultiProcUtil
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+
+class MemoryDbClientTests(unittest.TestCase):
+    def setUp(self):
+        self.__dbName = "test_database"
+        self.__collectionName = "test_collection"
+        configPath = os.path.join(TOPDIR, "rcsb", "db", "config", "exdb-config-example.yml")
+        configName = "site_info_configuration"
+        self.__cfgOb = ConfigUtil(configPath=configPath, defaultSectionName=configName)
+        self.__infoD = {"DB_SERVER": "memory", "DB_HOST": "test-store"}
+        self.__startTime = time.time()
+        logger.debug("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        clearMemoryStore("test-store")
+        endTime = time.time()
+        logger.debug("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def __makeDocList(self, nDocs):
+        return [{"rcsb_id": "%04d_%d" % (ii, ii % 3), "container_identifiers": {"entry_id": "%04d" % ii}, "values": list(range(ii % 5))} for ii in range(nDocs)]
+
+    def insertWorker(self, dataList, procName, optionsD, workingDir):
+        """Multi-proc worker inserting the input documents in a new connection."""
+        _ = workingDir
+        with Connection(cfgOb=self.__cfgOb, infoD=optionsD["infoD"]) as client:
+            mg = MongoDbUtil(client)
+            rIdL = mg.insertList(self.__dbName, self.__collectionName, [{"rcsb_id": rId, "proc_name": procName} for rId in dataList], keyNames=["rcsb_id"])
+        return dataList if len(rIdL) == len(dataList) else [], [], []
+
+    def testCreateDropCollection(self):
+        """Test case -  create/drop collection and database in the in-memory store
+        """
+        try:
+            with Connection(cfgOb=self.__cfgOb, infoD=self.__infoD) as client:
+                mg = MongoDbUtil(client)
+                ok = mg.createCollection(self.__dbName, self.__collectionName, bsonSchema={"bsonType": "object"})
+                self.assertTrue(ok)
+                self.assertTrue(mg.databaseExists(self.__dbName))
+                self.assertTrue(mg.collectionExists(self.__dbName, self.__collectionName))
+                ok = mg.createIndex(self.__dbName, self.__collectionName, ["rcsb_id"], indexName="primary")
+                self.assertTrue(ok)
+                ok = mg.dropCollection(self.__dbName, self.__collectionName)
+                self.assertTrue(ok)
+                self.assertFalse(mg.collectionExists(self.__dbName, self.__collectionName))
+                ok = mg.dropDatabase(self.__dbName)
+                self.assertTrue(ok)
+                self.assertFalse(mg.databaseExists(self.__dbName))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testInsertDeleteReplace(self):
+        """Test case -  bulk insert, count, fetch, replace and delete operations shared across connections
+        """
+        try:
+            nDocs = 50
+            with Connection(cfgOb=self.__cfgOb, infoD=self.__infoD) as client:
+                mg = MongoDbUtil(client)
+                ok = mg.createCollection(self.__dbName, self.__collectionName)
+                self.assertTrue(ok)
+                rIdL = mg.insertList(self.__dbName, self.__collectionName, self.__makeDocList(nDocs), keyNames=["rcsb_id"], salvage=True)
+                self.assertEqual(len(rIdL), nDocs)
+            #
+            with Connection(cfgOb=self.__cfgOb, infoD=self.__infoD) as client:
+                mg = MongoDbUtil(client)
+                self.assertEqual(mg.count(self.__dbName, self.__collectionName), nDocs)
+                dObj = mg.fetchOne(self.__dbName, self.__collectionName, "container_identifiers.entry_id", "0007")
+                self.assertEqual(dObj["rcsb_id"], "0007_1")
+                dL = mg.fetch(self.__dbName, self.__collectionName, ["rcsb_id"], queryD={"values": 3}, suppressId=True)
+                self.assertEqual(len(dL), 10)
+                self.assertTrue(all("_id" not in dD for dD in dL))
+                #
+                dObj.pop("_id")
+                dObj["values"] = [100]
+                self.assertEqual(mg.replace(self.__dbName, self.__collectionName, dObj, {"rcsb_id": "0007_1"}), 1)
+                self.assertEqual(mg.update(self.__dbName, self.__collectionName, {"note": "x"}, {"values": 100}), 1)
+                #
+                dTupL = mg.deleteList(self.__dbName, self.__collectionName, self.__makeDocList(10), ["rcsb_id"])
+                self.assertEqual(sum([cnt for _, cnt in dTupL]), 10)
+                dCount = mg.delete(self.__dbName, self.__collectionName, {"rcsb_id": {"$regex": "^001", "$options": "i"}})
+                self.assertEqual(dCount, 10)
+                self.assertEqual(mg.count(self.__dbName, self.__collectionName), nDocs - 20)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testSharedAcrossProcesses(self):
+        """Test case -  documents inserted by worker processes are visible to the parent process
+        """
+        try:
+            with Connection(cfgOb=self.__cfgOb, infoD=self.__infoD) as client:
+                mg = MongoDbUtil(client)
+                ok = mg.createCollection(self.__dbName, self.__collectionName)
+                self.assertTrue(ok)
+            #
+            idList = ["%04d" % ii for ii in range(40)]
+            mpu = MultiProcUtil(verbose=True)
+            mpu.setOptions(optionsD={"infoD": self.__infoD})
+            mpu.set(workerObj=self, workerMethod="insertWorker")
+            ok, failList, _, _ = mpu.runMulti(dataList=idList, numProc=4, numResults=1)
+            self.assertTrue(ok)
+            self.assertEqual(len(failList), 0)
+            #
+            with Connection(cfgOb=self.__cfgOb, infoD=self.__infoD) as client:
+                mg = MongoDbUtil(client)
+                self.assertEqual(mg.count(self.__dbName, self.__collectionName), len(idList))
+                dL = mg.fetch(self.__dbName, self.__collectionName, ["proc_name"], suppressId=True)
+                self.assertGreater(len({dD["proc_name"] for dD in dL}), 1)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+def memoryDbClientSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(MemoryDbClientTests("testCreateDropCollection"))
+    suiteSelect.addTest(MemoryDbClientTests("testInsertDeleteReplace"))
+    suiteSelect.addTest(MemoryDbClientTests("testSharedAcrossProcesses"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = memoryDbClientSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
@@ -0,0 +1,121 @@
+##
+# File:    testPdbxLoaderMemory.py
+# Author:  agent
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#
+##
+"""
+Tests for loading BIRD and CCD data files with the PdbxLoader using the in-memory document store backend.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "agent"
+__email__ = "agent@local"
+__license__ = "Apache 2.0"
+
+
+import logging
+import os
+import time
+import unittest
+
+from rcsb.db.mongo.Connection import Connection
+from rcsb.db.mongo.MemoryDbClient import clearMemoryStore
+from rcsb.db.mongo.MongoDbUtil import MongoDbUtil
+from rcsb.db.mongo.PdbxLoader import PdbxLoader
+from rcsb.utils.config.ConfigUtil import ConfigUtil
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+HERE = os.path.abspath(os.path.dirname(__file__))
+TOPDIR = os.path.dirname(os.path.dirname(os.path.dirname(HERE)))
+
+
+class PdbxLoaderMemoryTests(unittest.TestCase):
+    def setUp(self):
+        mockTopPath = os.path.join(TOPDIR, "rcsb", "mock-data")
+        configPath = os.path.join(TOPDIR, "rcsb", "db", "config", "exdb-config-example.yml")
+        configName = "site_info_configuration"
+        self.__cfgOb = ConfigUtil(configPath=configPath, defaultSectionName=configName, mockTopPath=mockTopPath)
+        #
+        # Direct the MONGO_DB resource to a named in-memory document store
+        self.__storeName = "test-pdbx-loader"
+        cD = self.__cfgOb.exportConfig(sectionName=configName)
+        cD.update({"MONGO_DB_SERVER": "memory", "MONGO_DB_HOST": self.__storeName})
+        self.__cfgOb.importConfig({configName: cD})
+        #
+        self.__resourceName = "MONGO_DB"
+        self.__failedFilePath = os.path.join(HERE, "test-output", "failed-list.txt")
+        self.__cachePath = os.path.join(TOPDIR, "CACHE")
+        self.__databaseName = "bird_chem_comp_core"
+        self.__startTime = time.time()
+        logger.debug("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        clearMemoryStore(self.__storeName)
+        endTime = time.time()
+        logger.debug("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def __load(self, loadType):
+        mw = PdbxLoader(
+            self.__cfgOb,
+            cachePath=self.__cachePath,
+            resourceName=self.__resourceName,
+            numProc=2,
+            chunkSize=10,
+            fileLimit=None,
+            verbose=True,
+            readBackCheck=True,
+            maxStepLength=2000,
+            useSchemaCache=True,
+            rebuildSchemaFlag=False,
+        )
+        return mw.load(
+            self.__databaseName,
+            loadType=loadType,
+            styleType="rowwise_by_name_with_cardinality",
+            dataSelectors=["PUBLIC_RELEASE"],
+            failedFilePath=self.__failedFilePath,
+            validationLevel="full",
+            updateSchemaOnReplace=False,
+        )
+
+    def __getCounts(self):
+        with Connection(cfgOb=self.__cfgOb, resourceName=self.__resourceName) as client:
+            mg = MongoDbUtil(client)
+            return {cN: mg.count(self.__databaseName, cN) for cN in mg.getCollectionNames(self.__databaseName)}
+
+    def testLoadCountReplace(self):
+        """Test case -  full load, count and replace load using worker processes and the in-memory document store
+        """
+        try:
+            ok = self.__load("full")
+            self.assertTrue(ok)
+            countD = self.__getCounts()
+            logger.info("Loaded collection counts %r", countD)
+            self.assertGreaterEqual(len(countD), 1)
+            self.assertTrue(all(cnt > 0 for cnt in countD.values()))
+            #
+            ok = self.__load("replace")
+            self.assertTrue(ok)
+            self.assertEqual(self.__getCounts(), countD)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+def pdbxLoaderMemorySuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(PdbxLoaderMemoryTests("testLoadCountReplace"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = pdbxLoaderMemorySuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
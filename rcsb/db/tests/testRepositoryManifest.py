@@ -0,0 +1,127 @@
+##
+# File:    testRepositoryManifest.py
+# Author:  agent
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#
+##
+"""
+Tests for persistent repository manifests with incremental updates.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "agent"
+__email__ = "agent@local"
+__license__ = "Apache 2.0"
+
+import logging
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from rcsb.db.utils.RepositoryManifest import RepositoryManifest, entryFileId, validationReportFileId
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+
+class RepositoryManifestTests(unittest.TestCase):
+    def setUp(self):
+        self.__workPath = tempfile.mkdtemp()
+        self.__entryPath = os.path.join(self.__workPath, "pdbx")
+        self.__vrptPath = os.path.join(self.__workPath, "vrpt")
+        self.__idCodeList = ["1%s%s%s" % (a, b, c) for a in "abc" for b in "0123" for c in "xyz"]
+        for idCode in self.__idCodeList:
+            self.__touch(os.path.join(self.__entryPath, idCode[1:3], idCode + ".cif.gz"))
+            if idCode[3] != "z":
+                self.__touch(os.path.join(self.__vrptPath, idCode[1:3], idCode, idCode + "_validation.xml.gz"))
+            else:
+                os.makedirs(os.path.join(self.__vrptPath, idCode[1:3], idCode))
+        self.__startTime = time.time()
+        logger.debug("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        shutil.rmtree(self.__workPath, ignore_errors=True)
+        endTime = time.time()
+        logger.debug("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def __touch(self, filePath):
+        if not os.path.isdir(os.path.dirname(filePath)):
+            os.makedirs(os.path.dirname(filePath))
+        with open(filePath, "w", encoding="utf-8") as ofh:
+            ofh.write("data_%s\n" % os.path.basename(filePath))
+
+    def testEntryManifest(self):
+        """Test case - entry manifest content and incremental updates"""
+        try:
+            manifestPath = os.path.join(self.__workPath, "cache", "pdbx-repository-manifest.pic")
+            rm = RepositoryManifest(manifestPath, self.__entryPath, entryFileId, numProc=2)
+            self.assertTrue(rm.update())
+            self.assertEqual(rm.getUpdateStats()["listed"], 12)
+            fD = rm.getFileD()
+            self.assertEqual(sorted(fD.keys()), sorted(self.__idCodeList))
+            self.assertEqual(fD["1a0x"]["locator"], os.path.join(self.__entryPath, "a0", "1a0x.cif.gz"))
+            self.assertEqual(fD["1a0x"]["size"], os.path.getsize(fD["1a0x"]["locator"]))
+            #
+            rm = RepositoryManifest(manifestPath, self.__entryPath, entryFileId, numProc=2)
+            self.assertEqual(rm.getFileD(), fD)
+            self.assertTrue(rm.update())
+            self.assertEqual(rm.getUpdateStats()["listed"], 0)
+            #
+            self.__touch(os.path.join(self.__entryPath, "a0", "1a0w.cif.gz"))
+            os.remove(os.path.join(self.__entryPath, "b1", "1b1x.cif.gz"))
+            shutil.rmtree(os.path.join(self.__entryPath, "c3"))
+            os.utime(os.path.join(self.__entryPath, "a0"), (1.0, 1.0))
+            os.utime(os.path.join(self.__entryPath, "b1"), (1.0, 1.0))
+            self.assertTrue(rm.update())
+            self.assertEqual(rm.getUpdateStats()["listed"], 2)
+            self.assertEqual(rm.getUpdateStats()["removed"], 1)
+            fD = rm.getFileD()
+            self.assertIn("1a0w", fD)
+            self.assertNotIn("1b1x", fD)
+            self.assertNotIn("1c3x", fD)
+            self.assertEqual(len(fD), len(self.__idCodeList) - 3)
+            #
+            self.assertTrue(rm.update(rebuild=True))
+            self.assertEqual(rm.getUpdateStats()["listed"], 11)
+            self.assertEqual(rm.getFileD(), fD)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testValidationReportManifest(self):
+        """Test case - validation report manifest detects reports added to existing entry directories"""
+        try:
+            manifestPath = os.path.join(self.__workPath, "cache", "vrpt-repository-manifest.pic")
+            rm = RepositoryManifest(manifestPath, self.__vrptPath, validationReportFileId, numProc=2)
+            self.assertTrue(rm.update())
+            fD = rm.getFileD()
+            self.assertEqual(sorted(fD.keys()), sorted([idCode for idCode in self.__idCodeList if idCode[3] != "z"]))
+            #
+            self.__touch(os.path.join(self.__vrptPath, "a0", "1a0z", "1a0z_validation.xml.gz"))
+            os.utime(os.path.join(self.__vrptPath, "a0", "1a0z"), (1.0, 1.0))
+            rm = RepositoryManifest(manifestPath, self.__vrptPath, validationReportFileId, numProc=2)
+            self.assertTrue(rm.update())
+            self.assertEqual(rm.getUpdateStats()["listed"], 1)
+            self.assertIn("1a0z", rm.getFileD())
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+def suiteRepositoryManifest():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(RepositoryManifestTests("testEntryManifest"))
+    suiteSelect.addTest(RepositoryManifestTests("testValidationReportManifest"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = suiteRepositoryManifest()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
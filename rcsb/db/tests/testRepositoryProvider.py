@@ -5,7 +5,7 @@
 # Version: 0.001
 #
 # Updates:
-
+#   18-Oct-2026 agent add comparison of manifest and scan based merged locator lists
 ##
 """
 Tests repository path and object utilities.
@@ -71,10 +71,34 @@ class RepositoryProviderTests(unittest.TestCase):
             self.assertEqual(len(locatorObjList), len(pathList))
             self.assertEqual(len(locatorObjList), len(locatorObjList2))
 
+    def testManifestMergeLocators(self):
+        """ Test case - merged locators from repository manifests match those from repository scans
+        """
+        try:
+            rpP = RepositoryProvider(cfgOb=self.__cfgOb, numProc=self.__numProc, fileLimit=self.__fileLimit, cachePath=self.__cachePath, useManifest=True)
+            for contentType in ["pdbx", "vrpt"]:
+                self.assertTrue(rpP.updateManifest(contentType, rebuild=True))
+            for mergeContentTypes in [None, ["vrpt"]]:
+                locatorObjList = self.__rpP.getLocatorObjList(contentType="pdbx_core", mergeContentTypes=mergeContentTypes)
+                mLocatorObjList = rpP.getLocatorObjList(contentType="pdbx_core", mergeContentTypes=mergeContentTypes)
+                self.assertGreater(len(mLocatorObjList), 0)
+                self.assertEqual(sorted(self.__rpP.getLocatorPaths(locatorObjList)), sorted(rpP.getLocatorPaths(mLocatorObjList)))
+                if mergeContentTypes:
+                    self.assertEqual(sorted(locatorObjList), sorted(mLocatorObjList))
+                    pathList = self.__rpP.getLocatorPaths(locatorObjList)
+                    iLocatorObjList = self.__rpP.getLocatorObjList(contentType="pdbx_core", inputPathList=pathList, mergeContentTypes=mergeContentTypes)
+                    mLocatorObjList = rpP.getLocatorObjList(contentType="pdbx_core", inputPathList=pathList, mergeContentTypes=mergeContentTypes)
+                    self.assertEqual(iLocatorObjList, mLocatorObjList)
+                    logger.info("Merged locators %d with validation reports %d", len(mLocatorObjList), len([lObj for lObj in mLocatorObjList if len(lObj) > 1]))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
 
 def repoSuite():
     suiteSelect = unittest.TestSuite()
     suiteSelect.addTest(RepositoryProviderTests("testRepoUtils"))
+    suiteSelect.addTest(RepositoryProviderTests("testManifestMergeLocators"))
     return suiteSelect
 
 
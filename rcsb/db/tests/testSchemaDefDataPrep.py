@@ -16,6 +16,11 @@
 #  11-Mar-2019 jdw add tests for sdp.addDocumentSubCategoryAggregates()
 #  21-Mar-2019 jdw make all test cases reference core collections
 #   5-Jun-2019 jdw update to new method runner api
+#  18-Oct-2026 agent add test comparing map-once multi-collection processing with per-collection processing
+#  18-Oct-2026 agent add data selector tests using a synthetic schema (no mock data dependencies)
+#  18-Oct-2026 agent add test comparing planned subcategory aggregation with per-document aggregation
+#  18-Oct-2026 agent add test comparing planned table mapping with the mapping of every selected table
+#  18-Oct-2026 agent add merged instance category benchmark on the largest assembly entry
 #
 ##
 """
@@ -30,6 +35,7 @@ __author__ = "John Westbrook"
 __email__ = "jwest@rcsb.rutgers.edu"
 __license__ = "Apache 2.0"
 
+import copy
 import logging
 import os
 import pprint
@@ -38,12 +44,15 @@ import unittest
 
 from jsondiff import diff
 
+from mmcif.api.DataCategory import DataCategory
 from mmcif.api.DictMethodRunner import DictMethodRunner
+from mmcif.api.PdbxContainers import DataContainer
 from rcsb.db.define.DictionaryApiProviderWrapper import DictionaryApiProviderWrapper
 from rcsb.db.define.SchemaDefAccess import SchemaDefAccess
 from rcsb.db.helpers.DictMethodResourceProvider import DictMethodResourceProvider
 from rcsb.db.processors.DataTransformFactory import DataTransformFactory
 from rcsb.db.processors.SchemaDefDataPrep import SchemaDefDataPrep
+from rcsb.db.processors.SchemaDefReShape import SchemaDefReShape
 from rcsb.db.utils.RepositoryProvider import RepositoryProvider
 from rcsb.db.utils.SchemaProvider import SchemaProvider
 from rcsb.utils.config.ConfigUtil import ConfigUtil
@@ -209,6 +218,170 @@ class SchemaDefDataPrepTests(unittest.TestCase):
                 excludeExtras=tcD["excludeExtras"],
             )
 
+    def testMultiCollectionDataPrep(self):
+        """Test case - documents from map-once multi-collection processing match per-collection processing"""
+        try:
+            contentType = "pdbx_core"
+            styleType = "rowwise_by_name_with_cardinality"
+            dataSelectors = ["PUBLIC_RELEASE"]
+            inputPathList = self.__rpP.getLocatorObjList(contentType=contentType)
+            sd, _, collectionNameList, _ = self.__schP.getSchemaInfo(databaseName=contentType, dataTyping="ANY")
+            dtf = DataTransformFactory(schemaDefAccessObj=sd, filterType=self.__fTypeRow)
+            sdp = SchemaDefDataPrep(schemaDefAccessObj=sd, dtObj=dtf, workPath=self.__cachePath, verbose=self.__verbose)
+            containerList = self.__rpP.getContainerList(inputPathList)
+            #
+            multiD, multiRejectList = sdp.processDocumentsMulti(containerList, collectionNameList, styleType=styleType, filterType=self.__fTypeRow, dataSelectors=dataSelectors)
+            self.assertEqual(len(multiD), len(collectionNameList))
+            for collectionName in collectionNameList:
+                sdp.setSchemaIdExcludeList(sd.getCollectionExcluded(collectionName))
+                sdp.setSchemaIdIncludeList(sd.getCollectionSelected(collectionName))
+                docList, cIdList, rejectList = sdp.processDocuments(
+                    containerList,
+                    styleType=styleType,
+                    sliceFilter=sd.getCollectionSliceFilter(collectionName),
+                    filterType=self.__fTypeRow,
+                    dataSelectors=dataSelectors,
+                    collectionName=collectionName,
+                )
+                mDocList, mCIdList = multiD[collectionName]
+                self.assertEqual(sorted(rejectList), sorted(multiRejectList))
+                self.assertEqual(cIdList, mCIdList)
+                self.__filterDocuments(docList, ["rcsb_load_status"])
+                self.__filterDocuments(mDocList, ["rcsb_load_status"])
+                self.assertEqual(docList, mDocList)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testSlicedShapeOnePass(self):
+        """Test case - one-pass slicing matches per-slice value scanning for each sliced collection"""
+        try:
+            contentType = "pdbx_core"
+            inputPathList = self.__rpP.getLocatorObjList(contentType=contentType)
+            sd, _, collectionNameList, _ = self.__schP.getSchemaInfo(databaseName=contentType, dataTyping="ANY")
+            dtf = DataTransformFactory(schemaDefAccessObj=sd, filterType=self.__fTypeRow)
+            sdp = SchemaDefDataPrep(schemaDefAccessObj=sd, dtObj=dtf, workPath=self.__cachePath, verbose=self.__verbose)
+            containerList = self.__rpP.getContainerList(inputPathList)
+            byIdList, _, _ = sdp.processDocuments(containerList, styleType="rowwise_by_id", filterType=self.__fTypeRow, dataSelectors=["PUBLIC_RELEASE"])
+            rs = SchemaDefReShape(sd, workPath=self.__cachePath, verbose=self.__verbose)
+            for collectionName in collectionNameList:
+                sliceFilter = sd.getCollectionSliceFilter(collectionName)
+                if not sliceFilter:
+                    continue
+                for styleType in ["rowwise_by_name", "columnwise_by_name"]:
+                    tD = {True: 0.0, False: 0.0}
+                    for byIdD in byIdList:
+                        rLD = {}
+                        for onePass in [False, True]:
+                            startTime = time.time()
+                            rLD[onePass] = rs.applySlicedShape(byIdD, styleType=styleType, sliceFilter=sliceFilter, collectionName=collectionName, onePass=onePass)
+                            tD[onePass] += time.time() - startTime
+                        self.assertEqual(rLD[False], rLD[True])
+                    logger.info("%s %s slice %s multi-pass %.4f one-pass %.4f seconds", collectionName, styleType, sliceFilter, tD[False], tD[True])
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testFusedDocumentShape(self):
+        """Test case - directly named documents for unsliced collections match reshaped rowwise_by_id documents"""
+        try:
+            contentType = "pdbx_core"
+            inputPathList = self.__rpP.getLocatorObjList(contentType=contentType)
+            sd, _, collectionNameList, _ = self.__schP.getSchemaInfo(databaseName=contentType, dataTyping="ANY")
+            dtf = DataTransformFactory(schemaDefAccessObj=sd, filterType=self.__fTypeRow)
+            sdp = SchemaDefDataPrep(schemaDefAccessObj=sd, dtObj=dtf, workPath=self.__cachePath, verbose=self.__verbose)
+            rs = SchemaDefReShape(sd, workPath=self.__cachePath, verbose=self.__verbose)
+            containerList = self.__rpP.getContainerList(inputPathList)
+            for collectionName in collectionNameList:
+                if sd.getCollectionSliceFilter(collectionName):
+                    continue
+                sdp.setSchemaIdExcludeList(sd.getCollectionExcluded(collectionName))
+                sdp.setSchemaIdIncludeList(sd.getCollectionSelected(collectionName))
+                byIdList, _, _ = sdp.processDocuments(containerList, styleType="rowwise_by_id", filterType=self.__fTypeRow, collectionName=collectionName)
+                for styleType in ["rowwise_by_name", "rowwise_by_name_with_cardinality"]:
+                    docList, _, _ = sdp.processDocuments(containerList, styleType=styleType, filterType=self.__fTypeRow, collectionName=collectionName)
+                    self.assertEqual(docList, [rs.applyShape(byIdD, styleType=styleType, collectionName=collectionName) for byIdD in byIdList])
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testProcessDocumentsIter(self):
+        """Test case - documents streamed from a container generator match processDocuments()"""
+        try:
+            contentType = "pdbx_core"
+            styleType = "rowwise_by_name_with_cardinality"
+            inputPathList = self.__rpP.getLocatorObjList(contentType=contentType)
+            sd, _, collectionNameList, _ = self.__schP.getSchemaInfo(databaseName=contentType, dataTyping="ANY")
+            dtf = DataTransformFactory(schemaDefAccessObj=sd, filterType=self.__fTypeRow)
+            sdp = SchemaDefDataPrep(schemaDefAccessObj=sd, dtObj=dtf, workPath=self.__cachePath, verbose=self.__verbose)
+            containerList = self.__rpP.getContainerList(inputPathList)
+            collectionName = collectionNameList[0]
+            sdp.setSchemaIdExcludeList(sd.getCollectionExcluded(collectionName))
+            sdp.setSchemaIdIncludeList(sd.getCollectionSelected(collectionName))
+            sliceFilter = sd.getCollectionSliceFilter(collectionName)
+            docList, cIdList, rejectList = sdp.processDocuments(containerList, styleType=styleType, filterType=self.__fTypeRow, sliceFilter=sliceFilter, collectionName=collectionName)
+            #
+            containerIter = (container for container in containerList)
+            iDocList = []
+            iCIdList = []
+            iRejectList = []
+            for cId, cName, doc in sdp.processDocumentsIter(containerIter, styleType=styleType, filterType=self.__fTypeRow, sliceFilter=sliceFilter, collectionName=collectionName):
+                if doc is None:
+                    iRejectList.append(cId)
+                    continue
+                self.assertEqual(cName, collectionName)
+                iDocList.append(doc)
+                iCIdList.append(cId)
+            self.assertEqual(cIdList, iCIdList)
+            self.assertEqual(sorted(rejectList), sorted(set(iRejectList)))
+            self.__filterDocuments(docList, ["rcsb_load_status"])
+            self.__filterDocuments(iDocList, ["rcsb_load_status"])
+            self.assertEqual(docList, iDocList)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testMergedCategoryBenchmark(self):
+        """Benchmark - merged instance category tables for the entry with the largest assembly operator list"""
+        try:
+            contentType = "pdbx_core"
+            numIter = 5
+            inputPathList = self.__rpP.getLocatorObjList(contentType=contentType)
+            sd, _, _, _ = self.__schP.getSchemaInfo(databaseName=contentType, dataTyping="ANY")
+            containerList = self.__rpP.getContainerList(inputPathList)
+            self.assertGreater(len(containerList), 0)
+            container = max(containerList, key=lambda x: x.getObj("pdbx_struct_oper_list").getRowCount() if x.exists("pdbx_struct_oper_list") else 0)
+            #
+            mergeTableD = {}
+            for tableId in sd.getSchemaIdList():
+                tObj = sd.getSchemaObject(tableId)
+                catNameL = [catName for catName in tObj.getMapInstanceCategoryList() if container.exists(catName)]
+                if len(catNameL) > 1:
+                    mergeTableD[tableId] = set()
+                    for catName in catNameL:
+                        catObj = container.getObj(catName)
+                        indL = [atName for atName in tObj.getMapMergeIndexAttributes(catName) if catObj.hasAttribute(atName)]
+                        mergeTableD[tableId].update([tuple([catObj.getValue(atName, ii) for atName in indL]) for ii in range(catObj.getRowCount())])
+            #
+            dtf = DataTransformFactory(schemaDefAccessObj=sd, filterType=self.__fTypeRow)
+            sdp = SchemaDefDataPrep(schemaDefAccessObj=sd, dtObj=dtf, workPath=self.__cachePath, verbose=self.__verbose)
+            sdp.setSchemaIdIncludeList(list(mergeTableD.keys()))
+            startTime = time.time()
+            for _ in range(numIter):
+                docList, _, _ = sdp.processDocuments([container], styleType="rowwise_by_id", filterType=self.__fTypeRow)
+            logger.info(
+                "%s (%d operators) merged tables %d (%.4f seconds per container)",
+                container.getName(),
+                container.getObj("pdbx_struct_oper_list").getRowCount() if container.exists("pdbx_struct_oper_list") else 0,
+                len(mergeTableD),
+                (time.time() - startTime) / numIter,
+            )
+            for tableId, keyS in mergeTableD.items():
+                self.assertEqual(len(docList[0][tableId]), len(keyS))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
     def __simpleSchemaDataPrep(self, contentType, filterType, styleType, mockLength, rejectLength=0, dataSelectors=None, mergeContentTypes=None):
         """Internal method for preparing file-based data NOT requiring dynamic methods, slicing, or key injection.
 
@@ -354,10 +527,265 @@ class SchemaDefDataPrepTests(unittest.TestCase):
             self.fail()
 
 
+class SchemaDefDataPrepSyntheticTests(unittest.TestCase):
+    """Tests using a synthetic schema definition and containers (no mock data dependencies)."""
+
+    def setUp(self):
+        self.__sD = self.__getSchemaDefAccess()
+        self.__startTime = time.time()
+        logger.debug("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.debug("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def __getSchemaDefAccess(self):
+        """Return schema definition accessors for a few tables mapping single, merged and no instance categories."""
+        tableL = [
+            # (table Id, table name, [(attribute Id, attribute name, instance category, method name, subcategories), ...])
+            ("ENTRY", "entry", [("ID", "id", "entry", None, []), ("LOAD_ID", "load_id", None, "datablockid()", [])]),
+            ("EXPTL", "exptl", [("ENTRY_ID", "entry_id", "exptl", None, []), ("METHOD", "method", "exptl", None, [])]),
+            ("EXPTL_METHOD", "exptl_method", [("METHOD", "method", "exptl", None, []), ("ENTRY_ID", "entry_id", None, "datablockid()", [])]),
+            (
+                "STRUCT",
+                "struct",
+                [
+                    ("ENTRY_ID", "entry_id", "struct", None, []),
+                    ("TITLE", "title", "struct", None, []),
+                    ("PDBX_KEYWORDS", "pdbx_keywords", "struct_keywords", None, []),
+                    ("TEXT", "text", "struct_keywords", None, []),
+                ],
+            ),
+            ("SOURCE", "source", [("NAME", "name", None, "datablockid()", [])]),
+            (
+                "CITATION",
+                "citation",
+                [
+                    ("ID", "id", "citation", None, []),
+                    ("TITLE", "title", "citation", None, []),
+                    ("JOURNAL_ABBREV", "journal_abbrev", "citation", None, ["journal"]),
+                    ("JOURNAL_VOLUME", "journal_volume", "citation", None, ["journal"]),
+                ],
+            ),
+            ("STRUCT_REF", "struct_ref", [("ID", "id", "struct_ref", None, []), ("DB_NAME", "db_name", "struct_ref", None, ["db"]), ("DB_CODE", "db_code", "struct_ref", None, ["db"])]),
+        ]
+        schemaD = {}
+        for tableId, tableName, atL in tableL:
+            tD = {"SCHEMA_ID": tableId, "SCHEMA_NAME": tableName, "SCHEMA_SUB_CATEGORIES": [], "ATTRIBUTES": {}, "ATTRIBUTE_INFO": {}, "ATTRIBUTE_MAP": {}}
+            for ii, (atId, atName, catName, methodName, subCategoryL) in enumerate(atL):
+                tD["SCHEMA_SUB_CATEGORIES"].extend([subCategory for subCategory in subCategoryL if subCategory not in tD["SCHEMA_SUB_CATEGORIES"]])
+                tD["ATTRIBUTES"][atId] = atName
+                tD["ATTRIBUTE_INFO"][atId] = {"APP_TYPE": "varchar", "ORDER": ii + 1, "WIDTH": 80, "ENUMERATION": [], "FILTER_TYPES": [], "SUB_CATEGORIES": subCategoryL}
+                tD["ATTRIBUTE_MAP"][atId] = {"CATEGORY": catName, "ATTRIBUTE": atName if catName else None, "METHOD_NAME": methodName, "ARGUMENTS": None}
+            schemaD[tableId] = tD
+        schemaD["STRUCT"]["MAP_MERGE_INDICES"] = {"struct": {"TYPE": "EQUIVALENT", "ATTRIBUTES": ["entry_id"]}, "struct_keywords": {"TYPE": "EQUIVALENT", "ATTRIBUTES": ["entry_id"]}}
+        selectionD = {
+            "XRAY": [{"CATEGORY_NAME": "exptl", "ATTRIBUTE_NAME": "method", "VALUES": ["X-RAY DIFFRACTION"]}],
+            "XRAY_OR_NMR": [{"CATEGORY_NAME": "exptl", "ATTRIBUTE_NAME": "method", "VALUES": ["X-RAY DIFFRACTION", "SOLUTION NMR"]}],
+        }
+        documentD = {
+            "COLLECTION_SUB_CATEGORY_AGGREGATES": {
+                "test_collection": [{"NAME": "journal", "HAS_UNIT_CARDINALITY": True}, {"NAME": "db", "HAS_UNIT_CARDINALITY": False}],
+            }
+        }
+        schemaDef = {"DATABASE_NAME": "test", "SCHEMA_DICT": schemaD, "DOCUMENT_DICT": documentD, "SELECTION_FILTERS": selectionD, "SLICE_PARENT_ITEMS": {}, "SLICE_PARENT_FILTERS": {}}
+        return SchemaDefAccess(schemaDef)
+
+    def __getContainerList(self):
+        """Return containers with matching, non-matching and missing selection content."""
+        cL = []
+        for entryId, methodL, hasStruct, hasKeywords in [
+            ("1ABC", ["X-RAY DIFFRACTION"], True, True),
+            ("2DEF", ["SOLUTION NMR"], True, False),
+            ("3GHI", None, False, True),
+            ("4JKL", [], False, False),
+            ("5MNO", ["X-RAY DIFFRACTION", "SOLUTION NMR"], True, True),
+        ]:
+            container = DataContainer(entryId)
+            container.append(DataCategory("entry", ["id"], [[entryId]]))
+            if methodL is None:
+                # exptl category lacking the selection attribute
+                container.append(DataCategory("exptl", ["entry_id"], [[entryId]]))
+            elif methodL:
+                container.append(DataCategory("exptl", ["entry_id", "method"], [[entryId, method] for method in methodL]))
+            if hasStruct:
+                container.append(DataCategory("struct", ["entry_id", "title"], [[entryId, "Title of %s" % entryId]]))
+            if hasKeywords:
+                container.append(DataCategory("struct_keywords", ["text", "entry_id", "pdbx_keywords"], [["text %s" % entryId, entryId, "HYDROLASE"]]))
+            cL.append(container)
+        return cL
+
+    def testDataSelectors(self):
+        """Test case - data selectors accept matching containers and reject non-matching containers and missing content"""
+        try:
+            dtf = DataTransformFactory(schemaDefAccessObj=self.__sD, filterType="none")
+            sdp = SchemaDefDataPrep(schemaDefAccessObj=self.__sD, dtObj=dtf, workPath=None, verbose=True)
+            allIdL = ["1ABC", "2DEF", "3GHI", "4JKL", "5MNO"]
+            for dataSelectors, acceptL, missingAttributeL in [
+                (None, allIdL, []),
+                (["XRAY"], ["1ABC"], ["3GHI"]),
+                (["XRAY_OR_NMR"], ["1ABC", "2DEF", "5MNO"], ["3GHI"]),
+                (["XRAY_OR_NMR", "XRAY"], ["1ABC"], ["3GHI"]),
+            ]:
+                # -- repeat to apply compiled selectors
+                for _ in range(2):
+                    with self.assertLogs("rcsb.db.processors.SchemaDefDataPrep", level="DEBUG") as cm:
+                        docList, containerNameList, rejectList = sdp.processDocuments(self.__getContainerList(), styleType="rowwise_by_id", dataSelectors=dataSelectors)
+                    self.assertEqual(containerNameList, acceptL)
+                    self.assertEqual(sorted(rejectList), [cId for cId in allIdL if cId not in acceptL])
+                    self.assertEqual([doc["ENTRY"][0]["ID"] for doc in docList], acceptL)
+                    # -- only missing attributes are reported as errors
+                    errorL = [rec.getMessage() for rec in cm.records if rec.levelno >= logging.ERROR]
+                    self.assertEqual(len(errorL), len(missingAttributeL))
+                    for cId, msg in zip(missingAttributeL, errorL):
+                        self.assertIn(cId, msg)
+                        self.assertIn("exptl.method", msg)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def __getDocumentList(self):
+        """Return documents with subcategory content in lists of rows and in single row dictionaries."""
+        docList = [
+            {
+                "entry": [{"id": "1ABC"}],
+                "citation": [{"id": "1", "title": "A title", "journal_abbrev": "J Mol Biol", "journal_volume": "?"}, {"id": "2", "journal_abbrev": "Nature"}, {"id": "3"}],
+                "struct_ref": {"id": "1", "db_name": ["UNP", "GB", "?"], "db_code": ["P12345", "."]},
+            },
+            {"citation": {"id": "1", "journal_abbrev": ".", "journal_volume": "12"}, "struct_ref": [{"id": "1", "db_name": ["UNP"], "db_code": ["P12345"]}, {"id": "2"}]},
+            {"entry": [{"id": "3GHI"}]},
+        ]
+        return docList
+
+    def __addSubCategoryAggregatesReference(self, docList, collectionName, removeSubCategoryPrefix):
+        """Per-document subcategory aggregation of the input documents (as performed prior to caching aggregate plans)."""
+        for doc in docList:
+            for scAg in self.__sD.getSubCategoryAggregates(collectionName):
+                hasUnitCard = self.__sD.getSubCategoryAggregatesUnitCardinality(collectionName, scAg)
+                for sId in self.__sD.getSubCategorySchemaIdList(scAg):
+                    sName = self.__sD.getSchemaName(sId)
+                    if sName not in doc:
+                        continue
+                    atNameAllL = [self.__sD.getAttributeName(sId, atId) for atId in self.__sD.getSubCategoryAttributeIdList(sId, scAg)]
+                    for rowD in doc[sName] if isinstance(doc[sName], list) else [doc[sName]]:
+                        atNameL = [atName for atName in atNameAllL if atName in rowD]
+                        if not atNameL:
+                            continue
+                        cAtNameD = {atName: atName.replace(scAg + "_", "") if removeSubCategoryPrefix else atName for atName in atNameL}
+                        if hasUnitCard:
+                            rowD[scAg] = {cAtNameD[atName]: rowD[atName] for atName in atNameL if rowD[atName] and rowD[atName] not in [".", "?"]}
+                        else:
+                            atLen = min([len(rowD[atName]) for atName in atNameL])
+                            rowD[scAg] = [{cAtNameD[atName]: rowD[atName][ii] for atName in atNameL if rowD[atName][ii] and rowD[atName][ii] not in [".", "?"]} for ii in range(atLen)]
+                        for atName in atNameL:
+                            del rowD[atName]
+        return docList
+
+    def testSubCategoryAggregatePlan(self):
+        """Test case - planned subcategory aggregation matches per-document aggregation"""
+        try:
+            sdp = SchemaDefDataPrep(schemaDefAccessObj=self.__sD, dtObj=None, workPath=None, verbose=True)
+            for removeSubCategoryPrefix in [True, False]:
+                refDocList = self.__addSubCategoryAggregatesReference(self.__getDocumentList(), "test_collection", removeSubCategoryPrefix)
+                # -- repeat to apply the cached plan and compare with a new instance
+                for sdpT in [sdp, sdp, SchemaDefDataPrep(schemaDefAccessObj=self.__sD, dtObj=None, workPath=None, verbose=True)]:
+                    docList = sdpT.addDocumentSubCategoryAggregates(self.__getDocumentList(), "test_collection", removeSubCategoryPrefix=removeSubCategoryPrefix)
+                    self.assertEqual(docList, refDocList)
+            #
+            self.assertEqual(refDocList[0]["citation"][0]["journal"], {"journal_abbrev": "J Mol Biol"})
+            self.assertEqual(refDocList[0]["struct_ref"]["db"], [{"db_name": "UNP", "db_code": "P12345"}, {"db_name": "GB"}])
+            docList = sdp.addDocumentSubCategoryAggregates(self.__getDocumentList(), "test_collection")
+            self.assertEqual(docList[1]["citation"], {"id": "1", "journal": {"volume": "12"}})
+            self.assertEqual(docList[1]["struct_ref"], [{"id": "1", "db": [{"name": "UNP", "code": "P12345"}]}, {"id": "2"}])
+            # -- collections without aggregates and unsupported styles leave the documents unchanged
+            for collectionName, styleType in [("other_collection", "rowwise_by_name"), ("test_collection", "rowwise_by_id")]:
+                docList = sdp.addDocumentSubCategoryAggregates(copy.deepcopy(refDocList), collectionName, styleType=styleType)
+                self.assertEqual(docList, refDocList)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def __mapDataReference(self, dtf, containerList, tableIdList):
+        """Map every input table for each input container (as performed prior to table mapping plans)."""
+        schemaDataDict = {}
+        for container in containerList:
+            for tableId in sorted(tableIdList):
+                tObj = self.__sD.getSchemaObject(tableId)
+                mapCategoryNameList = tObj.getMapInstanceCategoryList()
+                rowDList = []
+                mD = {}
+                for categoryName in mapCategoryNameList:
+                    catObj = container.getObj(categoryName)
+                    if catObj is None:
+                        continue
+                    indL = tObj.getMapMergeIndexAttributes(categoryName)
+                    for row in catObj.getRowList():
+                        dD = dtf.processRecord(tableId, row, catObj.getAttributeList(), containerName=container.getName())
+                        if len(mapCategoryNameList) == 1:
+                            rowDList.append(dD)
+                        else:
+                            mD.setdefault(tuple([row[catObj.getAttributeIndex(atName)] for atName in indL]), {}).update(dD)
+                rowDList = list(mD.values()) if len(mapCategoryNameList) > 1 else rowDList
+                if not mapCategoryNameList:
+                    rowDList = [{}]
+                for atId in tObj.getMapOtherAttributeIdList():
+                    self.assertEqual(tObj.getMapAttributeFunction(atId), "datablockid()")
+                    for rowD in rowDList:
+                        rowD[atId] = container.getName()
+                schemaDataDict.setdefault(tableId, []).extend(rowDList)
+        return schemaDataDict
+
+    def testMapPlan(self):
+        """Test case - planned mapping of the tables consuming the categories of each container matches mapping every selected table"""
+        try:
+            containerList = self.__getContainerList()
+            # -- merged categories without a common key, an unmapped category and an empty container
+            container = DataContainer("6PQR")
+            container.append(DataCategory("struct_keywords", ["entry_id", "pdbx_keywords"], [["6PQR", "HYDROLASE"], ["XXXX", "TRANSFERASE"]]))
+            container.append(DataCategory("struct", ["title"], [["No key"]]))
+            container.append(DataCategory("unmapped", ["id"], [["1"]]))
+            containerList.extend([container, DataContainer("7STU")])
+            #
+            allTableIdL = self.__sD.getSchemaIdList()
+            dtf = DataTransformFactory(schemaDefAccessObj=self.__sD, filterType="none")
+            sdp = SchemaDefDataPrep(schemaDefAccessObj=self.__sD, dtObj=dtf, workPath=None, verbose=True)
+            # -- repeat the selections to apply the cached plans
+            selectionL = [([], []), (["STRUCT", "SOURCE", "EXPTL", "UNDEFINED"], []), ([], ["ENTRY", "CITATION"]), (["STRUCT", "SOURCE", "EXPTL"], ["EXPTL"]), ([], [])]
+            for includeL, excludeL in selectionL * 2:
+                sdp.setSchemaIdIncludeList(includeL)
+                sdp.setSchemaIdExcludeList(excludeL)
+                tableIdL = [tableId for tableId in (includeL if includeL else allTableIdL) if tableId in allTableIdL and tableId not in excludeL]
+                refD = self.__mapDataReference(dtf, containerList, tableIdL)
+                tableDataDictById, containerNameList = sdp.process(containerList, styleType="rowwise_by_id")
+                self.assertEqual(containerNameList, [container.getName() for container in containerList])
+                self.assertEqual(tableDataDictById, refD)
+            #
+            # -- rows of merged categories are keyed by the available merging values (6PQR has three keys)
+            self.assertEqual(len(refD["STRUCT"]), 7)
+            self.assertEqual(refD["SOURCE"], [{"NAME": container.getName()} for container in containerList])
+            self.assertEqual(refD["CITATION"], [])
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
 def prepSuite():
     suiteSelect = unittest.TestSuite()
     suiteSelect.addTest(SchemaDefDataPrepTests("testSimpleSchemaDefDataPrep"))
     suiteSelect.addTest(SchemaDefDataPrepTests("testFullSchemaDefDataPrep"))
+    suiteSelect.addTest(SchemaDefDataPrepTests("testMultiCollectionDataPrep"))
+    suiteSelect.addTest(SchemaDefDataPrepTests("testSlicedShapeOnePass"))
+    suiteSelect.addTest(SchemaDefDataPrepTests("testFusedDocumentShape"))
+    suiteSelect.addTest(SchemaDefDataPrepTests("testProcessDocumentsIter"))
+    suiteSelect.addTest(SchemaDefDataPrepTests("testMergedCategoryBenchmark"))
+    return suiteSelect
+
+
+def prepSyntheticSuite():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(SchemaDefDataPrepSyntheticTests("testDataSelectors"))
+    suiteSelect.addTest(SchemaDefDataPrepSyntheticTests("testSubCategoryAggregatePlan"))
+    suiteSelect.addTest(SchemaDefDataPrepSyntheticTests("testMapPlan"))
     return suiteSelect
 
 
@@ -365,3 +793,5 @@ if __name__ == "__main__":
 
     mySuite = prepSuite()
     unittest.TextTestRunner(verbosity=2).run(mySuite)
+    mySuite = prepSyntheticSuite()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
@@ -0,0 +1,97 @@
+##
+# File:    testWriterPipeline.py
+# Author:  agent
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#
+##
+"""
+Tests for the bounded producer/consumer writer pipeline.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "agent"
+__email__ = "agent@local"
+__license__ = "Apache 2.0"
+
+import logging
+import threading
+import time
+import unittest
+
+from rcsb.db.utils.WriterPipeline import WriterPipeline
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s [%(levelname)s]-%(module)s.%(funcName)s: %(message)s")
+logger = logging.getLogger()
+logger.setLevel(logging.INFO)
+
+
+class WriterPipelineTests(unittest.TestCase):
+    def setUp(self):
+        self.__lock = threading.Lock()
+        self.__writtenD = {}
+        self.__startTime = time.time()
+        logger.debug("Starting %s at %s", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()))
+
+    def tearDown(self):
+        endTime = time.time()
+        logger.debug("Completed %s at %s (%.4f seconds)", self.id(), time.strftime("%Y %m %d %H:%M:%S", time.localtime()), endTime - self.__startTime)
+
+    def __write(self, streamName, dList, delay=0.01):
+        time.sleep(delay)
+        if dList is None:
+            raise ValueError("Missing document list")
+        with self.__lock:
+            self.__writtenD.setdefault(streamName, []).extend(dList)
+        return len(dList)
+
+    def testPipelineOrder(self):
+        """Test case - items in each stream are written in submission order"""
+        try:
+            streamNames = ["entry", "polymer_entity"]
+            wp = WriterPipeline(self.__write, streamNames=streamNames)
+            futL = []
+            for ii in range(10):
+                for streamName in streamNames:
+                    futL.append(wp.submit(streamName, 0, streamName, [ii]))
+            wp.close()
+            self.assertEqual(sum([fut.result() for fut in futL]), 20)
+            for streamName in streamNames:
+                self.assertEqual(self.__writtenD[streamName], list(range(10)))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+    def testPipelineBackpressure(self):
+        """Test case - submission blocks while the queued byte budget is exhausted"""
+        try:
+            wp = WriterPipeline(self.__write, maxQueueMB=0.001)
+            futL = []
+            for ii in range(5):
+                futL.append(wp.submit("default", 600, "default", [ii], delay=0.05))
+                # at most one item within the 1000 byte budget may be queued or in progress
+                self.assertLessEqual(wp.getQueuedBytes(), 600)
+            # a writer failure is returned through the future
+            fut = wp.submit("default", 10, "default", None)
+            wp.close()
+            self.assertEqual(self.__writtenD["default"], list(range(5)))
+            self.assertIsInstance(fut.exception(), ValueError)
+            self.assertEqual(wp.getQueuedBytes(), 0)
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+            self.fail()
+
+
+def suiteWriterPipeline():
+    suiteSelect = unittest.TestSuite()
+    suiteSelect.addTest(WriterPipelineTests("testPipelineOrder"))
+    suiteSelect.addTest(WriterPipelineTests("testPipelineBackpressure"))
+    return suiteSelect
+
+
+if __name__ == "__main__":
+    mySuite = suiteWriterPipeline()
+    unittest.TextTestRunner(verbosity=2).run(mySuite)
@@ -0,0 +1,198 @@
+##
+# File:    ContainerCache.py
+# Author:  agent
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#
+##
+"""
+Local cache of parsed (and merged) data containers stored in binary (pickle) format.
+
+Cache entries are keyed by the locator paths and formats of the input files together with their size and
+modification time (or content digest).  Changed input files produce new keys, and stale entries are
+removed by size-bounded eviction of the least recently used entries.  The cache directory may be shared
+by concurrent processes (entries are written to temporary files and then renamed) and the size bound
+is applied approximately by each process.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "agent"
+__email__ = "agent@local"
+__license__ = "Apache 2.0"
+
+import hashlib
+import logging
+import os
+import pickle
+
+import mmcif
+
+from rcsb.utils.io.FileUtil import FileUtil
+from rcsb.utils.io.MarshalUtil import MarshalUtil
+
+logger = logging.getLogger(__name__)
+
+
+class ContainerCache(object):
+    """ Local cache of parsed data containers stored in binary (pickle) format.
+    """
+
+    __version = 1
+
+    def __init__(self, cachePath, maxSizeMB=None, useDigest=False):
+        """ Local cache of parsed data containers stored in binary (pickle) format.
+
+        Args:
+            cachePath (str): cache directory path
+            maxSizeMB (float, optional): approximate limit on the total size of the cache (MB) (default: no limit)
+            useDigest (bool, optional): key entries by input file content digest rather than size and modification time
+        """
+        self.__cachePath = os.path.abspath(cachePath)
+        self.__maxBytes = int(maxSizeMB * 1048576) if maxSizeMB else None
+        self.__useDigest = useDigest
+        self.__mU = MarshalUtil()
+        self.__fU = FileUtil()
+        self.__sizeBytes = None
+        self.__statsD = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+
+    def getContainerList(self, locatorObj, readFunc):
+        """ Return the containers for the input locator object from the cache or otherwise from readFunc(locatorObj)
+            adding the result to the cache.
+
+        Args:
+            locatorObj (str or tuple): locator path or tuple of locator dictionaries {"locator": path, "fmt": format, "kwargs": {...}}
+            readFunc (func): function returning the container list for the locator object
+
+        Returns:
+            list: data container list
+        """
+        filePath = self.__getCacheFilePath(locatorObj)
+        if filePath:
+            cL = self.__read(filePath)
+            if cL:
+                self.__statsD["hits"] += 1
+                return cL
+        self.__statsD["misses"] += 1
+        cL = readFunc(locatorObj)
+        if filePath and cL:
+            self.__write(filePath, cL)
+        return cL
+
+    def getCachedFilePath(self, locatorObj):
+        """ Return the path of the cache file for the input locator object if it is cached or otherwise None.
+        """
+        filePath = self.__getCacheFilePath(locatorObj)
+        return filePath if filePath and os.access(filePath, os.R_OK) else None
+
+    def getStats(self):
+        """ Return the counts of cache hits, misses, writes and evictions for this instance.
+        """
+        return self.__statsD
+
+    def __getCacheFilePath(self, locatorObj):
+        """ Return the cache file path for the input locator object or None if an input file is not accessible.
+        """
+        try:
+            if isinstance(locatorObj, str):
+                locatorObj = ({"locator": locatorObj, "fmt": "mmcif", "kwargs": {}},)
+            keyL = [self.__version, mmcif.__version__]
+            for dD in locatorObj:
+                pth = dD["locator"]
+                helper = dD["kwargs"].get("marshalHelper", None) if dD["kwargs"] else None
+                if self.__useDigest:
+                    fileKey = self.__fU.hash(pth, hashType="md5")
+                    if not fileKey:
+                        return None
+                else:
+                    st = os.stat(pth)
+                    fileKey = (st.st_size, st.st_mtime_ns)
+                keyL.append((os.path.abspath(pth), dD["fmt"], helper.__name__ if helper else None, fileKey))
+            key = hashlib.sha1(repr(keyL).encode("utf-8")).hexdigest()
+            return os.path.join(self.__cachePath, key[:2], key + ".pic")
+        except Exception as e:
+            logger.debug("No cache key for %r with %s", locatorObj, str(e))
+        return None
+
+    def __read(self, filePath):
+        if not os.access(filePath, os.R_OK):
+            return None
+        cL = self.__mU.doImport(filePath, fmt="pickle", default=None)
+        if cL:
+            try:
+                # refresh the modification time used to order evictions
+                os.utime(filePath)
+            except OSError:
+                pass
+        else:
+            logger.warning("Removing unreadable cache entry %s", filePath)
+            self.__remove(filePath)
+        return cL
+
+    def __write(self, filePath, cL):
+        try:
+            dirPath = os.path.dirname(filePath)
+            if not os.path.isdir(dirPath):
+                os.makedirs(dirPath, exist_ok=True)
+            tmpPath = "%s.%d.tmp" % (filePath, os.getpid())
+            ok = self.__mU.doExport(tmpPath, cL, fmt="pickle", pickleProtocol=pickle.HIGHEST_PROTOCOL)
+            if ok:
+                os.replace(tmpPath, filePath)
+                self.__statsD["writes"] += 1
+                self.__evict(os.path.getsize(filePath))
+            else:
+                self.__remove(tmpPath)
+            return ok
+        except Exception as e:
+            logger.warning("Failing to cache %s with %s", filePath, str(e))
+        return False
+
+    def __evict(self, numBytes):
+        """ Remove the least recently used cache entries when the cache size exceeds the size limit (to 90% of the limit).
+        """
+        if not self.__maxBytes:
+            return
+        if self.__sizeBytes is None:
+            self.__sizeBytes = sum([tup[2] for tup in self.__getEntryList()])
+        else:
+            self.__sizeBytes += numBytes
+        if self.__sizeBytes <= self.__maxBytes:
+            return
+        entryList = sorted(self.__getEntryList())
+        self.__sizeBytes = sum([tup[2] for tup in entryList])
+        for _, pth, size in entryList:
+            if self.__sizeBytes <= 0.9 * self.__maxBytes:
+                break
+            if self.__remove(pth):
+                self.__sizeBytes -= size
+                self.__statsD["evictions"] += 1
+        logger.debug("Container cache %s size %.2f MB evictions %d", self.__cachePath, self.__sizeBytes / 1048576.0, self.__statsD["evictions"])
+
+    def __getEntryList(self):
+        """ Return the list of cache entries [(mtime, path, size), ...].
+        """
+        entryList = []
+        if not os.path.isdir(self.__cachePath):
+            return entryList
+        with os.scandir(self.__cachePath) as it:
+            dirPathL = [entry.path for entry in it if entry.is_dir()]
+        for dirPath in dirPathL:
+            with os.scandir(dirPath) as it:
+                for entry in it:
+                    if entry.name.endswith(".pic"):
+                        try:
+                            st = entry.stat()
+                            entryList.append((st.st_mtime, entry.path, st.st_size))
+                        except OSError:
+                            pass
+        return entryList
+
+    def __remove(self, filePath):
+        try:
+            os.remove(filePath)
+            return True
+        except OSError:
+            pass
+        return False
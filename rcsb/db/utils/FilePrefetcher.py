@@ -0,0 +1,158 @@
+##
+# File:    FilePrefetcher.py
+# Author:  agent
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#
+##
+"""
+Read-ahead of the input files of the items of a work list on a background thread.
+
+The files of the next items are read while the current item is processed so that storage
+latency (e.g. network file systems) is overlapped with computation.  File content is read into
+the operating system page cache (the readers reopen files by path) and is not retained by the
+prefetcher.  The read-ahead is bounded by the number of items and the size of the files read
+ahead of the consumer.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "agent"
+__email__ = "agent@local"
+__license__ = "Apache 2.0"
+
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class FilePrefetcher(object):
+    """ Read-ahead of the input files of the items of a work list on a background thread.
+
+        Items are returned in order by iterating the prefetcher.  Use as a context manager or call
+        close() to stop the background thread if iteration is not completed.
+    """
+
+    def __init__(self, itemList, pathFunc, numAhead=4, maxSizeMB=64, chunkSize=1048576):
+        """ Read-ahead of the input files of the items of a work list on a background thread.
+
+        Args:
+            itemList (list): work list items (e.g. locator objects)
+            pathFunc (func): function returning the list of file paths for an item
+            numAhead (int, optional): maximum number of items read ahead of the current item
+            maxSizeMB (float, optional): approximate limit on the size of the files read ahead of the current item (MB)
+            chunkSize (int, optional): read size (bytes)
+        """
+        self.__itemList = list(itemList)
+        self.__pathFunc = pathFunc
+        self.__numAhead = numAhead
+        self.__maxBytes = int(maxSizeMB * 1048576) if maxSizeMB else None
+        self.__chunkSize = chunkSize
+        #
+        self.__cond = threading.Condition()
+        # index of the item being processed by the consumer
+        self.__position = -1
+        # file sizes read ahead of the consumer {item index: bytes}
+        self.__aheadD = {}
+        self.__aheadBytes = 0
+        self.__stop = False
+        self.__thread = None
+        self.__statsD = {"items": 0, "files": 0, "bytes": 0, "skipped": 0}
+
+    def __iter__(self):
+        self.start()
+        try:
+            for ii, item in enumerate(self.__itemList):
+                with self.__cond:
+                    self.__position = ii
+                    for jj in [jj for jj in self.__aheadD if jj <= ii]:
+                        self.__aheadBytes -= self.__aheadD.pop(jj)
+                    self.__cond.notify_all()
+                yield item
+        finally:
+            self.close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+
+    def start(self):
+        """ Start the background read-ahead thread (if not started).
+        """
+        if self.__thread is None and self.__numAhead and self.__itemList:
+            self.__thread = threading.Thread(target=self.__run, name="FilePrefetcher", daemon=True)
+            self.__thread.start()
+
+    def close(self):
+        """ Stop the background read-ahead thread.
+        """
+        with self.__cond:
+            self.__stop = True
+            self.__cond.notify_all()
+        if self.__thread is not None and self.__thread is not threading.current_thread():
+            self.__thread.join()
+
+    def getStats(self):
+        """ Return the counts of the items, files and bytes read ahead and the files that could not be read.
+        """
+        return self.__statsD
+
+    def __run(self):
+        buf = bytearray(self.__chunkSize)
+        for jj, item in enumerate(self.__itemList):
+            with self.__cond:
+                while not self.__stop and jj > self.__position and not self.__isAllowed(jj):
+                    self.__cond.wait()
+                if self.__stop:
+                    return
+                if jj <= self.__position:
+                    # the consumer has reached this item
+                    continue
+            try:
+                pathList = self.__pathFunc(item)
+            except Exception as e:
+                logger.debug("No paths for %r with %s", item, str(e))
+                pathList = []
+            numBytes = 0
+            for pth in pathList:
+                numBytes += self.__readFile(pth, buf)
+                if self.__stop:
+                    return
+            with self.__cond:
+                self.__statsD["items"] += 1
+                if jj > self.__position:
+                    self.__aheadD[jj] = numBytes
+                    self.__aheadBytes += numBytes
+        logger.debug("Prefetch completed %r", self.__statsD)
+
+    def __isAllowed(self, jj):
+        """ Return True if item jj is within the read-ahead limits (at least one item is always allowed).
+        """
+        if jj - self.__position > self.__numAhead:
+            return False
+        if self.__maxBytes and self.__aheadBytes >= self.__maxBytes and self.__aheadD:
+            return False
+        return True
+
+    def __readFile(self, filePath, buf):
+        numBytes = 0
+        try:
+            with open(filePath, "rb", buffering=0) as ifh:
+                while not self.__stop:
+                    nRead = ifh.readinto(buf)
+                    if not nRead:
+                        break
+                    numBytes += nRead
+            if not self.__stop:
+                self.__statsD["files"] += 1
+                self.__statsD["bytes"] += numBytes
+        except Exception as e:
+            logger.debug("Skipping prefetch of %r with %s", filePath, str(e))
+            self.__statsD["skipped"] += 1
+        return numBytes
@@ -0,0 +1,148 @@
+##
+# File:    LoadMetrics.py
+# Author:  agent
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#  18-Oct-2026 agent  serialize updates from concurrent writer threads
+#
+##
+"""
+Accumulate and export structured per-stage timing and volume metrics for database load operations.
+
+Metrics are collected as plain dictionaries within each load worker process, returned through the
+multiprocessing result list, and merged in the driver process before export as a JSON file or as a
+Prometheus node exporter text file.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "agent"
+__email__ = "agent@local"
+__license__ = "Apache 2.0"
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from rcsb.utils.io.MarshalUtil import MarshalUtil
+
+logger = logging.getLogger(__name__)
+
+
+class LoadMetrics(object):
+    """Accumulate per-stage elapsed times (seconds) and named counts (e.g. containers, documents, bytes)."""
+
+    def __init__(self):
+        self.__timeD = OrderedDict()
+        self.__countD = OrderedDict()
+        # number of worker metric sets merged into this instance
+        self.__workerCount = 0
+        # updates may arrive from concurrent collection writer threads within a worker
+        self.__lock = threading.Lock()
+
+    @contextmanager
+    def timer(self, stage):
+        """Context manager accumulating the elapsed time of the enclosed block for the input stage."""
+        startTime = time.time()
+        try:
+            yield
+        finally:
+            self.addTime(stage, time.time() - startTime)
+
+    def addTime(self, stage, seconds):
+        with self.__lock:
+            self.__timeD[stage] = self.__timeD.get(stage, 0.0) + seconds
+
+    def addCount(self, name, count=1):
+        with self.__lock:
+            self.__countD[name] = self.__countD.get(name, 0) + count
+
+    def getTime(self, stage):
+        return self.__timeD.get(stage, 0.0)
+
+    def getCount(self, name):
+        return self.__countD.get(name, 0)
+
+    def getMetrics(self):
+        """Return a serializable dictionary of the current metrics."""
+        with self.__lock:
+            return {"stage_seconds": dict(self.__timeD), "counts": dict(self.__countD), "worker_count": max(1, self.__workerCount)}
+
+    def merge(self, metricsD):
+        """Fold the metrics dictionary returned by another (worker) instance into the current metrics."""
+        if not metricsD:
+            return False
+        try:
+            for stage, seconds in metricsD.get("stage_seconds", {}).items():
+                self.addTime(stage, seconds)
+            for name, count in metricsD.get("counts", {}).items():
+                self.addCount(name, count)
+            self.__workerCount += metricsD.get("worker_count", 1)
+            return True
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+        return False
+
+    def write(self, filePath, fmt="json", labelD=None, elapsedSeconds=None):
+        """Export the current metrics.
+
+        Args:
+            filePath (str): output file path
+            fmt (str, optional): 'json' or 'prometheus' (node exporter text file format)
+            labelD (dict, optional): labels (e.g. database and collection names) attached to the exported metrics
+            elapsedSeconds (float, optional): wall clock time for the complete operation
+
+        Returns:
+            bool: True for success or False otherwise
+        """
+        try:
+            labelD = labelD if labelD else {}
+            dirPath = os.path.dirname(filePath)
+            if dirPath:
+                os.makedirs(dirPath, exist_ok=True)
+            if fmt == "prometheus":
+                return self.__writePrometheus(filePath, labelD, elapsedSeconds)
+            rD = OrderedDict(labelD)
+            rD["timestamp"] = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime())
+            if elapsedSeconds is not None:
+                rD["elapsed_seconds"] = elapsedSeconds
+            rD.update(self.getMetrics())
+            numDocs = self.getCount("documents")
+            if elapsedSeconds and numDocs:
+                rD["documents_per_second"] = float(numDocs) / elapsedSeconds
+            mU = MarshalUtil()
+            return mU.doExport(filePath, rD, fmt="json", indent=3)
+        except Exception as e:
+            logger.exception("Failing for %s with %s", filePath, str(e))
+        return False
+
+    def __writePrometheus(self, filePath, labelD, elapsedSeconds):
+        lS = ",".join(['%s="%s"' % (ky, str(val).replace('"', "'")) for ky, val in labelD.items()])
+        lS = lS + "," if lS else lS
+        lineL = []
+        lineL.append("# HELP rcsb_db_load_stage_seconds Cumulative worker time spent in each load stage.")
+        lineL.append("# TYPE rcsb_db_load_stage_seconds gauge")
+        for stage, seconds in self.__timeD.items():
+            lineL.append('rcsb_db_load_stage_seconds{%sstage="%s"} %.6f' % (lS, stage, seconds))
+        lineL.append("# HELP rcsb_db_load_count Number of objects or bytes processed by the load operation.")
+        lineL.append("# TYPE rcsb_db_load_count gauge")
+        for name, count in self.__countD.items():
+            lineL.append('rcsb_db_load_count{%sname="%s"} %d' % (lS, name, count))
+        lineL.append("# HELP rcsb_db_load_workers Number of load worker tasks merged.")
+        lineL.append("# TYPE rcsb_db_load_workers gauge")
+        lineL.append("rcsb_db_load_workers{%s} %d" % (lS.rstrip(","), max(1, self.__workerCount)))
+        if elapsedSeconds is not None:
+            lineL.append("# HELP rcsb_db_load_elapsed_seconds Wall clock time for the load operation.")
+            lineL.append("# TYPE rcsb_db_load_elapsed_seconds gauge")
+            lineL.append("rcsb_db_load_elapsed_seconds{%s} %.6f" % (lS.rstrip(","), elapsedSeconds))
+        # write then rename so that the text file collector never reads a partial file
+        tmpPath = filePath + ".tmp"
+        with open(tmpPath, "w", encoding="utf-8") as ofh:
+            ofh.write("\n".join(lineL) + "\n")
+        os.replace(tmpPath, filePath)
+        return True
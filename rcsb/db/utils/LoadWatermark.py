@@ -0,0 +1,192 @@
+##
+# File:    LoadWatermark.py
+# Author:  agent
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#  18-Oct-2026 agent add clear() to drop the records of collections set up for a full load
+##
+"""
+Persistent record of the repository file state of the entries loaded in each collection of a database
+(load watermark) and the difference between this record and the current repository state.
+
+Entry file states are tuples with one element for the entry file and one for each merged content type
+(e.g. validation reports) of the form (path, size, modification time) or None if the file is missing.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "agent"
+__email__ = "agent@local"
+__license__ = "Apache 2.0"
+
+import logging
+import os
+import time
+
+from rcsb.utils.io.FileUtil import FileUtil
+from rcsb.utils.io.MarshalUtil import MarshalUtil
+
+logger = logging.getLogger(__name__)
+
+
+class LoadWatermark(object):
+    """ Persistent record of the repository file state of the entries loaded in each collection of a database.
+    """
+
+    __version = 1
+
+    def __init__(self, watermarkPath):
+        """ Persistent record of the repository file state of the entries loaded in each collection of a database.
+
+        Args:
+            watermarkPath (str): path of the watermark file
+        """
+        self.__watermarkPath = watermarkPath
+        self.__mU = MarshalUtil()
+        self.__fU = FileUtil()
+        self.__wD = self.__load()
+        # digests computed for the current repository files {path: digest}
+        self.__digestD = {}
+        # identifiers with modification times changed but unchanged content
+        self.__touchedIdS = set()
+
+    def getDiff(self, stateD, collectionNameList, useDigest=False):
+        """ Compare the current repository entry file states with the recorded states for the input collections.
+
+        Args:
+            stateD (dict): current entry file states {idCode: ((path, size, mtime), ...), ...}
+            collectionNameList (list): collection names
+            useDigest (bool, optional): compare the content digests of files with the same size and a changed
+                                        modification time (when a digest was recorded)
+
+        Returns:
+            dict: {"added": [idCode, ...], "modified": [...], "removed": [...], "unchanged": count} where entries are added
+                  if not recorded in any input collection and removed if recorded in any input collection
+                  but no longer present in the repository.
+        """
+        addedS = set()
+        modifiedS = set()
+        removedS = set()
+        self.__touchedIdS = set()
+        for collectionName in collectionNameList:
+            entryD = self.__getEntryD(collectionName)
+            for idCode, state in stateD.items():
+                if idCode in addedS:
+                    continue
+                rD = entryD.get(idCode, None)
+                if rD is None:
+                    addedS.add(idCode)
+                elif idCode not in modifiedS and self.__isChanged(idCode, rD, state, useDigest):
+                    modifiedS.add(idCode)
+            removedS.update([idCode for idCode in entryD if idCode not in stateD])
+        modifiedS -= addedS
+        self.__touchedIdS -= addedS | modifiedS
+        rD = {"added": sorted(addedS), "modified": sorted(modifiedS), "removed": sorted(removedS), "unchanged": len(stateD) - len(addedS) - len(modifiedS)}
+        logger.info(
+            "Load watermark %s collections %r added %d modified %d removed %d unchanged %d",
+            self.__watermarkPath,
+            collectionNameList,
+            len(rD["added"]),
+            len(rD["modified"]),
+            len(rD["removed"]),
+            rD["unchanged"],
+        )
+        return rD
+
+    def update(self, stateD, collectionNameList, loadedIdList, removedIdList, useDigest=False):
+        """ Record the current file states of loaded entries and drop the records of removed entries for the input collections.
+
+        Args:
+            stateD (dict): current entry file states {idCode: ((path, size, mtime), ...), ...}
+            collectionNameList (list): collection names
+            loadedIdList (list): identifiers of successfully loaded entries
+            removedIdList (list): identifiers of entries purged from the collections
+            useDigest (bool, optional): record the content digests of the files of loaded entries
+
+        Returns:
+            bool: True for success or False otherwise
+        """
+        try:
+            updateD = {}
+            for idCode in loadedIdList:
+                if idCode in stateD:
+                    digests = tuple([self.__getDigest(fS[0]) if fS else None for fS in stateD[idCode]]) if useDigest else None
+                    updateD[idCode] = {"files": stateD[idCode], "digests": digests}
+            for collectionName in collectionNameList:
+                entryD = self.__getEntryD(collectionName)
+                # refresh the modification times of entries with unchanged content (the recorded digests remain valid)
+                for idCode in self.__touchedIdS:
+                    if idCode in entryD and idCode in stateD:
+                        entryD[idCode] = {"files": stateD[idCode], "digests": entryD[idCode]["digests"]}
+                entryD.update(updateD)
+                for idCode in removedIdList:
+                    entryD.pop(idCode, None)
+                self.__wD["collections"][collectionName]["timestamp"] = time.time()
+            self.__touchedIdS = set()
+            return self.__save()
+        except Exception as e:
+            logger.exception("Failing for %s with %s", self.__watermarkPath, str(e))
+        return False
+
+    def clear(self, collectionNameList):
+        """ Drop the records of the input collections (all entries are then reported as added for these collections).
+        """
+        for collectionName in collectionNameList:
+            self.__wD["collections"].pop(collectionName, None)
+
+    def getTimestamp(self, collectionName):
+        """ Return the time of the last update of the input collection watermark (seconds since the epoch) or None.
+        """
+        return self.__wD["collections"][collectionName]["timestamp"] if collectionName in self.__wD["collections"] else None
+
+    def __getEntryD(self, collectionName):
+        if collectionName not in self.__wD["collections"]:
+            self.__wD["collections"][collectionName] = {"timestamp": None, "entryD": {}}
+        return self.__wD["collections"][collectionName]["entryD"]
+
+    def __isChanged(self, idCode, rD, state, useDigest):
+        oldState = rD["files"]
+        if len(oldState) != len(state):
+            return True
+        touched = False
+        for ii, (oldS, newS) in enumerate(zip(oldState, state)):
+            if oldS is None or newS is None:
+                if oldS != newS:
+                    return True
+                continue
+            if oldS[0] != newS[0] or oldS[1] != newS[1]:
+                return True
+            if oldS[2] != newS[2]:
+                if not useDigest or not rD["digests"] or not rD["digests"][ii] or self.__getDigest(newS[0]) != rD["digests"][ii]:
+                    return True
+                touched = True
+        if touched:
+            self.__touchedIdS.add(idCode)
+        return False
+
+    def __getDigest(self, filePath):
+        if filePath not in self.__digestD:
+            self.__digestD[filePath] = self.__fU.hash(filePath, hashType="md5")
+        return self.__digestD[filePath]
+
+    def __load(self):
+        wD = None
+        if self.__watermarkPath and os.access(self.__watermarkPath, os.R_OK):
+            wD = self.__mU.doImport(self.__watermarkPath, fmt="pickle", default=None)
+        if not wD or wD.get("version") != self.__version:
+            wD = {"version": self.__version, "collections": {}}
+        return wD
+
+    def __save(self):
+        """ Save the watermark (written to a temporary file and then renamed).
+        """
+        dirPath = os.path.dirname(self.__watermarkPath)
+        if dirPath and not os.path.isdir(dirPath):
+            os.makedirs(dirPath)
+        tmpPath = "%s.%d.tmp" % (self.__watermarkPath, os.getpid())
+        ok = self.__mU.doExport(tmpPath, self.__wD, fmt="pickle")
+        if ok:
+            os.replace(tmpPath, self.__watermarkPath)
+        return ok
@@ -0,0 +1,214 @@
+##
+# File:    RepositoryManifest.py
+# Author:  agent
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#
+##
+"""
+Persistent manifest of the files in a repository organized in two-character hash directories
+(e.g. <top>/ab/1abc.cif.gz or <top>/ab/1abc/1abc_validation.xml.gz).
+
+The manifest records the path, size and modification time of each selected file keyed by identifier
+together with the modification time of each hash directory.  On update only the hash directories whose
+modification time has changed (or that contain a watched subdirectory without selected files whose
+modification time has changed) are listed again.  Files replaced in place without changing the content
+of their directory are not detected by an incremental update (use rebuild=True).
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "agent"
+__email__ = "agent@local"
+__license__ = "Apache 2.0"
+
+import logging
+import os
+import time
+
+from rcsb.utils.io.MarshalUtil import MarshalUtil
+from rcsb.utils.multiproc.MultiProcUtil import MultiProcUtil
+
+logger = logging.getLogger(__name__)
+
+
+def entryFileId(fileName):
+    """ Return the identifier for PDBx/mmCIF entry file names (e.g. 1abc.cif.gz or 1abc.cif) or None.
+    """
+    if (fileName.endswith(".cif.gz") and len(fileName) == 11) or (fileName.endswith(".cif") and len(fileName) == 8):
+        return fileName[:4].lower()
+    return None
+
+
+def validationReportFileId(fileName):
+    """ Return the identifier for validation report file names (e.g. 1abc_validation.xml.gz) or None.
+    """
+    if fileName.endswith("_validation.xml.gz") and len(fileName) > 18:
+        return fileName[:-18].lower()
+    return None
+
+
+class RepositoryManifest(object):
+    """ Persistent manifest of the files in a hashed repository directory tree.
+    """
+
+    __version = 1
+
+    def __init__(self, manifestPath, topRepoPath, fileIdFunc, numProc=8, verbose=False):
+        """ Persistent manifest of the files in a hashed repository directory tree.
+
+        Args:
+            manifestPath (str): path of the manifest file
+            topRepoPath (str): top path of the repository containing two-character hash directories
+            fileIdFunc (func): function returning the identifier for selected file names (None otherwise)
+            numProc (int, optional): number of processes used to list changed hash directories
+            verbose (bool, optional): verbose logging
+        """
+        self.__manifestPath = manifestPath
+        self.__topRepoPath = topRepoPath
+        self.__fileIdFunc = fileIdFunc
+        self.__numProc = numProc
+        self.__verbose = verbose
+        self.__mU = MarshalUtil()
+        self.__mD = None
+        self.__updateStats = {}
+
+    def update(self, rebuild=False):
+        """ Refresh the manifest listing only changed hash directories (or all hash directories for rebuild)
+            and save the result.
+
+        Returns:
+            bool: True for success or False otherwise
+        """
+        startTime = time.time()
+        try:
+            mD = None if rebuild else self.__load()
+            if not mD or mD.get("version") != self.__version or mD.get("topRepoPath") != self.__topRepoPath:
+                mD = {"version": self.__version, "topRepoPath": self.__topRepoPath, "dirD": {}}
+            dirD = mD["dirD"]
+            #
+            hashDirL = self.__getHashDirList()
+            staleL = [hc for hc in hashDirL if self.__isStale(hc, dirD.get(hc))]
+            removedL = [hc for hc in dirD if hc not in set(hashDirL)]
+            for hc in removedL:
+                del dirD[hc]
+            if staleL:
+                optD = {"topRepoPath": self.__topRepoPath, "fileIdFunc": self.__fileIdFunc}
+                mpu = MultiProcUtil(verbose=self.__verbose)
+                mpu.setOptions(optionsD=optD)
+                mpu.set(workerObj=self, workerMethod="_listDirWorker")
+                ok, failList, retLists, _ = mpu.runMulti(dataList=staleL, numProc=min(self.__numProc, len(staleL)), numResults=1)
+                for hc, dirRecD in retLists[0]:
+                    dirD[hc] = dirRecD
+                if not ok:
+                    logger.warning("Listing failed for %d hash directories in %s", len(failList), self.__topRepoPath)
+                    for hc in failList:
+                        dirD.pop(hc, None)
+            self.__mD = mD
+            self.__updateStats = {"hashDirs": len(hashDirL), "listed": len(staleL), "removed": len(removedL), "seconds": time.time() - startTime}
+            logger.info("Manifest %s hash directories %d listed %d removed %d (%.4f seconds)", self.__manifestPath, len(hashDirL), len(staleL), len(removedL), time.time() - startTime)
+            return self.__save(mD) if staleL or removedL or rebuild else True
+        except Exception as e:
+            logger.exception("Failing for %s with %s", self.__topRepoPath, str(e))
+        return False
+
+    def getFileD(self):
+        """ Return the dictionary of file records {identifier: {"locator": path, "size": bytes, "mtime": seconds}, ...}
+            from the current manifest (loading the saved manifest if the manifest has not been updated).
+        """
+        if self.__mD is None:
+            self.__mD = self.__load() or {"dirD": {}}
+        fD = {}
+        for hc in sorted(self.__mD["dirD"]):
+            for fId, (pth, size, mtime) in self.__mD["dirD"][hc]["files"].items():
+                fD[fId] = {"locator": pth, "size": size, "mtime": mtime}
+        return fD
+
+    def getUpdateStats(self):
+        """ Return the counts of hash directories and listed hash directories for the last update.
+        """
+        return self.__updateStats
+
+    def _listDirWorker(self, dataList, procName, optionsD, workingDir):
+        """ List the selected files in the input hash directories.
+        """
+        _ = procName
+        _ = workingDir
+        topRepoPath = optionsD["topRepoPath"]
+        fileIdFunc = optionsD["fileIdFunc"]
+        successList = []
+        retList = []
+        for hc in dataList:
+            try:
+                dirPath = os.path.join(topRepoPath, hc)
+                filesD = {}
+                pendingD = {}
+                dirMtime = os.stat(dirPath).st_mtime
+                self.__listDir(dirPath, fileIdFunc, filesD, pendingD, isTop=True)
+                retList.append((hc, {"mtime": dirMtime, "files": filesD, "pending": pendingD}))
+                successList.append(hc)
+            except Exception as e:
+                logger.error("Failing for %s with %s", hc, str(e))
+        return successList, retList, []
+
+    def __listDir(self, dirPath, fileIdFunc, filesD, pendingD, isTop=False):
+        """ Add selected files under dirPath to filesD.  Subdirectories without selected files are recorded
+            in pendingD with their modification times.
+        """
+        numFiles = 0
+        subDirL = []
+        with os.scandir(dirPath) as it:
+            for entry in it:
+                if entry.is_dir():
+                    if "REMOVE" not in entry.name:
+                        subDirL.append(entry.path)
+                    continue
+                fId = fileIdFunc(entry.name)
+                if fId:
+                    st = entry.stat()
+                    filesD[fId] = (entry.path, st.st_size, st.st_mtime)
+                    numFiles += 1
+        for subDirPath in subDirL:
+            numFiles += self.__listDir(subDirPath, fileIdFunc, filesD, pendingD)
+        if not numFiles and not isTop:
+            pendingD[dirPath] = os.stat(dirPath).st_mtime
+        return numFiles
+
+    def __getHashDirList(self):
+        if not self.__topRepoPath or not os.path.isdir(self.__topRepoPath):
+            logger.warning("Missing repository path %r", self.__topRepoPath)
+            return []
+        anS = set("abcdefghijklmnopqrstuvwxyz0123456789")
+        return sorted([fn for fn in os.listdir(self.__topRepoPath) if len(fn) == 2 and fn[0] in anS and fn[1] in anS])
+
+    def __isStale(self, hc, dirRecD):
+        if not dirRecD:
+            return True
+        try:
+            if os.stat(os.path.join(self.__topRepoPath, hc)).st_mtime != dirRecD["mtime"]:
+                return True
+            for pth, mtime in dirRecD["pending"].items():
+                if os.stat(pth).st_mtime != mtime:
+                    return True
+        except OSError:
+            return True
+        return False
+
+    def __load(self):
+        if not self.__manifestPath or not os.access(self.__manifestPath, os.R_OK):
+            return None
+        return self.__mU.doImport(self.__manifestPath, fmt="pickle", default=None)
+
+    def __save(self, mD):
+        """ Save the manifest (written to a temporary file and then renamed).
+        """
+        dirPath = os.path.dirname(self.__manifestPath)
+        if dirPath and not os.path.isdir(dirPath):
+            os.makedirs(dirPath)
+        tmpPath = "%s.%d.tmp" % (self.__manifestPath, os.getpid())
+        ok = self.__mU.doExport(tmpPath, mD, fmt="pickle")
+        if ok:
+            os.replace(tmpPath, self.__manifestPath)
+        return ok
@@ -19,6 +19,13 @@
 #   14-Mar-2019  jdw add VRPT_REPO_PATH_ENV as an override for the validation report repo path.
 #   27-Aug-2019  jdw filter missing validation reports
 #   16-Sep-2019  jdw consolidate chem_comp_core with bird_chem_comp_core
+#   18-Oct-2026  agent add optional persistent repository manifests refreshed incrementally (useManifest)
+#                      for entry path and entry locator lists with merged validation reports
+#   18-Oct-2026  agent add getEntryFileStateD() for change-driven incremental loads
+#   18-Oct-2026  agent test validation report existence for merged locators against repository manifest path sets
+#   18-Oct-2026  agent add optional binary cache of parsed containers (containerCachePath)
+#   18-Oct-2026  agent add optional read-ahead of input files (prefetchCount) and getLocatorPrefetcher()
+#   18-Oct-2026  agent return None from getLocatorPrefetcher() if read-ahead is not configured
 #
 #
 ##
@@ -35,6 +42,9 @@ import logging
 import os
 import time
 
+from rcsb.db.utils.ContainerCache import ContainerCache
+from rcsb.db.utils.FilePrefetcher import FilePrefetcher
+from rcsb.db.utils.RepositoryManifest import RepositoryManifest, entryFileId, validationReportFileId
 from rcsb.utils.io.HashableDict import HashableDict
 from rcsb.utils.io.MarshalUtil import MarshalUtil
 from rcsb.utils.multiproc.MultiProcUtil import MultiProcUtil
@@ -57,7 +67,35 @@ def toCifWrapper(xrt):
 
 
 class RepositoryProvider(object):
-    def __init__(self, cfgOb, cachePath=None, numProc=8, fileLimit=None, verbose=False):
+    def __init__(
+        self,
+        cfgOb,
+        cachePath=None,
+        numProc=8,
+        fileLimit=None,
+        verbose=False,
+        useManifest=False,
+        containerCachePath=None,
+        containerCacheSizeMB=None,
+        prefetchCount=0,
+        prefetchSizeMB=64,
+    ):
+        """ Utilites for scanning and accessing data in common repository file systems.
+
+        Args:
+            cfgOb (obj): configuration object
+            cachePath (str, optional): top cache path
+            numProc (int, optional): number of processes used in repository scans
+            fileLimit (int, optional): limit on the length of returned path lists
+            verbose (bool, optional): verbose logging
+            useManifest (bool, optional): obtain entry path and locator lists from persistent repository manifests
+                                          that are refreshed incrementally (see updateManifest())
+            containerCachePath (str, optional): directory path of a binary cache of parsed containers (see ContainerCache)
+            containerCacheSizeMB (float, optional): approximate limit on the size of the container cache (MB)
+            prefetchCount (int, optional): number of locators whose files are read ahead on a background thread
+                                           while containers are parsed (default: 0 no read-ahead)
+            prefetchSizeMB (float, optional): approximate limit on the size of the files read ahead (MB)
+        """
         self.__fileLimit = fileLimit
         self.__numProc = numProc
         self.__verbose = verbose
@@ -70,6 +108,16 @@ class RepositoryProvider(object):
         #
         self.__ccPathD = None
         #
+        self.__useManifest = useManifest
+        # repository manifests updated by this instance keyed by content type
+        self.__manifestD = {}
+        # sets of file paths in the repository manifests keyed by content type
+        self.__manifestLocatorD = {}
+        #
+        self.__containerCache = ContainerCache(containerCachePath, maxSizeMB=containerCacheSizeMB) if containerCachePath else None
+        self.__prefetchCount = prefetchCount
+        self.__prefetchSizeMB = prefetchSizeMB
+        #
         self.__mpFormat = "[%(levelname)s] %(asctime)s %(processName)s-%(module)s.%(funcName)s: %(message)s"
 
     def getLocatorObjList(self, contentType, inputPathList=None, mergeContentTypes=None):
@@ -125,7 +173,7 @@ class RepositoryProvider(object):
                     for mergeContentType in mergeContentTypes:
                         _, fn = os.path.split(locator)
                         idCode = fn[:4] if fn and len(fn) >= 8 else None
-                        mergeLocator = self.__getLocator(mergeContentType, idCode, checkExists=True) if idCode else None
+                        mergeLocator = self.__getMergeLocator(mergeContentType, idCode) if idCode else None
                         if mergeLocator:
                             # kwD = HashableDict({"marshalHelper": vrd.toCif})
                             kwD = HashableDict({"marshalHelper": toCifWrapper})
@@ -141,15 +189,40 @@ class RepositoryProvider(object):
         return locatorList
 
     def getContainerList(self, locatorObjList):
-        """ Return the data container list obtained by parsing the input locator object list.
+        """ Return the data container list obtained by parsing the input locator object list
+            (or from the container cache if configured).
         """
         cL = []
+        if self.__prefetchCount and len(locatorObjList) > 1:
+            locatorObjList = self.getLocatorPrefetcher(locatorObjList)
         for locatorObj in locatorObjList:
-            myContainerList = self.__mergeContainers(locatorObj, fmt="mmcif", mergeTarget=0)
+            if self.__containerCache:
+                myContainerList = self.__containerCache.getContainerList(locatorObj, self.__mergeContainers)
+            else:
+                myContainerList = self.__mergeContainers(locatorObj, fmt="mmcif", mergeTarget=0)
             for cA in myContainerList:
                 cL.append(cA)
         return cL
 
+    def getLocatorPrefetcher(self, locatorObjList):
+        """ Return an iterator over the input locator objects that reads the files of the following locators
+            on a background thread (or the cached container file if available) within the configured limits
+            (prefetchCount and prefetchSizeMB) or None if read-ahead is not configured (prefetchCount=0).
+            The iterator should be closed if iteration is not completed.
+        """
+        if not self.__prefetchCount:
+            return None
+        return FilePrefetcher(locatorObjList, self.__getPrefetchPaths, numAhead=self.__prefetchCount, maxSizeMB=self.__prefetchSizeMB)
+
+    def __getPrefetchPaths(self, locatorObj):
+        if self.__containerCache:
+            filePath = self.__containerCache.getCachedFilePath(locatorObj)
+            if filePath:
+                return [filePath]
+        if isinstance(locatorObj, str):
+            return [locatorObj]
+        return [dD["locator"] for dD in locatorObj]
+
     def __mergeContainers(self, locatorObj, fmt="mmcif", mergeTarget=0):
         """ Consolidate content in auxiliary files locatorObj[1:] into
             locatorObj[0] container index 'mergeTarget'.
@@ -280,6 +353,19 @@ class RepositoryProvider(object):
             pth = pth if self.__mU.exists(pth) else None
         return pth
 
+    def __getMergeLocator(self, contentType, idCode):
+        """ Return the repository path of merge content for the input entry identifier or None if the file is not present.
+
+            Validation report existence is tested against the set of report paths in the repository manifest when
+            manifests are used (useManifest) or the manifest has been updated by this instance.
+        """
+        if contentType not in ["vrpt"] or not (self.__useManifest or contentType in self.__manifestD):
+            return self.__getLocator(contentType, idCode, checkExists=True)
+        if contentType not in self.__manifestLocatorD:
+            self.__manifestLocatorD[contentType] = set([fD["locator"] for fD in self.__getManifestFileD(contentType).values()])
+        pth = self.__getLocator(contentType, idCode)
+        return pth if pth in self.__manifestLocatorD[contentType] else None
+
     def __getRepoTopPath(self, contentType):
         """ Convenience method to return repository top path from configuration data.
         """
@@ -376,7 +462,7 @@ class RepositoryProvider(object):
                         oL = [HashableDict({"locator": locator, "fmt": "mmcif", "kwargs": kwD})]
                         for mergeContentType in mergeContentTypes:
                             idCode = fn[:4] if fn and len(fn) >= 8 else None
-                            mergeLocator = self.__getLocator(mergeContentType, idCode, checkExists=True) if idCode else None
+                            mergeLocator = self.__getMergeLocator(mergeContentType, idCode) if idCode else None
                             if mergeLocator:
                                 kwD = HashableDict({"marshalHelper": toCifWrapper})
                                 oL.append(HashableDict({"locator": mergeLocator, "fmt": "xml", "kwargs": kwD}))
@@ -385,6 +471,8 @@ class RepositoryProvider(object):
         return dataList, locatorObjList, []
 
     def getEntryLocatorObjList(self, mergeContentTypes=None):
+        if self.__useManifest:
+            return self.__getEntryLocatorObjListFromManifest(mergeContentTypes=mergeContentTypes)
         return self.__getEntryLocatorObjList(self.__getRepoTopPath("pdbx"), numProc=self.__numProc, mergeContentTypes=mergeContentTypes)
 
     def __getEntryLocatorObjList(self, topRepoPath, numProc=8, mergeContentTypes=None):
@@ -437,8 +525,77 @@ class RepositoryProvider(object):
         return dataList, pathList, []
 
     def getEntryPathList(self):
+        if self.__useManifest:
+            return self.__applyFileLimit(sorted([fD["locator"] for fD in self.__getManifestFileD("pdbx").values()]))
         return self.__getEntryPathList(self.__getRepoTopPath("pdbx"), numProc=self.__numProc)
 
+    def updateManifest(self, contentType, rebuild=False):
+        """ Refresh the persistent manifest for the input repository content type (pdbx, pdbx_core or vrpt)
+            listing only the hash directories that have changed since the last update (all directories for rebuild).
+
+        Returns:
+            bool: True for success or False otherwise
+        """
+        try:
+            contentType = "pdbx" if contentType == "pdbx_core" else contentType
+            fileIdFunc = validationReportFileId if contentType == "vrpt" else entryFileId
+            manifestPath = os.path.join(self.__cachePath, "%s-repository-manifest.pic" % contentType)
+            rm = RepositoryManifest(manifestPath, self.__getRepoTopPath(contentType), fileIdFunc, numProc=self.__numProc, verbose=self.__verbose)
+            ok = rm.update(rebuild=rebuild)
+            if ok:
+                self.__manifestD[contentType] = rm
+                self.__manifestLocatorD.pop(contentType, None)
+            return ok
+        except Exception as e:
+            logger.exception("Failing for %s with %s", contentType, str(e))
+        return False
+
+    def getEntryManifest(self, mergeContentTypes=None):
+        """ Return the entry manifest {idCode: {"locator": path, "size": bytes, "mtime": seconds, "merge": {contentType: path}}, ...}
+            where merge partner paths are included for each of the input merge content types (e.g. vrpt).
+        """
+        rD = self.__getManifestFileD("pdbx")
+        mergeD = {mergeContentType: self.__getManifestFileD(mergeContentType) for mergeContentType in (mergeContentTypes if mergeContentTypes else [])}
+        for idCode, fD in rD.items():
+            fD["merge"] = {mergeContentType: mD[idCode]["locator"] for mergeContentType, mD in mergeD.items() if idCode in mD}
+        return rD
+
+    def getEntryFileStateD(self, mergeContentTypes=None):
+        """ Return the current repository file state of each entry from the repository manifests
+            {idCode: ((path, size, mtime), <merge content type state or None>, ...), ...} (see LoadWatermark).
+            Files replaced in place are only detected after a manifest rebuild (see RepositoryManifest).
+        """
+        mergeContentTypes = mergeContentTypes if mergeContentTypes else []
+        fileDL = [self.__getManifestFileD("pdbx")] + [self.__getManifestFileD(mergeContentType) for mergeContentType in mergeContentTypes]
+        stateD = {}
+        for idCode in fileDL[0]:
+            stateD[idCode] = tuple([(fD[idCode]["locator"], fD[idCode]["size"], fD[idCode]["mtime"]) if idCode in fD else None for fD in fileDL])
+        return stateD
+
+    def __getManifestFileD(self, contentType):
+        """ Return the file records of the manifest for the input content type (updated once by this instance).
+        """
+        if contentType not in self.__manifestD and not self.updateManifest(contentType):
+            logger.error("Manifest update failing for %s", contentType)
+            return {}
+        return self.__manifestD[contentType].getFileD()
+
+    def __getEntryLocatorObjListFromManifest(self, mergeContentTypes=None):
+        """ Return the list of entry locator objects including merge content using the repository manifests.
+        """
+        locatorObjList = []
+        try:
+            mergeContentTypes = mergeContentTypes if mergeContentTypes else []
+            for _, fD in sorted(self.getEntryManifest(mergeContentTypes=mergeContentTypes).items(), key=lambda x: x[1]["locator"]):
+                oL = [HashableDict({"locator": fD["locator"], "fmt": "mmcif", "kwargs": HashableDict({})})]
+                for mergeContentType in mergeContentTypes:
+                    if mergeContentType in fD["merge"]:
+                        oL.append(HashableDict({"locator": fD["merge"][mergeContentType], "fmt": "xml", "kwargs": HashableDict({"marshalHelper": toCifWrapper})}))
+                locatorObjList.append(tuple(oL))
+        except Exception as e:
+            logger.exception("Failing with %s", str(e))
+        return self.__applyFileLimit(locatorObjList)
+
     def __getEntryPathList(self, topRepoPath, numProc=8):
         """Get the path list for structure entries in the input repository
         """
@@ -12,6 +12,7 @@
 # 16-Jun-2018 jdw update data type prototype.
 # 18-Jun-2018 jdw move mocking to configuration level
 # 28-Jun-2018 jdw remove IoUtil() and add working path constructor argument
+# 18-Oct-2026 agent add optional binary cache of parsed containers
 ##
 """
 Tools for for scanning repositories and collecting coverage and type data information.
@@ -45,7 +46,7 @@ class ScanRepoUtil(object):
     """Tools for for scanning repositories and collecting coverage and type data information.
     """
 
-    def __init__(self, cfgOb, attributeDataTypeD=None, numProc=4, chunkSize=15, fileLimit=None, maxStepLength=2000, workPath=None):
+    def __init__(self, cfgOb, attributeDataTypeD=None, numProc=4, chunkSize=15, fileLimit=None, maxStepLength=2000, workPath=None, containerCachePath=None, containerCacheSizeMB=None):
         """
         Args:
             cfgOb (object): Configuration object (ConfigUtil)
@@ -58,6 +59,8 @@ class ScanRepoUtil(object):
             fileLimit (int, optional): maximum file scanned or None for no limit
             mockTopPath (str, optional): Path to directory containing mock repositories or None
             maxStepLength (int, optional): maximum number of multi-proc runs to perform
+            containerCachePath (str, optional): directory path of a binary cache of parsed containers (default: no cache)
+            containerCacheSizeMB (float, optional): approximate limit on the size of the container cache (MB)
         """
         #
         self.__attributeDataTypeD = attributeDataTypeD if attributeDataTypeD else {}
@@ -75,7 +78,14 @@ class ScanRepoUtil(object):
 
         self.__workPath = workPath
         self.__mU = MarshalUtil(workPath=self.__workPath)
-        self.__rpP = RepositoryProvider(self.__cfgOb, numProc=self.__numProc, fileLimit=self.__fileLimit, cachePath=self.__workPath)
+        self.__rpP = RepositoryProvider(
+            self.__cfgOb,
+            numProc=self.__numProc,
+            fileLimit=self.__fileLimit,
+            cachePath=self.__workPath,
+            containerCachePath=containerCachePath,
+            containerCacheSizeMB=containerCacheSizeMB,
+        )
 
     def scanContentType(self, contentType, mergeContentTypes=None, scanType="full", inputPathList=None, scanDataFilePath=None, failedFilePath=None, saveInputFileListPath=None):
         """Driver method for repository scan operation
@@ -4,6 +4,8 @@
 #
 # Collection of text utilities -
 #
+# Updates:
+#   18-Oct-2026 agent return strings without character references unchanged in unescapeXmlCharRef()
 ##
 
 try:
@@ -18,9 +20,11 @@ except ImportError:
 
 def unescapeXmlCharRef(iStr):
     """
-    Convert html character entities into unicode.
+    Convert html character entities into unicode (strings without an '&' are returned unchanged).
     """
     try:
+        if "&" not in iStr:
+            return iStr
         return unescape(iStr)
     except Exception:
         return iStr
@@ -0,0 +1,107 @@
+##
+# File:    WriterPipeline.py
+# Author:  agent
+# Date:    18-Oct-2026
+# Version: 0.001
+#
+# Updates:
+#
+##
+"""
+Bounded producer/consumer pipeline handing work (e.g. document lists) to background writer threads.
+
+Work items are submitted to named streams.  Each stream is served in submission order by its own
+writer thread.  When a byte budget is set, submit() blocks while the total size of the queued (not yet
+written) items would exceed the budget so that document generation cannot run arbitrarily far ahead
+of the database writes.
+
+"""
+
+__docformat__ = "restructuredtext en"
+__author__ = "agent"
+__email__ = "agent@local"
+__license__ = "Apache 2.0"
+
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+
+logger = logging.getLogger(__name__)
+
+
+class WriterPipeline(object):
+    def __init__(self, writerFunc, streamNames=None, maxQueueMB=None):
+        """Bounded producer/consumer pipeline with a background writer thread for each stream.
+
+        Args:
+            writerFunc (func): method called on the writer thread as writerFunc(*args, **kwargs) for each submitted item
+            streamNames (list, optional): names of the independent writer streams (default: a single stream)
+            maxQueueMB (float, optional): limit on the total size (MB) of queued items (default: no limit)
+        """
+        self.__writerFunc = writerFunc
+        self.__streamNames = streamNames if streamNames else ["default"]
+        self.__maxQueueBytes = int(float(maxQueueMB) * 1000000.0) if maxQueueMB else None
+        self.__queuedBytes = 0
+        self.__cond = threading.Condition()
+        self.__queueD = {}
+        self.__threadL = []
+        for streamName in self.__streamNames:
+            self.__queueD[streamName] = queue.Queue()
+            th = threading.Thread(target=self.__run, args=(self.__queueD[streamName],), name="writer-%s" % streamName)
+            th.daemon = True
+            th.start()
+            self.__threadL.append(th)
+
+    def getStreamNames(self):
+        return self.__streamNames
+
+    def getQueuedBytes(self):
+        with self.__cond:
+            return self.__queuedBytes
+
+    def submit(self, streamName, numBytes, *args, **kwargs):
+        """Queue an item for the input stream, blocking while the queued byte budget is exhausted.
+
+        Args:
+            streamName (str): stream name (unknown names are assigned to the first stream)
+            numBytes (int): size of the item counted against the queued byte budget
+            *args, **kwargs: arguments passed to the writer function
+
+        Returns:
+            (object): concurrent.futures.Future() instance holding the return value of the writer function
+        """
+        fut = Future()
+        numBytes = numBytes if self.__maxQueueBytes else 0
+        with self.__cond:
+            # an item larger than the budget is admitted when the queue is empty
+            while self.__queuedBytes > 0 and self.__queuedBytes + numBytes > self.__maxQueueBytes:
+                self.__cond.wait()
+            self.__queuedBytes += numBytes
+        qu = self.__queueD[streamName] if streamName in self.__queueD else self.__queueD[self.__streamNames[0]]
+        qu.put((fut, numBytes, args, kwargs))
+        return fut
+
+    def close(self):
+        """Wait for all queued items to be written and stop the writer threads."""
+        for qu in self.__queueD.values():
+            qu.put(None)
+        for th in self.__threadL:
+            th.join()
+        self.__threadL = []
+
+    def __run(self, qu):
+        while True:
+            item = qu.get()
+            if item is None:
+                break
+            fut, numBytes, args, kwargs = item
+            try:
+                fut.set_result(self.__writerFunc(*args, **kwargs))
+            except Exception as e:
+                logger.exception("Failing with %s", str(e))
+                fut.set_exception(e)
+            finally:
+                with self.__cond:
+                    self.__queuedBytes -= numBytes
+                    self.__cond.notify_all()
@@ -5,7 +5,10 @@
 #  Workflow wrapper  --  repository database loading utilities --
 #
 #  Updates:
-#
+#   18-Oct-2026 agent add overflowDocumentSize option
+#   18-Oct-2026 agent add metricsFilePath and metricsFormat options
+#   18-Oct-2026 agent add concurrentCollections option
+#   18-Oct-2026 agent add pipelineQueueSizeMB and pipelineBatchSize options
 ##
 __docformat__ = "restructuredtext en"
 __author__ = "John Westbrook"
@@ -68,6 +71,12 @@ class RepoLoadWorkflow(object):
             loadType = kwargs.get("loadType", "full")  # or replace
             updateSchemaOnReplace = kwargs.get("updateSchemaOnReplace", True)
             pruneDocumentSize = float(kwargs.get("pruneDocumentSize")) if "pruneDocumentSize" in kwargs else None
+            overflowDocumentSize = float(kwargs.get("overflowDocumentSize")) if "overflowDocumentSize" in kwargs else None
+            metricsFilePath = kwargs.get("metricsFilePath", None)
+            metricsFormat = kwargs.get("metricsFormat", "json")
+            concurrentCollections = kwargs.get("concurrentCollections", False)
+            pipelineQueueSizeMB = float(kwargs.get("pipelineQueueSizeMB")) if "pipelineQueueSizeMB" in kwargs else None
+            pipelineBatchSize = int(kwargs.get("pipelineBatchSize", 2))
 
             # "Document organization (rowwise_by_name_with_cardinality|rowwise_by_name|columnwise_by_name|rowwise_by_id|rowwise_no_name",
             documentStyle = kwargs.get("documentStyle", "rowwise_by_name_with_cardinality")
@@ -123,6 +132,12 @@ class RepoLoadWorkflow(object):
                     failedFilePath=failedFilePath,
                     saveInputFileListPath=saveInputFileListPath,
                     pruneDocumentSize=pruneDocumentSize,
+                    overflowDocumentSize=overflowDocumentSize,
+                    metricsFilePath=metricsFilePath,
+                    metricsFormat=metricsFormat,
+                    concurrentCollections=concurrentCollections,
+                    pipelineQueueSizeMB=pipelineQueueSizeMB,
+                    pipelineBatchSize=pipelineBatchSize,
                     validationLevel=schemaLevel,
                     mergeContentTypes=["vrpt"] if mergeValidationReports else None,
                     updateSchemaOnReplace=updateSchemaOnReplace,